@@ -0,0 +1,81 @@
+"""Benchmark: JSONL vs SQLite bronze backends — append, cold full load, and a cold league partition read.
+
+Usage: python benchmarks/bench_bronze_backends.py [--leagues 200 2000] [--rosters 12] [--batch 12]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from analytics_foundry.bronze import store as bronze_store
+
+
+def make_rosters(leagues: int, rosters: int, seed: int = 0):
+    """Sleeper-shaped bronze roster rows: `rosters` per league, 15 player ids each."""
+    rng = random.Random(seed)
+    return [
+        {
+            "league_id": str(10**17 + lg),
+            "roster_id": r,
+            "owner_id": str(rng.randint(1, 10**9)),
+            "players": [str(rng.randint(1, 10_000)) for _ in range(15)],
+            "settings": {"wins": rng.randint(0, 14), "losses": rng.randint(0, 14)},
+        }
+        for lg in range(leagues)
+        for r in range(1, rosters + 1)
+    ]
+
+
+def _cold() -> None:
+    # Drop the in-memory tables only (as after a restart); persisted data stays.
+    bronze_store._RAW.clear()
+
+
+def run(backend: str, rows, batch: int, league_id: str):
+    os.environ["FOUNDRY_BRONZE_BACKEND"] = backend
+    with tempfile.TemporaryDirectory() as tmp:
+        bronze_store.set_data_root(tmp)
+        try:
+            t0 = time.perf_counter()
+            for i in range(0, len(rows), batch):
+                bronze_store.append_raw("nfl_sleeper", "rosters", rows[i:i + batch])
+            t_append = time.perf_counter() - t0
+
+            _cold()
+            t0 = time.perf_counter()
+            n_all = len(bronze_store.get_raw("nfl_sleeper", "rosters"))
+            t_load = time.perf_counter() - t0
+
+            _cold()
+            t0 = time.perf_counter()
+            n_part = len(bronze_store.get_where("nfl_sleeper", "rosters", "league_id", league_id))
+            t_part = time.perf_counter() - t0
+            assert n_all == len(rows)
+            bronze_store.clear()
+        finally:
+            bronze_store.set_data_root(None)
+    return t_append, t_load, t_part, n_part
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--leagues", type=int, nargs="+", default=[200, 2000])
+    parser.add_argument("--rosters", type=int, default=12, help="rosters per league")
+    parser.add_argument("--batch", type=int, default=12, help="records per append (one league ingest)")
+    args = parser.parse_args()
+    print(f"{'rows':>8} {'backend':>8} {'append_s':>9} {'load_s':>8} {'partition_ms':>13}")
+    for leagues in args.leagues:
+        rows = make_rosters(leagues, args.rosters)
+        league_id = rows[len(rows) // 2]["league_id"]
+        parts = set()
+        for backend in ("jsonl", "sqlite"):
+            t_append, t_load, t_part, n_part = run(backend, rows, args.batch, league_id)
+            parts.add(n_part)
+            print(f"{len(rows):>8} {backend:>8} {t_append:>9.3f} {t_load:>8.3f} {t_part * 1000:>13.2f}")
+        assert len(parts) == 1, "backends disagree on the partition read"
+
+
+if __name__ == "__main__":
+    main()
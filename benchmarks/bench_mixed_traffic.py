@@ -0,0 +1,92 @@
+"""Load test: tail latency of cache-hit requests while other requests wait on slow upstream league fetches.
+
+Runs the app in-process (httpx ASGI transport) with a Sleeper adapter whose fetches sleep --upstream-ms.
+Hot clients poll a few fresh leagues (cache hits); cold clients request new leagues (a slow fetch each).
+
+Usage: python benchmarks/bench_mixed_traffic.py [--hot 32] [--cold 16] [--requests 50] [--upstream-ms 500]
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+
+HOT_LEAGUES = ("H0", "H1", "H2", "H3")
+
+
+def make_adapter(upstream_s: float, players: int) -> NFLSleeperAdapter:
+    def slow(value):
+        def fetch(*_):
+            time.sleep(upstream_s)
+            return value
+
+        return fetch
+
+    roster = [{"roster_id": 1, "players": [f"p{i}" for i in range(15)]}]
+    return NFLSleeperAdapter(
+        fetch_players=lambda: {f"p{i}": {"full_name": f"P{i}", "position": "WR"} for i in range(players)},
+        fetch_league=slow({"name": "League"}),
+        fetch_rosters=slow(roster),
+        fetch_matchups=slow([]),
+    )
+
+
+def pct(samples, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def client_loop(client, league_of, n: int, out: list) -> None:
+    for i in range(n):
+        t0 = time.perf_counter()
+        resp = await client.get("/players/available", params={"league_id": league_of(i), "limit": 50})
+        resp.raise_for_status()
+        out.append(time.perf_counter() - t0)
+
+
+async def run(args) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for lid in HOT_LEAGUES:  # warm: fetched once, then fresh and cached
+            await client.get("/players/available", params={"league_id": lid, "limit": 50})
+        hot, cold = [], []
+        t0 = time.perf_counter()
+        await asyncio.gather(
+            *(client_loop(client, lambda i, c=c: HOT_LEAGUES[(c + i) % len(HOT_LEAGUES)], args.requests, hot)
+              for c in range(args.hot)),
+            *(client_loop(client, lambda i, c=c: f"C{c}-{i}", max(1, args.requests // 10), cold)
+              for c in range(args.cold)),
+        )
+        wall = time.perf_counter() - t0
+    print(f"{'class':>6} {'requests':>9} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'max_ms':>8}")
+    for name, samples in (("hot", hot), ("cold", cold)):
+        print(
+            f"{name:>6} {len(samples):>9} {pct(samples, 0.5):>8.1f} {pct(samples, 0.95):>8.1f} "
+            f"{pct(samples, 0.99):>8.1f} {max(samples) * 1000:>8.1f}"
+        )
+    print(f"wall {wall:.2f}s, {(len(hot) + len(cold)) / wall:.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hot", type=int, default=32, help="concurrent clients polling fresh leagues")
+    parser.add_argument("--cold", type=int, default=16, help="concurrent clients requesting new leagues")
+    parser.add_argument("--requests", type=int, default=50, help="requests per hot client (cold: a tenth)")
+    parser.add_argument("--upstream-ms", type=float, default=500, help="latency of each upstream fetch")
+    parser.add_argument("--players", type=int, default=5000)
+    args = parser.parse_args()
+    bronze_store.clear()
+    adapter = make_adapter(args.upstream_ms / 1000, args.players)
+    adapter.ingest_to_bronze()
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=adapter):
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
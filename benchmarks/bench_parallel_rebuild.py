@@ -0,0 +1,40 @@
+"""Benchmark: serial vs process-pool silver player rebuild (pool started before timing, as it persists across rebuilds).
+
+Usage: python benchmarks/bench_parallel_rebuild.py [--rows 1000000] [--workers 2 4]
+"""
+
+import argparse
+import os
+import time
+
+from bench_silver_transforms import make_raw
+
+from analytics_foundry.silver.parallel import transform_parallel
+from analytics_foundry.silver.players import _players_columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--dup", type=int, default=2)
+    args = parser.parse_args()
+    print(f"cpus={os.cpu_count()}")
+    print(f"{'rows':>10} {'workers':>8} {'seconds':>8} {'speedup':>8}")
+    for n in args.rows:
+        raw = make_raw(n, args.dup)
+        t0 = time.perf_counter()
+        expected = _players_columns(raw)
+        serial = time.perf_counter() - t0
+        print(f"{n:>10} {1:>8} {serial:>8.3f} {1:>7.2f}x")
+        for w in args.workers:
+            transform_parallel(raw[: w * 2], _players_columns, ("player_id",), w, min_rows=0)
+            t0 = time.perf_counter()
+            got = transform_parallel(raw, _players_columns, ("player_id",), w)
+            elapsed = time.perf_counter() - t0
+            assert got == expected, "parallel output differs from serial output"
+            print(f"{n:>10} {w:>8} {elapsed:>8.3f} {serial / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark: resident memory per silver player, list of dicts vs compact PlayerTable.
+
+Usage: python benchmarks/bench_player_memory.py [--players 10000 100000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from bench_silver_transforms import make_raw
+
+from analytics_foundry.silver.columnar import rows_from_columns
+from analytics_foundry.silver.players import SILVER_PLAYER_KEYS, PlayerTable, _players_columns
+
+
+def _retained_bytes(build, raw) -> int:
+    """Bytes allocated by build(raw) and still alive afterwards (raw itself is allocated before tracing)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(raw)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    print(f"{'players':>10} {'dicts_B/player':>15} {'table_B/player':>15} {'ratio':>6}")
+    for n in args.players:
+        # Round-trip through JSON so strings are distinct objects, as after loading bronze from disk.
+        raw = json.loads(json.dumps(make_raw(n, 1)))
+        dicts = _retained_bytes(lambda r: rows_from_columns(_players_columns(r), SILVER_PLAYER_KEYS), raw)
+        table = _retained_bytes(lambda r: PlayerTable(_players_columns(r)), raw)
+        print(f"{n:>10} {dicts / n:>15.1f} {table / n:>15.1f} {dicts / table:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: per-record vs columnar batch silver player transform.
+
+per_record builds the old silver output (one dict per player); batch builds the columns PlayerTable is made
+from, and speedup compares those two, so it applies to table consumers (silver and gold read columns).
+batch+dicts_s additionally materializes dicts from the columns, as silver.players.get_players does: building
+the dicts dominates, so at low duplication that path is slower than per_record.
+
+Usage: python benchmarks/bench_silver_transforms.py [--rows 100000 1000000] [--dup 2]
+"""
+
+import argparse
+import random
+import time
+
+from analytics_foundry.silver.columnar import rows_from_columns
+from analytics_foundry.silver.players import SILVER_PLAYER_KEYS, _players_columns, _to_silver_player
+
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+TEAMS = ("KC", "BUF", "SF", "DAL", "PHI", "MIA", "DET", "BAL")
+INJURY = ("", "", "", "", "Questionable", "Out", "IR")
+
+
+def make_raw(rows: int, dup: int, seed: int = 0):
+    """Sleeper-shaped bronze player rows; each player appears `dup` times (repeated broad ingests)."""
+    rng = random.Random(seed)
+    unique = max(1, rows // dup)
+    out = []
+    for i in range(rows):
+        pid = str(i % unique)
+        out.append({
+            "player_id": pid,
+            "display_name": f"Player {pid}",
+            "position": rng.choice(POSITIONS),
+            "team": rng.choice(TEAMS),
+            "status": "Active",
+            "injury_status": rng.choice(INJURY),
+            "age": str(rng.randint(21, 38)) if i % 3 else rng.randint(21, 38),
+            "trending": rng.random() * 10 if i % 5 else None,
+        })
+    return out
+
+
+def per_record(raw):
+    by_id = {}
+    for rec in raw:
+        silver = _to_silver_player(rec)
+        if not silver:
+            continue
+        by_id[silver["player_id"]] = silver
+    return list(by_id.values())
+
+
+def batch(raw):
+    return _players_columns(raw)
+
+
+def batch_dicts(raw):
+    return rows_from_columns(_players_columns(raw), SILVER_PLAYER_KEYS)
+
+
+def _best_of(fn, raw, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(raw)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--dup", type=int, default=2, help="bronze rows per unique player")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{'rows':>10} {'per_record_s':>13} {'batch_s':>9} {'speedup':>8} {'batch+dicts_s':>14}")
+    for n in args.rows:
+        raw = make_raw(n, args.dup)
+        t_rec, expected = _best_of(per_record, raw, args.repeat)
+        t_batch, got = _best_of(batch, raw, args.repeat)
+        t_dicts, _ = _best_of(batch_dicts, raw, args.repeat)
+        assert rows_from_columns(got, SILVER_PLAYER_KEYS) == expected, "batch output differs from per-record output"
+        print(f"{n:>10} {t_rec:>13.3f} {t_batch:>9.3f} {t_rec / t_batch:>7.2f}x {t_dicts:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
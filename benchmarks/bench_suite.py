@@ -0,0 +1,380 @@
+"""Benchmark suite: bronze load, silver rebuilds, gold queries and API requests over generated Sleeper data.
+
+Generates a deterministic workload (generators.py) at a named scale, loads it through the Sleeper adapter and
+times each benchmark (best/median/mean of --repeat runs, untimed setup before each run). API benchmarks go
+through the FastAPI app in-process (httpx ASGI transport). Results are written as JSON with the git commit,
+Python and platform; `compare` prints per-benchmark ratios between two result files and exits 1 when any
+benchmark got slower than --threshold.
+
+Usage:
+  python benchmarks/bench_suite.py run [--scale small|medium|large] [--players N] [--leagues N]
+                                       [--only silver. api.] [--repeat 5] [--out results.json]
+  python benchmarks/bench_suite.py compare base.json head.json [--threshold 0.10] [--stat median]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+import httpx
+
+from generators import SCALES, Workload
+
+from analytics_foundry import dag
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_bronze_backend
+from analytics_foundry.gold import availability as gold_availability
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import injury as gold_injury
+from analytics_foundry.gold import league as gold_league
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.gold import recommendations as gold_recommendations
+from analytics_foundry.silver import injuries as silver_injuries
+
+RESULTS_VERSION = 1
+NFL_SLEEPER = "nfl_sleeper"
+
+
+class Bench:
+    """A named benchmark: setup() untimed before each timed run(); items = units of work per run.
+
+    Benchmarks without setup measure the warm path: one untimed run first builds whatever they read lazily.
+    """
+
+    def __init__(self, name: str, run: Callable[[], Any], setup: Optional[Callable[[], Any]] = None, items: int = 1):
+        self.name = name
+        self.layer = name.split(".", 1)[0]
+        self.run = run
+        self.setup = setup
+        self.items = items
+
+    def measure(self, repeat: int) -> Dict[str, Any]:
+        times = []
+        if self.setup is None:
+            self.run()
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+            t0 = time.perf_counter()
+            self.run()
+            times.append(time.perf_counter() - t0)
+        median = statistics.median(times)
+        return {
+            "name": self.name,
+            "layer": self.layer,
+            "repeat": repeat,
+            "items": self.items,
+            "min_s": min(times),
+            "median_s": median,
+            "mean_s": statistics.fmean(times),
+            "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "items_per_s": self.items / median if median > 0 else None,
+        }
+
+
+class Suite:
+    """The workload loaded into bronze plus one in-process API client; benchmarks() lists every Bench."""
+
+    def __init__(self, workload: Workload):
+        self.w = workload
+        self.adapter = workload.adapter()
+        self.league = workload.league_ids[len(workload.league_ids) // 2]
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=600)
+
+    def close(self) -> None:
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+    # --- loading
+
+    def clear(self) -> None:
+        bronze_store.clear()
+        gold_cache.clear()
+        for lid in self.w.league_ids:
+            gold_league.mark_stale(lid)
+
+    def ingest_players(self) -> None:
+        self.adapter.ingest_to_bronze()
+
+    def ingest_leagues(self) -> None:
+        for lid in self.w.league_ids:
+            gold_league.mark_stale(lid)
+        gold_league.ensure_leagues_ingested(self.w.league_ids)
+
+    def load(self) -> None:
+        self.clear()
+        self.ingest_players()
+        self.ingest_leagues()
+
+    def warm(self) -> None:
+        """Build every dataset the benchmarks read (cheap when already built), so a cold benchmark times only
+        the datasets it dirties, whatever ran before it."""
+        for name in ("silver.players", "silver.rosters", "silver.matchups", "silver.leagues"):
+            dag.get(name)
+        silver_injuries.get_injuries()
+        gold_availability.precompute()
+        gold_players.query_available_players(league_id=self.league, sort="-age", limit=1)
+        gold_recommendations.query_waiver_recommendations(league_id=self.league, limit=1)
+        gold_injury.get_injury_report()
+
+    def cold(self, *datasets: str) -> Callable[[], None]:
+        """Setup: warm, then dirty datasets (and everything downstream) and drop cached responses."""
+
+        def setup() -> None:
+            self.warm()
+            for name in datasets:
+                dag.invalidate(name)
+            gold_cache.clear()
+
+        return setup
+
+    def get(self, path: str, **params: Any) -> Callable[[], None]:
+        def run() -> None:
+            resp = self.loop.run_until_complete(self.client.get(path, params=params))
+            resp.raise_for_status()
+
+        return run
+
+    def post(self, path: str, body: Dict[str, Any]) -> Callable[[], None]:
+        def run() -> None:
+            resp = self.loop.run_until_complete(self.client.post(path, json=body))
+            resp.raise_for_status()
+
+        return run
+
+    # --- benchmarks
+
+    def benchmarks(self) -> List[Bench]:
+        w, lid = self.w, self.league
+        n_players, n_leagues = len(w.players), len(w.league_ids)
+        batch = w.league_ids[:50]
+
+        def clear_then_players() -> None:
+            self.clear()
+            self.ingest_players()
+
+        def reset_injuries() -> None:
+            # Drops the incremental injury index (and dirties silver.players, rebuilt here untimed).
+            self.warm()
+            dag.reset_bronze(NFL_SLEEPER, "players")
+            dag.get("silver.players")
+
+        def all_league_partitions() -> None:
+            dag.get_many("silver.rosters", w.league_ids)
+
+        return [
+            Bench("bronze.append_players", self.ingest_players, self.clear, n_players),
+            Bench("bronze.ingest_leagues", self.ingest_leagues, clear_then_players, n_leagues),
+            Bench("bronze.read_league_partition", lambda: bronze_store.get_where(NFL_SLEEPER, "rosters", "league_id", lid)),
+            # Reload bronze (the loaders above leave it partial) before the layers that read it.
+            Bench("setup.load", lambda: None, self.load),
+            Bench("silver.players_rebuild", lambda: dag.get("silver.players"), self.cold("silver.players"), n_players),
+            Bench("silver.injuries_index", silver_injuries.get_injuries, reset_injuries, n_players),
+            Bench("silver.rosters_all_leagues", lambda: dag.get("silver.rosters"), self.cold("silver.rosters"), n_leagues),
+            Bench("silver.rosters_league_partitions", all_league_partitions, self.cold("silver.rosters"), n_leagues),
+            Bench("silver.matchups_rebuild", lambda: dag.get("silver.matchups"), self.cold("silver.matchups"), n_leagues),
+            Bench("silver.leagues_rebuild", lambda: dag.get("silver.leagues"), self.cold("silver.leagues"), n_leagues),
+            Bench(
+                "gold.availability_precompute_all", gold_availability.precompute,
+                self.cold("gold.rostered_bitmap"), n_leagues,
+            ),
+            Bench("gold.available_bitmap_league", lambda: gold_availability.get_available_bitmap(lid), self.cold("gold.rostered_bitmap")),
+            Bench("gold.available_players_page", lambda: gold_players.query_available_players(league_id=lid, limit=50)),
+            Bench(
+                "gold.available_players_filtered_sorted",
+                lambda: gold_players.query_available_players(league_id=lid, position=["WR", "RB"], sort="-trending", limit=50),
+            ),
+            Bench(
+                "gold.available_players_all", lambda: gold_players.query_available_players(league_id=lid),
+                self.cold("gold.available_players"),
+            ),
+            Bench(
+                "gold.waiver_recommendations", lambda: gold_recommendations.query_waiver_recommendations(league_id=lid, limit=20),
+                self.cold("gold.waiver_recommendations"),
+            ),
+            Bench("gold.injury_report", gold_injury.get_injury_report, self.cold("gold.injury")),
+            Bench("api.players_available_hot", self.get("/players/available", league_id=lid, limit=50)),
+            Bench("api.players_available_cold", self.get("/players/available", league_id=lid, limit=50), self.cold()),
+            Bench(
+                "api.players_available_rebuild", self.get("/players/available", league_id=lid, limit=50),
+                self.cold("silver.players"),
+            ),
+            Bench(
+                "api.players_available_filtered", self.get("/players/available", league_id=lid, position="WR,TE", sort="-age", limit=100),
+                self.cold(),
+            ),
+            Bench(
+                "api.players_available_batch", self.post("/players/available/batch", {"league_ids": batch, "limit": 50}),
+                self.cold("gold.rostered_bitmap"), len(batch),
+            ),
+            Bench("api.recommendations_waiver_cold", self.get("/recommendations/waiver", league_id=lid), self.cold()),
+            Bench("api.injury_cold", self.get("/injury", league_id=lid), self.cold()),
+            Bench("api.league_sweep", self._sweep(batch), self.cold("gold.rostered_bitmap"), len(batch)),
+        ]
+
+    def _sweep(self, league_ids: List[str]) -> Callable[[], None]:
+        """One cold /players/available per league, sequentially (per-league request cost at scale)."""
+
+        async def sweep() -> None:
+            for lid in league_ids:
+                resp = await self.client.get("/players/available", params={"league_id": lid, "limit": 50})
+                resp.raise_for_status()
+
+        return lambda: self.loop.run_until_complete(sweep())
+
+
+def _git_commit() -> Dict[str, Any]:
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--", "src"], cwd=root, capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def _max_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_suite(
+    players: int, leagues: int, repeat: int, only: Optional[List[str]] = None, seed: int = 0, scale: Optional[str] = None,
+    data_dir: Optional[str] = None, echo: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """Generate and load the workload, run the selected benchmarks (name prefixes in only) and return results.
+
+    Bronze stays in memory unless data_dir is given (then appends persist there, with the configured backend).
+    """
+    saved_dir = os.environ.get("FOUNDRY_DATA_DIR")
+    os.environ["FOUNDRY_DATA_DIR"] = data_dir or ""
+    try:
+        return _run_suite(players, leagues, repeat, only, seed, scale, data_dir, echo)
+    finally:
+        if saved_dir is None:
+            os.environ.pop("FOUNDRY_DATA_DIR", None)
+        else:
+            os.environ["FOUNDRY_DATA_DIR"] = saved_dir
+
+
+def _run_suite(
+    players: int, leagues: int, repeat: int, only: Optional[List[str]], seed: int, scale: Optional[str],
+    data_dir: Optional[str], echo: Callable[[str], None],
+) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    workload = Workload(players, leagues, seed)
+    echo(f"generated {workload.describe()} in {time.perf_counter() - t0:.1f}s")
+    suite = Suite(workload)
+    results = []
+    try:
+        with patch("analytics_foundry.gold.league.get_adapter", return_value=suite.adapter):
+            suite.load()
+            echo(f"{'benchmark':<42} {'median_ms':>11} {'min_ms':>10} {'items/s':>12}")
+            for bench in suite.benchmarks():
+                if bench.layer == "setup":
+                    bench.setup()
+                    continue
+                if only and not any(bench.name.startswith(prefix) for prefix in only):
+                    continue
+                result = bench.measure(repeat)
+                results.append(result)
+                rate = result["items_per_s"]
+                echo(
+                    f"{bench.name:<42} {result['median_s'] * 1000:>11.2f} {result['min_s'] * 1000:>10.2f} "
+                    f"{rate if rate is None else f'{rate:,.0f}':>12}"
+                )
+    finally:
+        suite.close()
+        suite.clear()
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": time.time(),
+        "git": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": {"name": scale, **workload.describe()},
+        "bronze": {"persisted": bool(data_dir), "backend": get_bronze_backend()},
+        "max_rss_mb": _max_rss_mb(),
+        "results": results,
+    }
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float, stat: str = "median_s") -> List[Dict[str, Any]]:
+    """Return per-benchmark {name, base, head, ratio, status} for benchmarks in both; status is "slower" when
+    head/base - 1 exceeds threshold, "faster" when base/head - 1 does, else "same"."""
+    base_by_name = {r["name"]: r for r in base["results"]}
+    rows = []
+    for r in head["results"]:
+        b = base_by_name.get(r["name"])
+        if b is None or not b[stat]:
+            continue
+        ratio = r[stat] / b[stat]
+        status = "slower" if ratio - 1 > threshold else "faster" if 1 / ratio - 1 > threshold else "same"
+        rows.append({"name": r["name"], "base": b[stat], "head": r[stat], "ratio": ratio, "status": status})
+    return rows
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    players, leagues = SCALES[args.scale]
+    players, leagues = args.players or players, args.leagues or leagues
+    out = run_suite(players, leagues, args.repeat, args.only, args.seed, args.scale, args.data_dir)
+    commit = (out["git"]["commit"] or "nogit")[:10]
+    path = Path(args.out or f"bench-results/{args.scale}-{players}p-{leagues}l-{commit}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(out, indent=2), encoding="utf-8")
+    print(f"wrote {path}")
+    return 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    base, head = (json.loads(Path(p).read_text(encoding="utf-8")) for p in (args.base, args.head))
+    if base["scale"] != head["scale"]:
+        print(f"warning: scales differ: {base['scale']} vs {head['scale']}")
+    rows = compare(base, head, args.threshold, f"{args.stat}_s")
+    print(f"base {base['git']['commit']}  head {head['git']['commit']}  ({args.stat}, threshold {args.threshold:.0%})")
+    print(f"{'benchmark':<42} {'base_ms':>10} {'head_ms':>10} {'ratio':>7}")
+    for row in rows:
+        flag = {"slower": "  SLOWER", "faster": "  faster"}.get(row["status"], "")
+        print(f"{row['name']:<42} {row['base'] * 1000:>10.2f} {row['head'] * 1000:>10.2f} {row['ratio']:>6.2f}x{flag}")
+    return 1 if any(row["status"] == "slower" for row in rows) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="run the suite and write JSON results")
+    run_p.add_argument("--scale", choices=sorted(SCALES), default="small")
+    run_p.add_argument("--players", type=int, help="override the scale's player count")
+    run_p.add_argument("--leagues", type=int, help="override the scale's league count")
+    run_p.add_argument("--only", nargs="+", help="benchmark name prefixes (e.g. silver. api.players)")
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--data-dir", help="persist bronze here (default: in memory, no disk I/O in timings)")
+    run_p.add_argument("--out", help="results file (default bench-results/<scale>-<players>p-<leagues>l-<commit>.json)")
+    cmp_p = sub.add_parser("compare", help="compare two result files; exit 1 on regressions")
+    cmp_p.add_argument("base")
+    cmp_p.add_argument("head")
+    cmp_p.add_argument("--threshold", type=float, default=0.10, help="relative slowdown flagged as a regression")
+    cmp_p.add_argument("--stat", choices=("median", "min", "mean"), default="median")
+    args = parser.parse_args(argv)
+    return _cmd_run(args) if args.command == "run" else _cmd_compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Deterministic synthetic Sleeper data: players (/players/nfl), leagues, rosters and week-1 matchups.
+
+Output depends only on the seed and the sizes: player i is the same in every scale (players are drawn in
+sequence), and league i is drawn from its own seeded generator, so for the same player count (or any count of
+at least ROSTER_POOL) a 10-league workload is a prefix of a 500-league one. Workload.adapter() serves the data
+through NFLSleeperAdapter's injected fetch functions, so loading it exercises the real bronze write path.
+
+Usage: python benchmarks/generators.py [--scale small] [--players N] [--leagues N] [--seed 0]
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List, Tuple
+
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+
+# (players, leagues) per named scale.
+SCALES: Dict[str, Tuple[int, int]] = {
+    "small": (10_000, 10),
+    "medium": (100_000, 500),
+    "large": (1_000_000, 5_000),
+}
+
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF", "OL", "DL", "LB", "DB")
+POSITION_WEIGHTS = (10, 18, 28, 12, 5, 2, 8, 7, 5, 5)
+TEAMS = (
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+)
+STATUSES = ("Active", "Active", "Active", "Inactive", "Injured Reserve", "Practice Squad")
+INJURY_STATUSES = ("Questionable", "Questionable", "Doubtful", "Out", "IR", "PUP")
+FIRST = ("Aaron", "Amari", "Bijan", "Breece", "CeeDee", "Cooper", "Davante", "Derrick", "Garrett", "Jalen",
+         "Ja'Marr", "Josh", "Justin", "Kyren", "Lamar", "Mike", "Nico", "Patrick", "Puka", "Travis")
+LAST = ("Adams", "Allen", "Brown", "Chase", "Cook", "Davis", "Evans", "Hall", "Henry", "Hill", "Jackson",
+        "Jefferson", "Johnson", "Kelce", "Lamb", "Mahomes", "Nacua", "Robinson", "Smith", "Williams")
+ROSTER_POSITIONS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "FLEX", "K", "DEF"] + ["BN"] * 6
+# Rostered players come from the top of the player list (by search_rank), as in real leagues.
+ROSTER_POOL = 3_000
+
+
+def player_id(i: int) -> str:
+    return str(1_000 + i)
+
+
+def league_id(i: int) -> str:
+    return str(10**18 + i)
+
+
+def make_players(n: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """Return n players keyed by player_id, shaped like Sleeper's /players/nfl response."""
+    rng = random.Random(f"{seed}:players")
+    out: Dict[str, Dict[str, Any]] = {}
+    for i in range(n):
+        pid = player_id(i)
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        position = rng.choices(POSITIONS, POSITION_WEIGHTS)[0]
+        injured = rng.random() < 0.12
+        out[pid] = {
+            "player_id": pid,
+            "first_name": first,
+            "last_name": last,
+            "full_name": f"{first} {last}",
+            "display_name": f"{first} {last}",
+            "position": position,
+            "fantasy_positions": [position],
+            "team": rng.choice(TEAMS) if rng.random() < 0.7 else None,
+            "status": rng.choice(STATUSES),
+            "injury_status": rng.choice(INJURY_STATUSES) if injured else None,
+            "injury_body_part": rng.choice(("Knee", "Ankle", "Hamstring", "Shoulder")) if injured else None,
+            "age": rng.randint(21, 38) if rng.random() < 0.9 else None,
+            "years_exp": rng.randint(0, 15),
+            "search_rank": i + 1,
+            "trending": round(rng.expovariate(0.5), 3) if rng.random() < 0.3 else None,
+            "sport": "nfl",
+        }
+    return out
+
+
+def make_league(i: int, seed: int = 0) -> Dict[str, Any]:
+    """Return league i as Sleeper's /league/{id} response (without league_id; the adapter adds it)."""
+    rng = random.Random(f"{seed}:league:{i}")
+    return {
+        "name": f"Synthetic League {i}",
+        "season": "2026",
+        "status": "in_season",
+        "sport": "nfl",
+        "total_rosters": rng.choice((10, 12, 12, 14)),
+        "roster_positions": ROSTER_POSITIONS,
+        "scoring_settings": {"rec": rng.choice((0.0, 0.5, 1.0)), "pass_td": 4.0, "rush_td": 6.0, "rec_td": 6.0},
+        "settings": {"playoff_teams": 6, "waiver_type": rng.choice((0, 2))},
+    }
+
+
+def make_rosters(i: int, total_rosters: int, players: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return league i's rosters (Sleeper /league/{id}/rosters): distinct players from the top of the pool."""
+    rng = random.Random(f"{seed}:rosters:{i}")
+    size = len(ROSTER_POSITIONS)
+    pool = min(players, ROSTER_POOL)
+    picks = rng.sample(range(pool), min(pool, size * total_rosters))
+    rosters = []
+    for r in range(total_rosters):
+        ids = [player_id(p) for p in picks[r * size:(r + 1) * size]]
+        rosters.append({
+            "roster_id": r + 1,
+            "owner_id": str(rng.randint(10**17, 10**18)),
+            "players": ids,
+            "starters": ids[:10],
+            "reserve": [],
+            "settings": {"wins": rng.randint(0, 8), "losses": rng.randint(0, 8), "fpts": rng.randint(600, 1400)},
+        })
+    return rosters
+
+
+def make_matchups(i: int, rosters: List[Dict[str, Any]], seed: int = 0) -> List[Dict[str, Any]]:
+    """Return league i's week-1 matchups (Sleeper /league/{id}/matchups/1) for its rosters."""
+    rng = random.Random(f"{seed}:matchups:{i}")
+    out = []
+    for roster in rosters:
+        points = {pid: round(rng.uniform(0, 30), 2) for pid in roster["players"]}
+        out.append({
+            "roster_id": roster["roster_id"],
+            "matchup_id": (roster["roster_id"] + 1) // 2,
+            "starters": roster["starters"],
+            "players": roster["players"],
+            "players_points": points,
+            "points": round(sum(points[p] for p in roster["starters"]), 2),
+        })
+    return out
+
+
+class Workload:
+    """Generated players plus league, rosters and matchups per league_id."""
+
+    def __init__(self, players: int, leagues: int, seed: int = 0):
+        self.seed = seed
+        self.players = make_players(players, seed)
+        self.league_ids = [league_id(i) for i in range(leagues)]
+        self.leagues: Dict[str, Dict[str, Any]] = {}
+        self.rosters: Dict[str, List[Dict[str, Any]]] = {}
+        self.matchups: Dict[str, List[Dict[str, Any]]] = {}
+        for i, lid in enumerate(self.league_ids):
+            league = self.leagues[lid] = make_league(i, seed)
+            rosters = self.rosters[lid] = make_rosters(i, league["total_rosters"], players, seed)
+            self.matchups[lid] = make_matchups(i, rosters, seed)
+
+    @classmethod
+    def scale(cls, name: str, seed: int = 0) -> "Workload":
+        players, leagues = SCALES[name]
+        return cls(players, leagues, seed)
+
+    def adapter(self) -> NFLSleeperAdapter:
+        """Sleeper adapter whose fetches return this workload (unknown leagues: no league, no rosters)."""
+        return NFLSleeperAdapter(
+            fetch_players=lambda: self.players,
+            fetch_league=self.leagues.get,
+            fetch_rosters=lambda lid: self.rosters.get(lid, []),
+            fetch_matchups=lambda lid, week=1: self.matchups.get(lid, []),
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "players": len(self.players),
+            "leagues": len(self.league_ids),
+            "rosters": sum(len(r) for r in self.rosters.values()),
+            "rostered_players": sum(len(r["players"]) for rs in self.rosters.values() for r in rs),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--players", type=int, help="override the scale's player count")
+    parser.add_argument("--leagues", type=int, help="override the scale's league count")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    players, leagues = SCALES[args.scale]
+    workload = Workload(args.players or players, args.leagues or leagues, args.seed)
+    print(workload.describe())
+
+
+if __name__ == "__main__":
+    main()
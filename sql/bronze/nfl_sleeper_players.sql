@@ -1,14 +1,19 @@
 -- Bronze: raw NFL Sleeper players (source-specific; append-only)
 -- Unity Catalog–friendly: catalog.schema.table
 -- Example: CREATE TABLE IF NOT EXISTS bronze.nfl_sleeper.players (...)
+-- seq: position of the record in the append-only table (later records win in silver)
 SELECT
+  seq,
   player_id,
+  id,
   display_name,
+  name,
   position,
   team,
   status,
   injury_status,
   age,
-  number,
-  raw
+  trending,
+  updated_at,
+  injury_updated
 FROM bronze_nfl_sleeper_players;
@@ -0,0 +1,9 @@
+-- Bronze: raw NFL Sleeper rosters (league-scoped; append-only)
+-- bronze_nfl_sleeper_roster_players holds each record's players array, one row per player
+SELECT
+  r.seq,
+  r.league_id,
+  r.roster_id,
+  rp.player_id
+FROM bronze_nfl_sleeper_rosters r
+LEFT JOIN bronze_nfl_sleeper_roster_players rp ON rp.seq = r.seq;
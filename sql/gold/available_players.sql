@@ -1,5 +1,5 @@
 -- Gold: available (unrostered) players per league
--- Business-level aggregate for API /players/available
+-- Business-level aggregate for API /players/available; anti-join on the league's rostered players
 SELECT
   p.player_id AS id,
   p.player_id,
@@ -10,5 +10,9 @@ SELECT
   p.age,
   p.trending
 FROM silver_players p
-LEFT JOIN silver_rosters r ON r.league_id = :league_id AND p.player_id IN (SELECT unnest(r.players))
-WHERE r.roster_id IS NULL;
+WHERE NOT EXISTS (
+  SELECT 1
+  FROM silver_roster_players r
+  WHERE r.league_id = :league_id AND r.player_id = p.player_id
+)
+ORDER BY p.seen_seq;
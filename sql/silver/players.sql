@@ -1,14 +1,31 @@
 -- Silver: cleaned/conformed players (canonical entity)
--- Dedup, normalize; Unity Catalog–friendly
+-- Dedup by player_id (latest bronze record wins), first-seen order; Unity Catalog–friendly
+-- seen_seq: bronze position of the player's first record (silver row order)
+-- The loader stores falsy non-string values (0, false) of or-fallback fields as NULL (sql_engine.BRONZE_TABLES),
+-- so COALESCE falls through exactly like the Python transform's `x or y`
+WITH keyed AS (
+  SELECT
+    b.*,
+    COALESCE(NULLIF(b.player_id, ''), b.id) AS player_key
+  FROM bronze_nfl_sleeper_players b
+),
+latest AS (
+  SELECT player_key, MIN(seq) AS first_seq, MAX(seq) AS last_seq
+  FROM keyed
+  WHERE player_key IS NOT NULL
+  GROUP BY player_key
+)
 SELECT
-  player_id,
-  COALESCE(display_name, name, '') AS name,
-  COALESCE(position, '') AS position,
-  COALESCE(team, '') AS team,
-  COALESCE(status, '') AS status,
-  COALESCE(injury_status, '') AS injury_status,
-  CAST(age AS INT) AS age,
-  CAST(trending AS DOUBLE) AS trending,
-  updated_at
-FROM bronze_nfl_sleeper_players
-WHERE player_id IS NOT NULL;
+  k.player_key AS player_id,
+  COALESCE(NULLIF(k.display_name, ''), NULLIF(k.name, ''), '') AS name,
+  COALESCE(k.position, '') AS position,
+  COALESCE(k.team, '') AS team,
+  COALESCE(k.status, '') AS status,
+  COALESCE(k.injury_status, '') AS injury_status,
+  CAST(k.age AS INT) AS age,
+  CAST(k.trending AS DOUBLE) AS trending,
+  COALESCE(NULLIF(k.updated_at, ''), k.injury_updated) AS updated_at,
+  l.first_seq AS seen_seq
+FROM latest l
+JOIN keyed k ON k.seq = l.last_seq
+ORDER BY l.first_seq;
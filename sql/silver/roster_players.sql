@@ -0,0 +1,15 @@
+-- Silver: rostered players per league (one row per league, roster, player)
+-- Dedup by (league_id, roster_id): only each roster's latest bronze record counts
+WITH latest AS (
+  SELECT league_id, CAST(roster_id AS VARCHAR) AS roster_key, MAX(seq) AS last_seq
+  FROM bronze_nfl_sleeper_rosters
+  WHERE league_id IS NOT NULL AND roster_id IS NOT NULL
+  GROUP BY league_id, CAST(roster_id AS VARCHAR)
+)
+SELECT
+  r.league_id,
+  r.roster_id,
+  rp.player_id
+FROM latest l
+JOIN bronze_nfl_sleeper_rosters r ON r.seq = l.last_seq
+JOIN bronze_nfl_sleeper_roster_players rp ON rp.seq = r.seq;
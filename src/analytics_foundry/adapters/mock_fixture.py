@@ -4,6 +4,7 @@ from typing import Any, Dict, List
 
 from analytics_foundry.adapters.protocol import SourceAdapter
 from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.executors import run_io
 
 
 class MockFixtureAdapter:
@@ -22,3 +23,7 @@ class MockFixtureAdapter:
     def ingest_to_bronze(self, **kwargs: Any) -> None:
         """Write fixture records to bronze. Same pipeline as NFL adapter."""
         bronze_store.append_raw(self.SOURCE_ID, self._table, self._records)
+
+    async def aingest_to_bronze(self, **kwargs: Any) -> None:
+        """Async ingest: fixture data is in memory; the bronze write runs in the io executor."""
+        await run_io(self.ingest_to_bronze, **kwargs)
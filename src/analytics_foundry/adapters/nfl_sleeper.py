@@ -1,9 +1,11 @@
 """NFL/Sleeper adapter: broad ingest (players) and league-scoped ingest (league, rosters, matchups)."""
 
+import asyncio
 from typing import Any, Callable, Dict, List, Optional
 
 from analytics_foundry.adapters.protocol import SourceAdapter
 from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.executors import run_io
 
 
 def _default_fetch_players() -> Dict[str, Any]:
@@ -30,8 +32,37 @@ def _default_fetch_matchups(league_id: str, week: int = 1) -> List[Dict[str, Any
     return get_matchups(league_id, week)
 
 
+async def _default_afetch_players(client: Any) -> Dict[str, Any]:
+    from analytics_foundry.adapters.sleeper_client import aget_players_nfl
+
+    return await aget_players_nfl(client)
+
+
+async def _default_afetch_league(league_id: str, client: Any) -> Optional[Dict[str, Any]]:
+    from analytics_foundry.adapters.sleeper_client import aget_league
+
+    return await aget_league(league_id, client)
+
+
+async def _default_afetch_rosters(league_id: str, client: Any) -> List[Dict[str, Any]]:
+    from analytics_foundry.adapters.sleeper_client import aget_rosters
+
+    return await aget_rosters(league_id, client)
+
+
+async def _default_afetch_matchups(league_id: str, week: int, client: Any) -> List[Dict[str, Any]]:
+    from analytics_foundry.adapters.sleeper_client import aget_matchups
+
+    return await aget_matchups(league_id, week, client)
+
+
 class NFLSleeperAdapter:
-    """Sleeper NFL adapter: broad (players) and league-scoped (league, rosters, matchups) ingest to bronze."""
+    """Sleeper NFL adapter: broad (players) and league-scoped (league, rosters, matchups) ingest to bronze.
+
+    aingest_to_bronze fetches with httpx.AsyncClient (a league's three requests concurrently); injected blocking
+    fetch functions are run in the io executor instead. The bronze write (encoding, file/SQLite append and change
+    listeners) always runs in the io executor, never on the event loop.
+    """
 
     SOURCE_ID = "nfl_sleeper"
 
@@ -46,6 +77,8 @@ class NFLSleeperAdapter:
         self._fetch_league = fetch_league or _default_fetch_league
         self._fetch_rosters = fetch_rosters or _default_fetch_rosters
         self._fetch_matchups = fetch_matchups or _default_fetch_matchups
+        # Native async fetches only when every fetch is the default (an injected fetch replaces both paths).
+        self._native_async = not (fetch_players or fetch_league or fetch_rosters or fetch_matchups)
 
     @property
     def source_id(self) -> str:
@@ -59,9 +92,38 @@ class NFLSleeperAdapter:
         else:
             self._ingest_broad()
 
+    async def aingest_to_bronze(self, **kwargs: Any) -> None:
+        """Async ingest_to_bronze: same bronze writes, source I/O and the bronze write awaited."""
+        league_id = kwargs.get("league_id")
+        if not self._native_async:
+            fetched = await run_io(self._fetch_all, league_id)
+        else:
+            import httpx
+
+            async with httpx.AsyncClient(timeout=10) as client:
+                if league_id:
+                    fetched = await asyncio.gather(
+                        _default_afetch_league(league_id, client),
+                        _default_afetch_rosters(league_id, client),
+                        _default_afetch_matchups(league_id, 1, client),
+                    )
+                else:
+                    fetched = (await _default_afetch_players(client),)
+        if league_id:
+            await run_io(self._write_league, league_id, *fetched)
+        else:
+            await run_io(self._write_players, *fetched)
+
+    def _fetch_all(self, league_id: Optional[str]) -> tuple:
+        if league_id:
+            return self._fetch_league(league_id), self._fetch_rosters(league_id), self._fetch_matchups(league_id, 1)
+        return (self._fetch_players(),)
+
     def _ingest_broad(self) -> None:
         """Fetch NFL players (and injuries if available); write to bronze."""
-        data = self._fetch_players()
+        self._write_players(self._fetch_players())
+
+    def _write_players(self, data: Any) -> None:
         if isinstance(data, dict):
             records = [{"player_id": k, **v} if isinstance(v, dict) else {"player_id": k, "raw": v} for k, v in data.items()]
         else:
@@ -70,10 +132,16 @@ class NFLSleeperAdapter:
 
     def _ingest_league_scoped(self, league_id: str) -> None:
         """Fetch league, rosters, matchups for league_id; write to bronze."""
-        league = self._fetch_league(league_id)
+        self._write_league(league_id, *self._fetch_all(league_id))
+
+    def _write_league(
+        self,
+        league_id: str,
+        league: Optional[Dict[str, Any]],
+        rosters: List[Dict[str, Any]],
+        matchups: List[Dict[str, Any]],
+    ) -> None:
         if league is not None:
             bronze_store.append_raw(self.SOURCE_ID, "league", [{"league_id": league_id, **league}])
-        rosters = self._fetch_rosters(league_id)
         bronze_store.append_raw(self.SOURCE_ID, "rosters", [{"league_id": league_id, **r} for r in rosters])
-        matchups = self._fetch_matchups(league_id, 1)
         bronze_store.append_raw(self.SOURCE_ID, "matchups", [{"league_id": league_id, "week": 1, **m} for m in matchups])
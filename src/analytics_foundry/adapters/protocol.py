@@ -2,6 +2,8 @@
 
 from typing import Protocol, runtime_checkable, Any
 
+from analytics_foundry.executors import run_io
+
 
 @runtime_checkable
 class SourceAdapter(Protocol):
@@ -15,3 +17,17 @@ class SourceAdapter(Protocol):
     def ingest_to_bronze(self, **kwargs: Any) -> None:
         """Pull from source and write raw records into the bronze layer. Kwargs are source-specific."""
         ...
+
+    async def aingest_to_bronze(self, **kwargs: Any) -> None:
+        """Async ingest_to_bronze for the async request path: awaits source I/O instead of blocking a thread."""
+        ...
+
+
+async def aingest(adapter: Any, **kwargs: Any) -> None:
+    """Run an adapter's ingest from async code: its aingest_to_bronze, or for adapters written before the async
+    method, its blocking ingest_to_bronze in the io executor (never on the event loop)."""
+    native = getattr(adapter, "aingest_to_bronze", None)
+    if native is not None:
+        await native(**kwargs)
+    else:
+        await run_io(adapter.ingest_to_bronze, **kwargs)
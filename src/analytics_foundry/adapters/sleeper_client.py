@@ -1,12 +1,21 @@
-"""Thin client for Sleeper API. Inject a mock in tests to avoid network calls."""
+"""Thin client for Sleeper API. Inject a mock in tests to avoid network calls.
+
+Blocking functions use urllib; the a-prefixed coroutines use httpx.AsyncClient for the async request path
+(pass client to share one connection pool across calls).
+"""
 
 import json
 import urllib.request
 from typing import Any, Dict, List, Optional
 
+import httpx
+
+from analytics_foundry.metrics import timed
+
 SLEEPER_BASE = "https://api.sleeper.app/v1"
 
 
+@timed
 def _get(url: str) -> Any:
     with urllib.request.urlopen(url, timeout=10) as resp:
         return json.loads(resp.read().decode())
@@ -37,3 +46,44 @@ def get_matchups(league_id: str, week: int = 1) -> List[Dict[str, Any]]:
     """Fetch matchups for a league and week."""
     out = _get(f"{SLEEPER_BASE}/league/{league_id}/matchups/{week}")
     return out if isinstance(out, list) else []
+
+
+async def _aget(url: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Any]:
+    """GET url as JSON; None on 404."""
+    if client is None:
+        async with httpx.AsyncClient(timeout=10) as own:
+            return await _afetch(own, url)
+    return await _afetch(client, url)
+
+
+@timed
+async def _afetch(client: httpx.AsyncClient, url: str) -> Optional[Any]:
+    resp = await client.get(url)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def aget_players_nfl(client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """Async get_players_nfl."""
+    return await _aget(f"{SLEEPER_BASE}/players/nfl", client) or {}
+
+
+async def aget_league(league_id: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict[str, Any]]:
+    """Async get_league (None if 404)."""
+    return await _aget(f"{SLEEPER_BASE}/league/{league_id}", client)
+
+
+async def aget_rosters(league_id: str, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
+    """Async get_rosters."""
+    out = await _aget(f"{SLEEPER_BASE}/league/{league_id}/rosters", client)
+    return out if isinstance(out, list) else []
+
+
+async def aget_matchups(
+    league_id: str, week: int = 1, client: Optional[httpx.AsyncClient] = None
+) -> List[Dict[str, Any]]:
+    """Async get_matchups."""
+    out = await _aget(f"{SLEEPER_BASE}/league/{league_id}/matchups/{week}", client)
+    return out if isinstance(out, list) else []
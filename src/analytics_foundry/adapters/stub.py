@@ -14,3 +14,6 @@ class StubSourceAdapter:
 
     def ingest_to_bronze(self, **kwargs: Any) -> None:
         pass
+
+    async def aingest_to_bronze(self, **kwargs: Any) -> None:
+        pass
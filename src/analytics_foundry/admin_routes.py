@@ -1,24 +1,35 @@
-"""Admin API for Foundry UI: ingest, tables, transformations, runs (stub). Unauthenticated for local/dev."""
+"""Admin API for Foundry UI: ingest, tables, transformations, runs (stub). Unauthenticated for local/dev.
 
+Async like the public API: ingests await the adapters' async ingest, and catalog, sample and SQL file reads
+run in the compute executor. Ingests take profile=true to run under cProfile/tracemalloc (profiling.py);
+/admin/profiles lists sessions, serves their .prof/.tracemalloc files and turns request sampling on and off.
+"""
+
+import contextlib
 import time
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel
 
-from analytics_foundry.adapters import get_adapter
+from analytics_foundry import catalog, metrics, profiling, snapshot
+from analytics_foundry.adapters import aingest, get_adapter
 from analytics_foundry.bronze import store as bronze_store
 from analytics_foundry.config import get_default_league_id
+from analytics_foundry.executors import run_compute
 from analytics_foundry.silver import injuries as silver_injuries
 from analytics_foundry.silver import league as silver_league
 from analytics_foundry.silver import players as silver_players
 from analytics_foundry.silver import rosters as silver_rosters
+from analytics_foundry.gold import cache as gold_cache
 from analytics_foundry.gold import injury as gold_injury
 from analytics_foundry.gold import league as gold_league
 from analytics_foundry.gold import players as gold_players
-from analytics_foundry.sql_loader import list_sql_files, medallion_layers, read_sql
+from analytics_foundry.sql_loader import lineage, list_sql_files, medallion_layers, read_sql
+from analytics_foundry.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -36,6 +47,13 @@ class IngestLeaguesBody(BaseModel):
     league_ids: str | list[str]
 
 
+class SampleRequestsBody(BaseModel):
+    """Profile a share rate (0 < rate <= 1) of read requests, at most limit of them."""
+    rate: float
+    limit: int = 10
+    allocations: bool = True
+
+
 def _record_run(kind: str, league_id: Optional[str] = None) -> None:
     _RUNS.insert(0, {
         "kind": kind,
@@ -46,18 +64,41 @@ def _record_run(kind: str, league_id: Optional[str] = None) -> None:
         _RUNS.pop()
 
 
+def _require_writable() -> None:
+    """Snapshot workers serve read-only data: ingest runs on the snapshot writer (409 here)."""
+    if snapshot.is_attached():
+        raise HTTPException(status_code=409, detail="Read-only snapshot worker: ingest on the snapshot writer")
+
+
+def _profiled(profile: bool, kind: str, target: str, allocations: bool) -> Any:
+    """profiling.profiled(...) when profile is set, else a no-op context (yields None)."""
+    return profiling.profiled(kind, target, allocations) if profile else contextlib.nullcontext()
+
+
+def _with_profile(out: Dict[str, Any], session: Optional[profiling.Session]) -> Dict[str, Any]:
+    if session is not None:
+        out["profile"] = session.summary()
+    return out
+
+
 @router.get("/config")
-def admin_config() -> Dict[str, Any]:
+async def admin_config() -> Dict[str, Any]:
     """Return config values for the admin UI (e.g. default league ID)."""
     return {"default_league_id": get_default_league_id()}
 
 
 @router.post("/ingest/league")
-def admin_ingest_league(body: IngestLeagueBody) -> Dict[str, Any]:
-    """Trigger league-scoped ingest for the given league_id. Uses ensure_league_ingested."""
-    gold_league.ensure_league_ingested(body.league_id)
+async def admin_ingest_league(
+    body: IngestLeagueBody, profile: bool = False, allocations: bool = True
+) -> Dict[str, Any]:
+    """Trigger league-scoped ingest for the given league_id (even if fresh). Uses aensure_league_ingested.
+    profile=true profiles the run (allocations=false skips tracemalloc) and returns its summary under "profile"."""
+    _require_writable()
+    gold_league.mark_stale(body.league_id)
+    with _profiled(profile, "ingest.league", body.league_id, allocations) as session:
+        await gold_league.aensure_league_ingested(body.league_id)
     _record_run("league", body.league_id)
-    return {"ok": True, "league_id": body.league_id}
+    return _with_profile({"ok": True, "league_id": body.league_id}, session)
 
 
 def _parse_league_ids(raw: str | list[str]) -> list[str]:
@@ -73,135 +114,228 @@ def _parse_league_ids(raw: str | list[str]) -> list[str]:
 
 
 @router.post("/ingest/leagues")
-def admin_ingest_leagues(body: IngestLeaguesBody) -> Dict[str, Any]:
-    """Trigger league-scoped ingest for one or more league IDs."""
+async def admin_ingest_leagues(
+    body: IngestLeaguesBody, profile: bool = False, allocations: bool = True
+) -> Dict[str, Any]:
+    """Trigger league-scoped ingest for one or more league IDs (fetched concurrently). profile as for /ingest/league."""
+    _require_writable()
     ids = _parse_league_ids(body.league_ids)
     if not ids:
         raise HTTPException(status_code=400, detail="At least one league_id required")
     for lid in ids:
-        gold_league.ensure_league_ingested(lid)
+        gold_league.mark_stale(lid)
+    with _profiled(profile, "ingest.leagues", ",".join(ids), allocations) as session:
+        await gold_league.aensure_leagues_ingested(ids)
+    for lid in ids:
         _record_run("league", lid)
-    return {"ok": True, "league_ids": ids}
+    return _with_profile({"ok": True, "league_ids": ids}, session)
 
 
 @router.post("/ingest/broad")
-def admin_ingest_broad() -> Dict[str, Any]:
-    """Trigger broad NFL ingest (no league_id). Calls adapter ingest_to_bronze()."""
+async def admin_ingest_broad(profile: bool = False, allocations: bool = True) -> Dict[str, Any]:
+    """Trigger broad NFL ingest (no league_id). Awaits the adapter's aingest_to_bronze() (see adapters.aingest).
+    profile as for /ingest/league."""
+    _require_writable()
     adapter = get_adapter("nfl_sleeper")
     if adapter is None:
         raise HTTPException(status_code=503, detail="nfl_sleeper adapter not registered")
-    adapter.ingest_to_bronze()
+    with _profiled(profile, "ingest.broad", "nfl_sleeper", allocations) as session:
+        await aingest(adapter)
     _record_run("broad")
-    return {"ok": True}
+    return _with_profile({"ok": True}, session)
 
 
 @router.get("/tables")
-def admin_list_tables() -> Dict[str, Any]:
-    """List medallion datasets: bronze from store; silver/gold as fixed list with row_count or N/A."""
-    bronze = [
-        {"layer": "bronze", "source_id": s, "table": t, "row_count": n}
-        for s, t, n in bronze_store.list_tables()
-    ]
-    silver_tables = [
-        ("players", lambda: len(silver_players.get_players())),
-        ("league", lambda: len(silver_league.get_leagues())),
-        ("rosters", lambda: len(silver_rosters.get_rosters())),
-        ("injuries", lambda: len(silver_injuries.get_injuries())),
-    ]
-    silver = [
-        {"layer": "silver", "name": n, "row_count": fn()}
-        for n, fn in silver_tables
-    ]
-    gold_available = gold_players.get_available_players()
-    gold_injury_list = gold_injury.get_injury_report()
-    gold = [
-        {"layer": "gold", "name": "available_players", "row_count": len(gold_available)},
-        {"layer": "gold", "name": "injury", "row_count": len(gold_injury_list)},
-    ]
-    return {"bronze": bronze, "silver": silver, "gold": gold}
+async def admin_list_tables() -> Dict[str, Any]:
+    """List medallion datasets from the statistics catalog: bronze from store stats; silver/gold row_count is
+    null (N/A) until the dataset has been built. Never loads or rebuilds data."""
+    return await run_compute(catalog.list_tables)
 
 
-@router.get("/tables/{layer}/{source_or_name}")
-def admin_sample_table_two_segments(
-    layer: str, source_or_name: str, table: Optional[str] = None
-) -> Dict[str, Any]:
-    """Sample table: bronze requires table (source_or_name=source_id); gold/silver use source_or_name as name."""
-    limit = _DEFAULT_SAMPLE_LIMIT
+def _sample_rows(layer: str, source_or_name: str, table: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """Return a lazy row iterator for a table, or raise HTTPException for unknown layers/tables."""
     if layer == "bronze":
         if table is None:
             raise HTTPException(
                 status_code=400,
                 detail="Bronze sample requires path: /admin/tables/bronze/{source_id}/{table}",
             )
-        rows = bronze_store.get_raw(source_or_name, table)[:limit]
-        return {"layer": layer, "source_id": source_or_name, "table": table, "rows": rows, "limit": limit}
+        return bronze_store.iter_raw(source_or_name, table)
     if layer == "silver":
         if source_or_name == "players":
-            rows = silver_players.get_players()[:limit]
-        elif source_or_name == "league":
-            rows = silver_league.get_leagues()[:limit]
-        elif source_or_name == "rosters":
-            rows = silver_rosters.get_rosters()[:limit]
-        elif source_or_name == "injuries":
-            rows = silver_injuries.get_injuries()[:limit]
-        else:
-            raise HTTPException(status_code=404, detail=f"Unknown silver table: {source_or_name}")
-        return {"layer": layer, "name": source_or_name, "rows": rows, "limit": limit}
+            return silver_players.get_player_table().iter_dicts()
+        if source_or_name == "league":
+            return iter(silver_league.get_leagues())
+        if source_or_name == "rosters":
+            return iter(silver_rosters.get_rosters())
+        if source_or_name == "injuries":
+            return iter(silver_injuries.get_injuries())
+        raise HTTPException(status_code=404, detail=f"Unknown silver table: {source_or_name}")
     if layer == "gold":
         if source_or_name == "available_players":
-            rows = gold_players.get_available_players()[:limit]
-        elif source_or_name == "injury":
-            rows = gold_injury.get_injury_report()[:limit]
-        else:
-            raise HTTPException(status_code=404, detail=f"Unknown gold table: {source_or_name}")
-        return {"layer": layer, "name": source_or_name, "rows": rows, "limit": limit}
+            return gold_players.iter_available_players()
+        if source_or_name == "injury":
+            return iter(gold_injury.get_injury_report())
+        raise HTTPException(status_code=404, detail=f"Unknown gold table: {source_or_name}")
     raise HTTPException(status_code=400, detail=f"Unknown layer: {layer}")
 
 
+def _sample_response(
+    layer: str,
+    source_or_name: str,
+    table: Optional[str],
+    limit: Optional[int],
+    fmt: Optional[str],
+    accept: Optional[str],
+) -> Any:
+    """JSON sample of the first limit rows (default _DEFAULT_SAMPLE_LIMIT), or an NDJSON stream (default: all rows)."""
+    rows = _sample_rows(layer, source_or_name, table)
+    if wants_ndjson(fmt, accept):
+        return ndjson_response(rows if limit is None else islice(rows, limit))
+    limit = _DEFAULT_SAMPLE_LIMIT if limit is None else limit
+    out: Dict[str, Any] = {"layer": layer}
+    if layer == "bronze":
+        out.update({"source_id": source_or_name, "table": table})
+    else:
+        out["name"] = source_or_name
+    out.update({"rows": list(islice(rows, limit)), "limit": limit})
+    return out
+
+
+@router.get("/tables/{layer}/{source_or_name}")
+async def admin_sample_table_two_segments(
+    layer: str,
+    source_or_name: str,
+    table: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=0),
+    format: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+) -> Any:
+    """Sample table: bronze requires table (source_or_name=source_id); gold/silver use source_or_name as name.
+    format=ndjson (or Accept: application/x-ndjson) streams rows instead."""
+    return await run_compute(_sample_response, layer, source_or_name, table, limit, format, accept)
+
+
 @router.get("/tables/{layer}/{source_or_name}/{table}")
-def admin_sample_bronze(
-    layer: str, source_or_name: str, table: str
-) -> Dict[str, Any]:
-    """Sample bronze table: GET /admin/tables/bronze/{source_id}/{table}."""
+async def admin_sample_bronze(
+    layer: str,
+    source_or_name: str,
+    table: str,
+    limit: Optional[int] = Query(None, ge=0),
+    format: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+) -> Any:
+    """Sample bronze table: GET /admin/tables/bronze/{source_id}/{table}. format=ndjson streams rows instead."""
     if layer != "bronze":
         raise HTTPException(status_code=400, detail="Three-segment path is for bronze only")
-    limit = _DEFAULT_SAMPLE_LIMIT
-    rows = bronze_store.get_raw(source_or_name, table)[:limit]
-    return {"layer": "bronze", "source_id": source_or_name, "table": table, "rows": rows, "limit": limit}
+    return await run_compute(_sample_response, layer, source_or_name, table, limit, format, accept)
 
 
 @router.get("/transformations")
-def admin_list_transformations() -> Dict[str, Any]:
-    """List SQL transformation files by layer (from sql_loader)."""
-    out = {}
+async def admin_list_transformations() -> Dict[str, Any]:
+    """List SQL transformation files by layer (from sql_loader), plus their lineage graph under "lineage"."""
+    return await run_compute(_transformations)
+
+
+def _transformations() -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
     for layer in medallion_layers():
         files = list_sql_files(layer)
         out[layer] = [f.replace(".sql", "") for f in files]
+    out["lineage"] = lineage()
     return out
 
 
 @router.get("/transformations/{layer}/{name}")
-def admin_get_transformation(layer: str, name: str) -> Dict[str, Any]:
+async def admin_get_transformation(layer: str, name: str) -> Dict[str, Any]:
     """Return SQL content for sql/<layer>/<name>.sql."""
     if layer not in medallion_layers():
         raise HTTPException(status_code=400, detail=f"Unknown layer: {layer}")
     try:
-        content = read_sql(layer, name)
+        content = await run_compute(read_sql, layer, name)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Transformation not found: {layer}/{name}")
     return {"layer": layer, "name": name, "sql": content}
 
 
+@router.get("/cache")
+async def admin_cache_stats() -> Dict[str, int]:
+    """Gold result cache metrics: hits, misses, evictions, entries, bytes, max_bytes."""
+    return gold_cache.stats()
+
+
+@router.get("/metrics")
+async def admin_metrics() -> PlainTextResponse:
+    """Prometheus text exposition: stage timings, DAG build times, request latency per route, counters."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/profiles")
+async def admin_list_profiles() -> Dict[str, Any]:
+    """Kept profiling sessions (newest first: id, kind, target, created_at, duration_seconds, allocated_bytes,
+    files) and the request sampler state."""
+    return {"sessions": profiling.sessions(), "sampling": profiling.sampling()}
+
+
+@router.post("/profiles/requests")
+async def admin_sample_requests(body: SampleRequestsBody) -> Dict[str, Any]:
+    """Profile a share of read requests (outside /admin) until limit sessions are taken."""
+    try:
+        return profiling.sample_requests(body.rate, body.limit, body.allocations)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("/profiles/requests")
+async def admin_stop_sampling() -> Dict[str, Any]:
+    """Stop request sampling; returns the final sampler state."""
+    return profiling.stop_sampling()
+
+
+def _session(profile_id: str) -> profiling.Session:
+    session = profiling.get_session(profile_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    return session
+
+
+@router.get("/profiles/{profile_id}")
+async def admin_get_profile(
+    profile_id: str, limit: int = Query(20, ge=1, le=profiling.TOP), sort: str = "cumulative"
+) -> Dict[str, Any]:
+    """Top functions (sort: cumulative, tottime or calls) and allocation sites of a profiling session."""
+    if sort not in profiling.SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(profiling.SORTS)}")
+    return await run_compute(_session(profile_id).summary, limit, sort)
+
+
+@router.get("/profiles/{profile_id}/download")
+async def admin_download_profile(profile_id: str, format: str = "prof") -> FileResponse:
+    """Download the session's pstats file (format=prof) or tracemalloc snapshot (format=tracemalloc)."""
+    if format not in ("prof", "tracemalloc"):
+        raise HTTPException(status_code=400, detail="format must be prof or tracemalloc")
+    path = _session(profile_id).path(format)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail=f"No {format} file for profile {profile_id}")
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
+@router.get("/snapshot")
+async def admin_snapshot() -> Dict[str, Any]:
+    """Data plane (local or snapshot) and the mapped snapshot: generation, created_at, file, bytes, players, leagues."""
+    return snapshot.info()
+
+
 @router.get("/runs")
-def admin_list_runs() -> List[Dict[str, Any]]:
+async def admin_list_runs() -> List[Dict[str, Any]]:
     """Stub: return in-memory run history (last syncs). No scheduler yet."""
     return [{"kind": r["kind"], "league_id": r.get("league_id"), "timestamp": r["timestamp"]} for r in _RUNS]
 
 
 @router.get("/league/validate")
-def admin_validate_league(league_id: str) -> Dict[str, Any]:
+async def admin_validate_league(league_id: str) -> Dict[str, Any]:
     """Validate league ID (same as POST /league/validate). For UI convenience."""
-    return gold_league.validate_league(league_id)
+    return await gold_league.avalidate_league(league_id)
 
 
 _ADMIN_UI_ROOT = Path(__file__).resolve().parent / "admin_ui"
@@ -209,7 +343,7 @@ _ADMIN_UI_ROOT = Path(__file__).resolve().parent / "admin_ui"
 
 @router.get("", include_in_schema=False)
 @router.get("/", include_in_schema=False)
-def admin_ui_index():
+async def admin_ui_index():
     """Serve admin UI at GET /admin and GET /admin/."""
     index = _ADMIN_UI_ROOT / "index.html"
     if not index.is_file():
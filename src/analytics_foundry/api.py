@@ -1,29 +1,56 @@
-"""REST API for sleeper-stream-scribe: players/available, league/validate, injury. CORS enabled."""
+"""REST API for sleeper-stream-scribe: players/available, league/validate, injury. CORS enabled.
 
+Endpoints are async: league freshness checks and cache hits run on the event loop, league fetches await the
+adapter's async ingest, and silver/gold computation runs in the bounded compute executor (executors.py), so
+a slow upstream fetch never holds up requests that can be answered from cache.
+"""
+
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, List, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from analytics_foundry import executors, metrics, prewarm, profiling, snapshot
 from analytics_foundry.admin_routes import router as admin_router
 from analytics_foundry.adapters import register_adapter
 from analytics_foundry.bronze import store as bronze_store
 from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
-from analytics_foundry.config import get_default_league_id
+from analytics_foundry.config import get_data_plane, get_default_league_id
+from analytics_foundry.gold import cache as gold_cache
 from analytics_foundry.gold import injury as gold_injury
 from analytics_foundry.gold import league as gold_league
 from analytics_foundry.gold import players as gold_players
+from analytics_foundry.gold import query as gold_query
 from analytics_foundry.gold import recommendations as gold_recommendations
+from analytics_foundry.http_cache import cached_response
+from analytics_foundry.silver import parallel as silver_parallel
+from analytics_foundry.streaming import ndjson_response, wants_ndjson
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Register NFL/Sleeper adapter and load persisted bronze data on startup."""
+    """Register NFL/Sleeper adapter and load persisted bronze data on startup (snapshot data plane: attach to the
+    published snapshot instead and follow new ones), then prewarm hot leagues in the background (/readyz)."""
     register_adapter(NFLSleeperAdapter)
-    bronze_store.load_from_disk()
+    poller = None
+    if get_data_plane() == "snapshot":
+        snapshot.attach()
+        poller = asyncio.create_task(snapshot.poll())
+    else:
+        bronze_store.load_from_disk()
+    warming = prewarm.start(app)
     yield
+    tasks = [task for task in (warming, poller) if task is not None]
+    for task in tasks:
+        task.cancel()
+    # Let cancelled tasks finish (prewarm records its terminal state).
+    await asyncio.gather(*tasks, return_exceptions=True)
+    executors.shutdown(wait=False)
+    silver_parallel.shutdown(wait=False)
 
 
 app = FastAPI(title="Analytics Foundry API", lifespan=lifespan)
@@ -34,39 +61,264 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+app.add_middleware(profiling.RequestProfiler)
+app.add_middleware(metrics.RequestMetrics)
+
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and serving (never waits for prewarm)."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness: 200 once startup prewarm has finished, else 503. Body: ready plus prewarm status (state,
+    per-league results, started_at, duration_seconds)."""
+    ready = prewarm.is_ready()
+    return JSONResponse({"ready": ready, "prewarm": prewarm.status()}, status_code=200 if ready else 503)
 
 
 class LeagueValidateBody(BaseModel):
     league_id: str
 
 
+class BatchPlayersBody(BaseModel):
+    """Batch /players/available: league_ids plus the single-league query options (lists comma-separated);
+    cursors maps league_id -> that league's next page cursor."""
+    league_ids: List[str]
+    position: Optional[str] = None
+    team: Optional[str] = None
+    status: Optional[str] = None
+    sort: Optional[str] = None
+    fields: Optional[str] = None
+    limit: Optional[int] = None
+    cursors: Optional[Dict[str, str]] = None
+
+
+class BatchRecommendationsBody(BaseModel):
+    """Batch /recommendations/waiver: league_ids plus the single-league query options; cursors per league."""
+    league_ids: List[str]
+    limit: int = 20
+    position: Optional[str] = None
+    team: Optional[str] = None
+    status: Optional[str] = None
+    fields: Optional[str] = None
+    cursors: Optional[Dict[str, str]] = None
+
+
+# Upper bound on leagues per batch request.
+MAX_BATCH_LEAGUES = 100
+
+
+def _batch_league_ids(raw: List[str]) -> List[str]:
+    """Strip and dedupe league_ids (first occurrence order); 400 when empty or over MAX_BATCH_LEAGUES."""
+    ids = list(dict.fromkeys(lid.strip() for lid in raw if lid.strip()))
+    if not ids:
+        raise HTTPException(status_code=400, detail="At least one league_id required")
+    if len(ids) > MAX_BATCH_LEAGUES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_LEAGUES} league_ids per request")
+    return ids
+
+
+def _results_body(parts: Dict[str, bytes]) -> bytes:
+    """Join per-league JSON bodies into {"results": {league_id: body, ...}} without re-serializing them."""
+    items = b",".join(gold_cache.dumps(lid) + b":" + body for lid, body in parts.items())
+    return b'{"results":{' + items + b"}}"
+
+
 @app.get("/players/available")
-def players_available(league_id: Optional[str] = None):
-    """Available (unrostered) players. Optional query: league_id. Uses default league if omitted."""
+async def players_available(
+    league_id: Optional[str] = None,
+    position: Optional[str] = None,
+    team: Optional[str] = None,
+    status: Optional[str] = None,
+    sort: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    format: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """Available (unrostered) players. Optional query: league_id (default league if omitted); position, team,
+    status (comma-separated, any of); sort (field or -field); fields (comma-separated); limit; cursor.
+    Response: JSON array; X-Next-Cursor header when more rows follow; ETag (If-None-Match: 304) and
+    Accept-Encoding compression. format=ndjson (or Accept: application/x-ndjson) streams one player object per
+    line instead."""
     lid = league_id or get_default_league_id()
-    gold_league.ensure_league_ingested(lid)
-    return gold_players.get_available_players(league_id=lid)
+    await gold_league.aensure_league_ingested(lid)
+    try:
+        opts = {
+            "position": gold_query.parse_list(position),
+            "team": gold_query.parse_list(team),
+            "status": gold_query.parse_list(status),
+            "sort": gold_players.parse_sort(sort),
+            "fields": gold_query.parse_fields(fields, gold_players.PLAYER_FIELDS),
+            "limit": limit,
+            "cursor": cursor,
+        }
+        if wants_ndjson(format, accept):
+            # Selection (and any silver/gold build) runs in the compute executor; rows stream from a thread.
+            return ndjson_response(await executors.run_compute(gold_players.iter_available_players, league_id=lid, **opts))
+
+        def compute():
+            page, next_cursor = gold_players.query_available_players(league_id=lid, **opts)
+            return page, {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+        return await cached_response(
+            "players/available", lid, tuple(opts.items()), [("gold.available_players", lid)], compute,
+            if_none_match, accept_encoding,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/players/available/batch")
+async def players_available_batch(body: BatchPlayersBody):
+    """Available players for many leagues in one pass. Body: league_ids plus /players/available options.
+    Response: {results: {league_id: {players: [...], next_cursor}}}."""
+    ids = _batch_league_ids(body.league_ids)
+    await gold_league.aensure_leagues_ingested(ids)
+    cursors = body.cursors or {}
+    try:
+        opts = {
+            "position": gold_query.parse_list(body.position),
+            "team": gold_query.parse_list(body.team),
+            "status": gold_query.parse_list(body.status),
+            "sort": gold_players.parse_sort(body.sort),
+            "fields": gold_query.parse_fields(body.fields, gold_players.PLAYER_FIELDS),
+            "limit": body.limit,
+        }
+
+        def compute_many(missed):
+            pages = gold_players.query_available_players_many(missed, cursors=cursors, **opts)
+            return {
+                lid: (page, {"X-Next-Cursor": next_cursor} if next_cursor else {})
+                for lid, (page, next_cursor) in pages.items()
+            }
+
+        # Same keys as /players/available, so single and batch requests share cache entries.
+        responses = await executors.run_compute(
+            gold_cache.get_many_responses,
+            "players/available",
+            ids,
+            lambda lid: tuple({**opts, "cursor": cursors.get(lid)}.items()),
+            lambda lid: [("gold.available_players", lid)],
+            compute_many,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    parts = {
+        lid: b'{"players":' + page + b',"next_cursor":' + gold_cache.dumps(headers.get("X-Next-Cursor")) + b"}"
+        for lid, (page, headers) in responses.items()
+    }
+    return Response(_results_body(parts), media_type="application/json")
 
 
 @app.post("/league/validate")
-def league_validate(body: LeagueValidateBody):
+async def league_validate(body: LeagueValidateBody):
     """Validate league ID. Response: valid, league_id, league_name."""
-    return gold_league.validate_league(body.league_id)
+    return await gold_league.avalidate_league(body.league_id)
 
 
 @app.get("/injury")
-def injury_report(league_id: Optional[str] = None):
-    """Injury report. Optional query: league_id. Uses default league if omitted."""
+async def injury_report(
+    league_id: Optional[str] = None,
+    scope: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """Injury report. Optional query: league_id (default league if omitted); scope: all (default; every injured
+    player), rostered (players on the league's rosters, with roster_id) or available (not rostered there).
+    ETag / If-None-Match and Accept-Encoding as for /players/available."""
     lid = league_id or get_default_league_id()
-    gold_league.ensure_league_ingested(lid)
-    return gold_injury.get_injury_report(league_id=lid)
+    await gold_league.aensure_league_ingested(lid)
+    try:
+        scope = gold_injury.parse_scope(scope)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    inputs = [("gold.injury", None)] if scope == "all" else [("gold.league_injury", lid)]
+    return await cached_response(
+        "injury", lid, (scope,), inputs,
+        lambda: (gold_injury.get_injury_report(league_id=lid, scope=scope), {}),
+        if_none_match, accept_encoding,
+    )
 
 
 @app.get("/recommendations/waiver")
-def recommendations_waiver(league_id: Optional[str] = None, limit: int = 20):
-    """Waiver/add recommendations: available players with score. Shape: {recommendations: [...], league_id}. Uses default league if omitted."""
+async def recommendations_waiver(
+    league_id: Optional[str] = None,
+    limit: int = 20,
+    position: Optional[str] = None,
+    team: Optional[str] = None,
+    status: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """Waiver/add recommendations: top available players by score. Optional query: league_id (default league if
+    omitted), limit, position/team/status (comma-separated), fields, cursor. Shape: {recommendations: [...],
+    league_id, next_cursor}. ETag / If-None-Match and Accept-Encoding as for /players/available."""
     lid = league_id or get_default_league_id()
-    gold_league.ensure_league_ingested(lid)
-    recs = gold_recommendations.get_waiver_recommendations(league_id=lid, limit=limit)
-    return {"recommendations": recs, "league_id": lid}
+    await gold_league.aensure_league_ingested(lid)
+    try:
+        opts = {
+            "limit": limit,
+            "position": gold_query.parse_list(position),
+            "team": gold_query.parse_list(team),
+            "status": gold_query.parse_list(status),
+            "fields": gold_query.parse_fields(fields, gold_recommendations.RECOMMENDATION_FIELDS),
+            "cursor": cursor,
+        }
+
+        def compute():
+            recs, next_cursor = gold_recommendations.query_waiver_recommendations(league_id=lid, **opts)
+            return {"recommendations": recs, "league_id": lid, "next_cursor": next_cursor}, {}
+
+        return await cached_response(
+            "recommendations/waiver", lid, tuple(opts.items()), [("gold.waiver_recommendations", lid)], compute,
+            if_none_match, accept_encoding,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/recommendations/waiver/batch")
+async def recommendations_waiver_batch(body: BatchRecommendationsBody):
+    """Waiver recommendations for many leagues in one pass. Body: league_ids plus /recommendations/waiver options.
+    Response: {results: {league_id: {recommendations: [...], league_id, next_cursor}}}."""
+    ids = _batch_league_ids(body.league_ids)
+    await gold_league.aensure_leagues_ingested(ids)
+    cursors = body.cursors or {}
+    try:
+        opts = {
+            "limit": body.limit,
+            "position": gold_query.parse_list(body.position),
+            "team": gold_query.parse_list(body.team),
+            "status": gold_query.parse_list(body.status),
+            "fields": gold_query.parse_fields(body.fields, gold_recommendations.RECOMMENDATION_FIELDS),
+        }
+
+        def compute_many(missed):
+            results = gold_recommendations.query_waiver_recommendations_many(missed, cursors=cursors, **opts)
+            return {
+                lid: ({"recommendations": recs, "league_id": lid, "next_cursor": next_cursor}, {})
+                for lid, (recs, next_cursor) in results.items()
+            }
+
+        responses = await executors.run_compute(
+            gold_cache.get_many_responses,
+            "recommendations/waiver",
+            ids,
+            lambda lid: tuple({**opts, "cursor": cursors.get(lid)}.items()),
+            lambda lid: [("gold.waiver_recommendations", lid)],
+            compute_many,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(_results_body({lid: b for lid, (b, _) in responses.items()}), media_type="application/json")
@@ -0,0 +1,182 @@
+"""Bronze SQLite backend: one local database (WAL mode) instead of JSONL files.
+
+Each (source_id, table) is a SQL table of seq (append order), batch_id (one per append_raw call), the JSON
+payload, and extracted key columns (KEY_FIELDS, stored as text like the silver keys) with indexes, so key,
+partition (league_id) and seq-range reads are index lookups rather than full loads. Batches are recorded with
+their row count, payload bytes and time, so table stats need no scan. WAL lets other processes read while
+one writes.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Record fields extracted into indexed columns, per bronze table name.
+KEY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "players": ("player_id",),
+    "league": ("league_id",),
+    "rosters": ("league_id", "roster_id"),
+    "matchups": ("league_id", "week", "roster_id"),
+}
+
+DB_FILENAME = "bronze.sqlite3"
+
+
+def _key(v: Any) -> Optional[str]:
+    return None if v is None else str(v)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteBronze:
+    """Bronze tables in one SQLite database file. Thread-safe (one connection, one lock)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _bronze_tables ("
+                "source_id TEXT NOT NULL, table_name TEXT NOT NULL, sql_name TEXT NOT NULL, "
+                "PRIMARY KEY (source_id, table_name))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _bronze_batches ("
+                "batch_id INTEGER PRIMARY KEY AUTOINCREMENT, source_id TEXT NOT NULL, table_name TEXT NOT NULL, "
+                "row_count INTEGER NOT NULL, bytes INTEGER NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS _bronze_batches_table ON _bronze_batches (source_id, table_name)"
+            )
+
+    def _sql_name(self, source_id: str, table: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT sql_name FROM _bronze_tables WHERE source_id = ? AND table_name = ?", (source_id, table)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _create(self, source_id: str, table: str) -> str:
+        name = f"{source_id}__{table}"
+        q = _quote(name)
+        keys = KEY_FIELDS.get(table, ())
+        key_cols = "".join(f", {_quote(k)} TEXT" for k in keys)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {q} (seq INTEGER PRIMARY KEY, batch_id INTEGER NOT NULL, "
+            f"payload TEXT NOT NULL{key_cols})"
+        )
+        for k in keys:
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(name + '__' + k)} ON {q} ({_quote(k)}, seq)")
+        self._conn.execute(
+            "INSERT OR IGNORE INTO _bronze_tables (source_id, table_name, sql_name) VALUES (?, ?, ?)",
+            (source_id, table, name),
+        )
+        return name
+
+    def append(self, source_id: str, table: str, payloads: Sequence[str], records: Sequence[Dict[str, Any]]) -> int:
+        """Append records (with their JSON payloads) as one batch in one transaction; returns the batch id."""
+        keys = KEY_FIELDS.get(table, ())
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                name = self._sql_name(source_id, table) or self._create(source_id, table)
+                cur = self._conn.execute(
+                    "INSERT INTO _bronze_batches (source_id, table_name, row_count, bytes, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (source_id, table, len(records), sum(len(p.encode("utf-8")) + 1 for p in payloads), time.time()),
+                )
+                batch_id = cur.lastrowid
+                cols = "".join(", " + _quote(k) for k in keys)
+                marks = ", ?" * len(keys)
+                self._conn.executemany(
+                    f"INSERT INTO {_quote(name)} (batch_id, payload{cols}) VALUES (?, ?{marks})",
+                    ([batch_id, p] + [_key(rec.get(k)) for k in keys] for p, rec in zip(payloads, records)),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return batch_id
+
+    def _select(self, source_id: str, table: str, where: str = "", params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            name = self._sql_name(source_id, table)
+            if name is None:
+                return []
+            rows = self._conn.execute(f"SELECT payload FROM {_quote(name)} {where} ORDER BY seq", params).fetchall()
+        return [json.loads(p) for (p,) in rows]
+
+    def read(self, source_id: str, table: str) -> List[Dict[str, Any]]:
+        """Return every record of the table in append order ([] if it does not exist)."""
+        return self._select(source_id, table)
+
+    def read_where(self, source_id: str, table: str, field: str, value: Any) -> List[Dict[str, Any]]:
+        """Return records whose field equals value (compared as text with str(), like the in-memory scan), in
+        append order. Index lookup for KEY_FIELDS, whose columns hold str() of the value; other fields are
+        matched in Python over the decoded payloads, since SQLite renders JSON values as text differently
+        (true is "1", not "True")."""
+        want = str(value)
+        if field in KEY_FIELDS.get(table, ()):
+            return self._select(source_id, table, f"WHERE {_quote(field)} = ?", (want,))
+        return [r for r in self._select(source_id, table) if r.get(field) is not None and str(r[field]) == want]
+
+    def read_range(self, source_id: str, table: str, start: int, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return records at append positions [start, stop) (primary key range)."""
+        # seq is 1-based in SQLite (INTEGER PRIMARY KEY); positions are 0-based.
+        if stop is None:
+            return self._select(source_id, table, "WHERE seq > ?", (start,))
+        return self._select(source_id, table, "WHERE seq > ? AND seq <= ?", (start, stop))
+
+    def tables(self) -> List[Tuple[str, str]]:
+        """Return (source_id, table) of every stored table."""
+        with self._lock:
+            return [tuple(r) for r in self._conn.execute("SELECT source_id, table_name FROM _bronze_tables")]
+
+    def _stats(self, where: str = "", params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t.source_id, t.table_name, COALESCE(SUM(b.row_count), 0), COALESCE(SUM(b.bytes), 0), "
+                "MAX(b.created_at), COUNT(b.batch_id) FROM _bronze_tables t LEFT JOIN _bronze_batches b "
+                f"ON b.source_id = t.source_id AND b.table_name = t.table_name {where} "
+                "GROUP BY t.source_id, t.table_name",
+                params,
+            ).fetchall()
+        return [
+            {"source_id": s, "table": t, "row_count": n, "bytes": size, "updated_at": at, "batches": batches}
+            for s, t, n, size, at, batches in rows
+        ]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return source_id, table, row_count, bytes, updated_at and batches per table, from batch metadata."""
+        return self._stats()
+
+    def table_stats(self, source_id: str, table: str) -> Optional[Dict[str, Any]]:
+        """Return stats() for one table (one indexed lookup), or None if it does not exist."""
+        rows = self._stats("WHERE t.source_id = ? AND t.table_name = ?", (source_id, table))
+        return rows[0] if rows else None
+
+    def drop(self, source_id: str, table: str) -> None:
+        """Drop a table and its batch metadata."""
+        with self._lock:
+            name = self._sql_name(source_id, table)
+            if name is None:
+                return
+            self._conn.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+            self._conn.execute(
+                "DELETE FROM _bronze_tables WHERE source_id = ? AND table_name = ?", (source_id, table)
+            )
+            self._conn.execute(
+                "DELETE FROM _bronze_batches WHERE source_id = ? AND table_name = ?", (source_id, table)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,38 @@
-"""Bronze store: raw records per source and table. In-memory with optional local file persistence."""
+"""Bronze store: raw records per source and table. In-memory with optional local file persistence.
+
+Persistence backend (config.get_bronze_backend): append-only JSONL files (loaded into memory on first use), or
+an indexed SQLite database (bronze.sqlite_backend). With SQLite no rows are held in memory: get_raw / iter_raw
+read the table from the database, get_where / get_range read by index, and counts come from batch metadata.
+"""
 
 import json
 import os
+import time
+from itertools import count
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from analytics_foundry.bronze.sqlite_backend import DB_FILENAME, SqliteBronze
+from analytics_foundry.config import get_bronze_backend
+from analytics_foundry.metrics import BRONZE_RECORDS, timed
 
 _RAW: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
 
+# Version per (source_id, table); bumped on every append, disk load and clear. Used to key derived caches.
+_VERSIONS: Dict[Tuple[str, str], int] = {}
+_VERSION_COUNTER = count(1)
+
+# Per-table stats maintained on write: JSONL-encoded bytes and last-updated time (epoch seconds).
+_BYTES: Dict[Tuple[str, str], int] = {}
+_UPDATED_AT: Dict[Tuple[str, str], float] = {}
+# Line counts of files not yet loaded, keyed by path and (size, mtime) so they are counted once.
+_DISK_COUNTS: Dict[Path, Tuple[Tuple[int, float], int]] = {}
+
+# Change listeners: fn(source_id, table, records) after records land in a table (append or disk load);
+# records is None when the table was reset by clear(). Used by incrementally maintained indexes.
+ChangeListener = Callable[[str, str, Optional[List[Dict[str, Any]]]], None]
+_LISTENERS: List[ChangeListener] = []
+
 # Override for tests; when None, get_data_root() reads from env.
 _DATA_ROOT_OVERRIDE: str | None = None
 
@@ -34,15 +60,63 @@ def _bronze_path(source_id: str, table: str) -> Path | None:
     return root / "bronze" / source_id / f"{table}.jsonl"
 
 
+# Open SQLite backends per database path.
+_SQLITE: Dict[Path, SqliteBronze] = {}
+
+
+def _sqlite() -> Optional[SqliteBronze]:
+    """Return the SQLite backend when selected and a data root is set, else None (JSONL or memory only)."""
+    if get_bronze_backend() != "sqlite":
+        return None
+    root = get_data_root()
+    if root is None:
+        return None
+    path = root / "bronze" / DB_FILENAME
+    db = _SQLITE.get(path)
+    if db is None:
+        db = _SQLITE[path] = SqliteBronze(path)
+    return db
+
+
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _bump_version(key: Tuple[str, str]) -> None:
+    _VERSIONS[key] = next(_VERSION_COUNTER)
+
+
+def subscribe(listener: ChangeListener) -> None:
+    """Register a change listener (idempotent)."""
+    if listener not in _LISTENERS:
+        _LISTENERS.append(listener)
+
+
+def _notify(source_id: str, table: str, records: Optional[List[Dict[str, Any]]]) -> None:
+    for listener in list(_LISTENERS):
+        listener(source_id, table, records)
+
+
 def _load_table(source_id: str, table: str) -> None:
-    """Load one table from disk into _RAW if it exists and key not already populated."""
+    """Load one table from disk into _RAW if it exists and key not already populated.
+
+    With the SQLite backend rows stay in the database: a table persisted before this process touched it is only
+    attached (stats read, version assigned). Listeners are not notified, since reads already saw its rows.
+    """
     key = (source_id, table)
     if key in _RAW:
         return
+    db = _sqlite()
+    if db is not None:
+        # _BYTES holds every table attached or appended to since the last clear.
+        if key in _BYTES:
+            return
+        stats = db.table_stats(source_id, table)
+        if stats is None:
+            return
+        _BYTES[key], _UPDATED_AT[key] = stats["bytes"], stats["updated_at"]
+        _bump_version(key)
+        return
     p = _bronze_path(source_id, table)
     if p is None or not p.is_file():
         return
@@ -56,10 +130,22 @@ def _load_table(source_id: str, table: str) -> None:
     except (json.JSONDecodeError, OSError):
         pass
     _RAW[key] = rows
+    try:
+        st = p.stat()
+        _BYTES[key], _UPDATED_AT[key] = st.st_size, st.st_mtime
+    except OSError:
+        pass
+    _bump_version(key)
+    _notify(source_id, table, rows)
 
 
 def load_from_disk() -> None:
     """Load all bronze tables from the data directory into memory. No-op if no data root."""
+    db = _sqlite()
+    if db is not None:
+        for source_id, table in db.tables():
+            _load_table(source_id, table)
+        return
     root = get_data_root()
     if root is None:
         return
@@ -76,48 +162,187 @@ def load_from_disk() -> None:
                 _load_table(source_id, table)
 
 
+@timed
 def append_raw(source_id: str, table: str, records: List[Dict[str, Any]]) -> None:
-    """Append raw records to a bronze table. Persists to local file if FOUNDRY_DATA_DIR is set."""
+    """Append raw records to a bronze table. Persists to local file (or the SQLite backend, as one batch)
+    if FOUNDRY_DATA_DIR is set."""
     key = (source_id, table)
-    if key not in _RAW:
-        _RAW[key] = []
-    _RAW[key].extend(records)
-
-    p = _bronze_path(source_id, table)
-    if p is not None:
-        _ensure_dir(p.parent)
-        with open(p, "a", encoding="utf-8") as f:
-            for rec in records:
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    lines = [json.dumps(rec, ensure_ascii=False) for rec in records]
+    db = _sqlite()
+    if db is not None:
+        # Attach first, so stats include batches persisted before this process.
+        _load_table(source_id, table)
+        db.append(source_id, table, lines, records)
+        _BYTES[key] = _BYTES.get(key, 0) + sum(len(line.encode("utf-8")) + 1 for line in lines)
+    else:
+        _RAW.setdefault(key, []).extend(records)
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        _BYTES[key] = _BYTES.get(key, 0) + len(data)
+        p = _bronze_path(source_id, table)
+        if p is not None:
+            _ensure_dir(p.parent)
+            with open(p, "ab") as f:
+                f.write(data)
+    _bump_version(key)
+    BRONZE_RECORDS.inc(key, len(records))
+    _UPDATED_AT[key] = time.time()
+    _notify(source_id, table, records)
 
 
+@timed
 def get_raw(source_id: str, table: str) -> List[Dict[str, Any]]:
-    """Return all raw records for (source_id, table). Loads from disk if not in memory and data root set."""
+    """Return all raw records for (source_id, table). Loads from disk if not in memory and data root set
+    (read from the database each call with the SQLite backend)."""
+    db = _sqlite()
+    if db is not None:
+        return db.read(source_id, table)
     _load_table(source_id, table)
     return _RAW.get((source_id, table), []).copy()
 
 
-def list_tables() -> List[Tuple[str, str, int]]:
-    """Return list of (source_id, table, row_count). Includes tables on disk if data root set."""
+def iter_raw(source_id: str, table: str) -> Iterator[Dict[str, Any]]:
+    """Iterate raw records for (source_id, table) without copying the table (for streaming reads)."""
+    db = _sqlite()
+    if db is not None:
+        return iter(db.read(source_id, table))
+    _load_table(source_id, table)
+    return iter(_RAW.get((source_id, table), ()))
+
+
+@timed
+def get_where(source_id: str, table: str, field: str, value: Any) -> List[Dict[str, Any]]:
+    """Return records whose field equals value (compared as text, like silver keys), in append order.
+
+    With the SQLite backend this is an index lookup for key fields (league_id, player_id, ...); otherwise a
+    scan of the in-memory table.
+    """
+    db = _sqlite()
+    if db is not None:
+        return db.read_where(source_id, table, field, value)
+    want = str(value)
+    return [r for r in iter_raw(source_id, table) if r.get(field) is not None and str(r.get(field)) == want]
+
+
+@timed
+def get_range(source_id: str, table: str, start: int, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Return records at append positions [start, stop) (primary key range with the SQLite backend)."""
+    db = _sqlite()
+    if db is not None:
+        return db.read_range(source_id, table, start, stop)
+    _load_table(source_id, table)
+    return _RAW.get((source_id, table), [])[start:stop]
+
+
+def get_version(source_id: str, table: str) -> int:
+    """Return the current version of (source_id, table); changes whenever its records change. 0 if never written."""
+    _load_table(source_id, table)
+    return _VERSIONS.get((source_id, table), 0)
+
+
+def row_count(source_id: str, table: str) -> int:
+    """Return the number of records in (source_id, table) without copying them."""
+    db = _sqlite()
+    if db is not None:
+        stats = db.table_stats(source_id, table)
+        return 0 if stats is None else stats["row_count"]
+    _load_table(source_id, table)
+    return len(_RAW.get((source_id, table), ()))
+
+
+def _disk_tables() -> List[Tuple[str, str, Path]]:
     root = get_data_root()
-    if root is not None:
-        bronze_dir = root / "bronze"
-        if bronze_dir.is_dir():
-            for source_dir in bronze_dir.iterdir():
-                if source_dir.is_dir():
-                    for f in source_dir.iterdir():
-                        if f.suffix == ".jsonl":
-                            _load_table(source_dir.name, f.stem)
+    if root is None:
+        return []
+    bronze_dir = root / "bronze"
+    if not bronze_dir.is_dir():
+        return []
     return [
-        (source_id, table, len(rows))
-        for (source_id, table), rows in _RAW.items()
+        (source_dir.name, f.stem, f)
+        for source_dir in bronze_dir.iterdir() if source_dir.is_dir()
+        for f in source_dir.iterdir() if f.suffix == ".jsonl"
     ]
 
 
+def _count_lines(p: Path, st: os.stat_result) -> int:
+    """Count JSONL lines without parsing them; cached per (size, mtime)."""
+    sig = (st.st_size, st.st_mtime)
+    cached = _DISK_COUNTS.get(p)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    n = 0
+    last = b"\n"
+    with open(p, "rb") as f:
+        while chunk := f.read(1 << 20):
+            n += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        n += 1
+    _DISK_COUNTS[p] = (sig, n)
+    return n
+
+
+def table_stats() -> List[Dict[str, Any]]:
+    """Return per-table stats without loading tables: source_id, table, row_count, bytes, updated_at, version.
+
+    Tables only on disk are counted by lines (no JSON parsing), or read from SQLite batch metadata; their
+    version is None until loaded (attached, with SQLite).
+    """
+    out: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for key, rows in _RAW.items():
+        out[key] = {
+            "source_id": key[0],
+            "table": key[1],
+            "row_count": len(rows),
+            "bytes": _BYTES.get(key, 0),
+            "updated_at": _UPDATED_AT.get(key),
+            "version": _VERSIONS.get(key),
+        }
+    db = _sqlite()
+    if db is not None:
+        for t in db.stats():
+            key = (t["source_id"], t["table"])
+            if key not in out:
+                out[key] = {k: t[k] for k in ("source_id", "table", "row_count", "bytes", "updated_at")}
+                out[key]["version"] = _VERSIONS.get(key) if key in _BYTES else None
+        return list(out.values())
+    for source_id, table, p in _disk_tables():
+        if (source_id, table) in out:
+            continue
+        try:
+            st = p.stat()
+            n = _count_lines(p, st)
+        except OSError:
+            continue
+        out[(source_id, table)] = {
+            "source_id": source_id,
+            "table": table,
+            "row_count": n,
+            "bytes": st.st_size,
+            "updated_at": st.st_mtime,
+            "version": None,
+        }
+    return list(out.values())
+
+
+def list_tables() -> List[Tuple[str, str, int]]:
+    """Return list of (source_id, table, row_count). Includes tables on disk if data root set (counted, not loaded)."""
+    return [(t["source_id"], t["table"], t["row_count"]) for t in table_stats()]
+
+
 def clear() -> None:
-    """Clear all bronze data from memory and remove persisted files (for tests)."""
-    root = get_data_root()
-    for (source_id, table) in list(_RAW.keys()):
+    """Clear all bronze data from memory and remove persisted files (for tests).
+
+    Every persisted table is dropped, including tables on disk or in the SQLite backend that were never loaded;
+    listeners are notified (records None) for each, so derived state (indexes, published snapshots) is reset.
+    """
+    db = _sqlite()
+    keys = set(_RAW)
+    if db is not None:
+        keys.update(db.tables())
+    keys.update((source_id, table) for source_id, table, _ in _disk_tables())
+    for (source_id, table) in keys:
+        if db is not None:
+            db.drop(source_id, table)
         p = _bronze_path(source_id, table)
         if p is not None and p.is_file():
             try:
@@ -125,3 +350,9 @@ def clear() -> None:
             except OSError:
                 pass
     _RAW.clear()
+    _BYTES.clear()
+    _UPDATED_AT.clear()
+    _DISK_COUNTS.clear()
+    for key in sorted(keys | set(_VERSIONS)):
+        _bump_version(key)
+        _notify(key[0], key[1], None)
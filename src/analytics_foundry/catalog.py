@@ -0,0 +1,214 @@
+"""Statistics catalog: per-table row counts, bytes, distinct keys, last update and version, maintained on write.
+
+Bronze stats come from the store (kept on append; files not yet loaded are line-counted, never parsed) plus a
+HyperLogLog sketch of distinct record keys fed by bronze change listeners. Silver/gold stats are read from
+the dataset DAG's cached values only — a dataset that is not built reports row_count and bytes None — so
+listing tables never triggers a rebuild. Their bytes are an in-memory estimate (estimate_bytes over every
+cached partition: sys.getsizeof of the objects reachable from the value, shared objects counted once),
+computed once per built version and reused until the dataset changes.
+"""
+
+import math
+import sys
+import threading
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.silver import injuries as silver_injuries
+
+# Record fields that identify a row, per bronze table name (distinct keys = distinct values of these).
+BRONZE_KEY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "players": ("player_id",),
+    "league": ("league_id",),
+    "rosters": ("league_id", "roster_id"),
+    "matchups": ("league_id", "week", "roster_id"),
+}
+
+# Admin table name -> DAG dataset, per derived layer.
+DATASETS: Dict[str, List[Tuple[str, str]]] = {
+    "silver": [
+        ("players", "silver.players"),
+        ("league", "silver.leagues"),
+        ("rosters", "silver.rosters"),
+        ("injuries", "silver.injuries"),
+    ],
+    "gold": [
+        ("available_players", "gold.available_players"),
+        ("injury", "gold.injury"),
+    ],
+}
+
+_HLL_PRECISION = 12
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch: 2**p one-byte registers, ~1.04 / sqrt(2**p) relative error (p=12: ~1.6%).
+
+    Uses Python's hash(), so estimates are per process (sketches are rebuilt from data on load).
+    """
+
+    __slots__ = ("p", "registers")
+
+    def __init__(self, p: int = _HLL_PRECISION):
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add(self, value: Hashable) -> None:
+        h = hash((value,)) & 0xFFFFFFFFFFFFFFFF
+        bits = 64 - self.p
+        idx = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def update(self, values: Iterable[Hashable]) -> None:
+        for v in values:
+            self.add(v)
+
+    def count(self) -> int:
+        """Return the estimated number of distinct values added."""
+        regs = self.registers
+        m = len(regs)
+        est = (0.7213 / (1 + 1.079 / m)) * m * m / sum(2.0 ** -r for r in regs)
+        zeros = regs.count(0)
+        if est <= 2.5 * m and zeros:
+            # Small-range correction (linear counting).
+            est = m * math.log(m / zeros)
+        return round(est)
+
+
+_LOCK = threading.Lock()
+_SKETCHES: Dict[Tuple[str, str], HyperLogLog] = {}
+
+
+def _keys(table: str, records: Iterable[Dict[str, Any]]) -> Iterable[Hashable]:
+    fields = BRONZE_KEY_FIELDS[table]
+    if len(fields) == 1:
+        (f,) = fields
+        return (str(r.get(f)) for r in records if r.get(f) is not None)
+    return (tuple(str(r.get(f)) for f in fields) for r in records if r.get(fields[0]) is not None)
+
+
+def _sketch(source_id: str, table: str) -> Optional[HyperLogLog]:
+    """Return the table's sketch, seeding it from the loaded table the first time. Caller holds _LOCK."""
+    if table not in BRONZE_KEY_FIELDS:
+        return None
+    key = (source_id, table)
+    hll = _SKETCHES.get(key)
+    if hll is None:
+        hll = _SKETCHES[key] = HyperLogLog()
+        hll.update(_keys(table, bronze_store.iter_raw(source_id, table)))
+    return hll
+
+
+def _on_bronze_change(source_id: str, table: str, records: Optional[List[Dict[str, Any]]]) -> None:
+    with _LOCK:
+        key = (source_id, table)
+        if records is None:
+            _SKETCHES.pop(key, None)
+        elif table in BRONZE_KEY_FIELDS:
+            if key in _SKETCHES:
+                _SKETCHES[key].update(_keys(table, records))
+            else:
+                # Seeds from the whole table, which already includes records.
+                _sketch(source_id, table)
+
+
+bronze_store.subscribe(_on_bronze_change)
+
+
+def bronze_stats() -> List[Dict[str, Any]]:
+    """Return bronze tables with row_count, bytes, distinct_keys (None if unknown), updated_at and version."""
+    out = []
+    for t in bronze_store.table_stats():
+        distinct = None
+        if t["version"] is not None:
+            with _LOCK:
+                hll = _sketch(t["source_id"], t["table"])
+            distinct = hll.count() if hll is not None else None
+        out.append({"layer": "bronze", **t, "distinct_keys": distinct})
+    return out
+
+
+def estimate_bytes(value: Any) -> int:
+    """Estimate the memory held by value: sys.getsizeof over it and every object reachable through containers
+    (list, tuple, set, dict, deque) and __slots__/__dict__ attributes, each object counted once."""
+    seen: set = set()
+    total = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        else:
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+    return total
+
+
+# Dataset -> (versions of its cached partitions, estimated bytes).
+_SIZES: Dict[str, Tuple[Tuple[Any, ...], int]] = {}
+
+
+def _bytes(dataset: str) -> Optional[int]:
+    """Estimated bytes of a dataset's cached partitions (None if none is built), recomputed only on change."""
+    if dataset == "silver.injuries":
+        parts = silver_injuries.index_parts()
+        values = {} if parts is None else {None: parts}
+    else:
+        values = dag.cached(dataset)
+    if not values:
+        return None
+    versions = tuple(sorted((str(p), dag.version(dataset, p)) for p in values))
+    with _LOCK:
+        cached = _SIZES.get(dataset)
+    if cached is not None and cached[0] == versions:
+        return cached[1]
+    size = sum(estimate_bytes(v) for v in values.values())
+    with _LOCK:
+        _SIZES[dataset] = (versions, size)
+    return size
+
+
+def _row_count(dataset: str) -> Optional[int]:
+    if dataset == "silver.injuries":
+        return silver_injuries.count()
+    value = dag.peek(dataset)
+    return len(value) if value is not None else None
+
+
+def dataset_stats(layer: str, name: str, dataset: str) -> Dict[str, Any]:
+    """Return stats of a derived dataset from its cached value; row_count/bytes None when not built (no rebuild)."""
+    n = _row_count(dataset)
+    return {
+        "layer": layer,
+        "name": name,
+        "row_count": n,
+        # Silver/gold datasets are deduplicated by key.
+        "distinct_keys": n,
+        "bytes": _bytes(dataset),
+        "updated_at": dag.built_at(dataset),
+        "version": dag.version(dataset),
+    }
+
+
+def list_tables() -> Dict[str, List[Dict[str, Any]]]:
+    """Return {bronze, silver, gold} table stats, O(number of tables)."""
+    out: Dict[str, List[Dict[str, Any]]] = {"bronze": bronze_stats()}
+    for layer, datasets in DATASETS.items():
+        out[layer] = [dataset_stats(layer, name, ds) for name, ds in datasets]
+    return out
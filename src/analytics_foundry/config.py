@@ -9,3 +9,129 @@ DEFAULT_LEAGUE_ID = os.environ.get("FOUNDRY_DEFAULT_LEAGUE_ID", "126189476294480
 def get_default_league_id() -> str:
     """Return the configured default league ID."""
     return DEFAULT_LEAGUE_ID
+
+
+def get_silver_workers() -> int:
+    """Return process count for parallel silver rebuilds (FOUNDRY_SILVER_WORKERS; 0 = all CPUs, default 1 = serial)."""
+    raw = os.environ.get("FOUNDRY_SILVER_WORKERS", "1").strip()
+    try:
+        workers = int(raw)
+    except ValueError:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+# Recommendation score weights per feature (see gold.scoring). FOUNDRY_SCORE_WEIGHTS overrides some or all,
+# e.g. "trending=1,injury=2,position_need=0".
+DEFAULT_SCORE_WEIGHTS = {
+    "trending": 1.0,
+    "age": 0.5,
+    "injury": 2.0,
+    "matchup_points": 0.1,
+    "position_need": 1.0,
+}
+
+
+def get_score_weights() -> dict[str, float]:
+    """Return recommendation score weights: DEFAULT_SCORE_WEIGHTS overridden by FOUNDRY_SCORE_WEIGHTS (name=weight, comma-separated)."""
+    weights = dict(DEFAULT_SCORE_WEIGHTS)
+    for part in os.environ.get("FOUNDRY_SCORE_WEIGHTS", "").split(","):
+        name, sep, value = part.partition("=")
+        name = name.strip()
+        if not sep or name not in weights:
+            continue
+        try:
+            weights[name] = float(value)
+        except ValueError:
+            continue
+    return weights
+
+
+def get_gold_cache_bytes() -> int:
+    """Return the memory bound for cached gold API responses (FOUNDRY_GOLD_CACHE_BYTES; default 64 MiB, 0 = off)."""
+    raw = os.environ.get("FOUNDRY_GOLD_CACHE_BYTES", "").strip()
+    try:
+        return max(0, int(raw)) if raw else 64 * 1024 * 1024
+    except ValueError:
+        return 64 * 1024 * 1024
+
+
+def get_league_ttl_seconds() -> float:
+    """Return how long an ingested league is served without re-fetching (FOUNDRY_LEAGUE_TTL_SECONDS; default 0 =
+    fetch on every request; a positive TTL opts in to serving league data up to that many seconds old)."""
+    raw = os.environ.get("FOUNDRY_LEAGUE_TTL_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else 0.0
+    except ValueError:
+        return 0.0
+
+
+def get_ingest_workers() -> int:
+    """Return thread count for concurrent league ingests in batch requests (FOUNDRY_INGEST_WORKERS; default 8)."""
+    raw = os.environ.get("FOUNDRY_INGEST_WORKERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else 8
+    except ValueError:
+        return 8
+
+
+def get_compute_workers() -> int:
+    """Return thread count of the bounded executor async endpoints offload silver/gold work to
+    (FOUNDRY_COMPUTE_WORKERS; default 4)."""
+    raw = os.environ.get("FOUNDRY_COMPUTE_WORKERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else 4
+    except ValueError:
+        return 4
+
+
+# SQL execution backends for silver/gold builds: "python" (columnar transforms) or "sqlite" (sql/ artifacts).
+SQL_ENGINES = ("python", "sqlite")
+
+
+def get_sql_engine() -> str:
+    """Return the build backend (FOUNDRY_SQL_ENGINE: python or sqlite; default python)."""
+    raw = os.environ.get("FOUNDRY_SQL_ENGINE", "").strip().lower()
+    return raw if raw in SQL_ENGINES else "python"
+
+
+# Bronze storage backends: "jsonl" (append-only JSON Lines files) or "sqlite" (indexed local database).
+BRONZE_BACKENDS = ("jsonl", "sqlite")
+
+
+def get_bronze_backend() -> str:
+    """Return the bronze storage backend (FOUNDRY_BRONZE_BACKEND: jsonl or sqlite; default jsonl)."""
+    raw = os.environ.get("FOUNDRY_BRONZE_BACKEND", "").strip().lower()
+    return raw if raw in BRONZE_BACKENDS else "jsonl"
+
+
+# Data planes: "local" (each process ingests and builds its own silver data) or "snapshot" (read-only workers
+# serve silver data mapped from snapshot files published by one writer; see analytics_foundry.snapshot).
+DATA_PLANES = ("local", "snapshot")
+
+
+def get_data_plane() -> str:
+    """Return the data plane (FOUNDRY_DATA_PLANE: local or snapshot; default local)."""
+    raw = os.environ.get("FOUNDRY_DATA_PLANE", "").strip().lower()
+    return raw if raw in DATA_PLANES else "local"
+
+
+def get_snapshot_poll_seconds() -> float:
+    """Return how often snapshot workers check for a newly published snapshot (FOUNDRY_SNAPSHOT_POLL_SECONDS;
+    default 1)."""
+    raw = os.environ.get("FOUNDRY_SNAPSHOT_POLL_SECONDS", "").strip()
+    try:
+        return max(0.05, float(raw)) if raw else 1.0
+    except ValueError:
+        return 1.0
+
+
+def get_prewarm_league_ids() -> list[str]:
+    """Return leagues to prewarm after startup: the default league, then FOUNDRY_PREWARM_LEAGUES (comma-separated).
+    Prewarming fetches from the source, so it is opt-in: empty unless FOUNDRY_PREWARM=1."""
+    if os.environ.get("FOUNDRY_PREWARM", "0").strip().lower() not in ("1", "true", "yes", "on"):
+        return []
+    extra = [lid.strip() for lid in os.environ.get("FOUNDRY_PREWARM_LEAGUES", "").split(",")]
+    return list(dict.fromkeys([get_default_league_id(), *(lid for lid in extra if lid)]))
@@ -0,0 +1,324 @@
+"""Medallion dataset DAG: silver/gold datasets declare their inputs; bronze writes mark only dependents dirty.
+
+Nodes are named by layer ("bronze.nfl_sleeper.players", "silver.players", "gold.available_players").
+Datasets may be partitioned by league_id: a bronze write whose records carry the partition field only
+dirties those partitions downstream, so a roster change in one league never invalidates player-level or
+other-league outputs. Dirty datasets are rebuilt lazily on the next get(). Every (dataset, partition)
+has a version that changes whenever it is dirtied, for keying downstream caches.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from analytics_foundry import metrics
+from analytics_foundry.bronze import store as bronze_store
+
+# Sentinel partition set: every partition of a dataset.
+ALL = None
+
+Partitions = Optional[Set[str]]
+
+
+class Dataset:
+    """A registered node: name, input node names, optional build function and partitioning."""
+
+    __slots__ = ("name", "inputs", "build", "partitioned", "max_partitions", "on_change", "build_many")
+
+    def __init__(
+        self,
+        name: str,
+        inputs: Tuple[str, ...],
+        build: Optional[Callable[..., Any]],
+        partitioned: bool,
+        max_partitions: Optional[int],
+        on_change: Optional[Callable[[Optional[List[Dict[str, Any]]]], None]],
+        build_many: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+    ):
+        self.name = name
+        self.inputs = inputs
+        self.build = build
+        self.partitioned = partitioned
+        self.max_partitions = max_partitions
+        self.on_change = on_change
+        self.build_many = build_many
+
+
+_LOCK = threading.RLock()
+_DATASETS: Dict[str, Dataset] = {}
+_DEPENDENTS: Dict[str, List[str]] = {}
+# Bronze node -> record field whose value names the partition (e.g. rosters by league_id).
+_BRONZE_PARTITION_FIELD: Dict[str, str] = {}
+# Dataset -> partition -> built value (LRU order when max_partitions is set).
+_CACHE: Dict[str, "OrderedDict[Optional[str], Any]"] = {}
+_COUNTER = count(1)
+# Version = max(epoch of the dataset, version of the partition); both come from one monotonic counter.
+_EPOCH: Dict[str, int] = {}
+_PART_VERSION: Dict[Tuple[str, Optional[str]], int] = {}
+# (dataset, partition) -> time its cached value was built (epoch seconds).
+_BUILT_AT: Dict[Tuple[str, Optional[str]], float] = {}
+
+
+def bronze_node(source_id: str, table: str) -> str:
+    """Return the DAG node name for a bronze table."""
+    return f"bronze.{source_id}.{table}"
+
+
+def partition_bronze(source_id: str, table: str, field: str) -> None:
+    """Declare that records of a bronze table are partitioned by field (e.g. league_id)."""
+    _BRONZE_PARTITION_FIELD[bronze_node(source_id, table)] = field
+
+
+def register(
+    name: str,
+    inputs: Iterable[str],
+    build: Optional[Callable[..., Any]] = None,
+    partitioned: bool = False,
+    max_partitions: Optional[int] = None,
+    on_change: Optional[Callable[[Optional[List[Dict[str, Any]]]], None]] = None,
+    build_many: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+) -> None:
+    """Register a dataset. build() (or build(partition) when partitioned) computes it from its inputs.
+
+    Datasets without build are tracked only (versions and lineage); their module maintains the value,
+    e.g. an incremental index fed by on_change(records) — called with each bronze input's new records
+    (None on reset) before dependents are dirtied. max_partitions bounds cached partitions (LRU).
+    build_many(partitions) -> {partition: value} optionally builds many partitions in one pass (get_many).
+    """
+    ds = Dataset(name, tuple(inputs), build, partitioned, max_partitions, on_change, build_many)
+    with _LOCK:
+        old = _DATASETS.get(name)
+        if old is not None:
+            for inp in old.inputs:
+                _DEPENDENTS.get(inp, []).remove(name)
+        _DATASETS[name] = ds
+        for inp in ds.inputs:
+            _DEPENDENTS.setdefault(inp, []).append(name)
+        _CACHE.pop(name, None)
+        _EPOCH[name] = next(_COUNTER)
+
+
+def unregister(name: str) -> None:
+    """Remove a dataset (for tests)."""
+    with _LOCK:
+        ds = _DATASETS.pop(name, None)
+        if ds is not None:
+            for inp in ds.inputs:
+                _DEPENDENTS.get(inp, []).remove(name)
+        _CACHE.pop(name, None)
+
+
+def _key_partition(ds: Dataset, partition: Optional[str]) -> Optional[str]:
+    return partition if ds.partitioned else None
+
+
+def version(name: str, partition: Optional[str] = None) -> int:
+    """Return the version of (dataset, partition); changes whenever it is dirtied.
+
+    Lock-free (plain dict reads), so modules holding their own locks can call it safely.
+    """
+    ds = _DATASETS.get(name)
+    p = _key_partition(ds, partition) if ds is not None else partition
+    return max(_EPOCH.get(name, 0), _PART_VERSION.get((name, p), 0))
+
+
+def is_dirty(name: str, partition: Optional[str] = None) -> bool:
+    """True if the dataset (partition) has no current built value."""
+    with _LOCK:
+        ds = _DATASETS[name]
+        return _key_partition(ds, partition) not in _CACHE.get(name, {})
+
+
+def get(name: str, partition: Optional[str] = None) -> Any:
+    """Return the dataset (partition), rebuilding it first if dirty.
+
+    For partitioned datasets partition None means "all partitions" (e.g. all leagues).
+    """
+    ds = _DATASETS[name]
+    if ds.build is None:
+        raise ValueError(f"Dataset {name} is maintained by its module, not built by the DAG")
+    p = _key_partition(ds, partition)
+    with _LOCK:
+        parts = _CACHE.get(name)
+        if parts is not None and p in parts:
+            parts.move_to_end(p)
+            return parts[p]
+        v = version(name, p)
+    t0 = time.perf_counter()
+    value = ds.build(p) if ds.partitioned else ds.build()
+    metrics.BUILD_SECONDS.observe((name,), time.perf_counter() - t0)
+    with _LOCK:
+        _store(ds, {p: value}, {p: v})
+    return value
+
+
+_MISSING = object()
+
+
+def peek(name: str, partition: Optional[str] = None, default: Any = None) -> Any:
+    """Return the cached value of (dataset, partition) without building it; default if dirty or unbuilt."""
+    with _LOCK:
+        ds = _DATASETS[name]
+        value = _CACHE.get(name, {}).get(_key_partition(ds, partition), _MISSING)
+    return default if value is _MISSING else value
+
+
+def cached(name: str) -> Dict[Optional[str], Any]:
+    """Return {partition: value} of every built partition of a dataset (None for unpartitioned), without building."""
+    with _LOCK:
+        return dict(_CACHE.get(name, {}))
+
+
+def built_at(name: str, partition: Optional[str] = None) -> Optional[float]:
+    """Return when (dataset, partition) was last built (epoch seconds), or None if never."""
+    ds = _DATASETS.get(name)
+    p = _key_partition(ds, partition) if ds is not None else partition
+    return _BUILT_AT.get((name, p))
+
+
+def _store(ds: Dataset, values: Dict[Optional[str], Any], versions: Dict[Optional[str], int]) -> None:
+    """Cache built values, skipping any partition dirtied while it was being built. Caller holds _LOCK."""
+    parts = _CACHE.setdefault(ds.name, OrderedDict())
+    now = time.time()
+    for p, value in values.items():
+        if version(ds.name, p) == versions[p]:
+            parts[p] = value
+            _BUILT_AT[(ds.name, p)] = now
+    if ds.max_partitions is not None:
+        while len(parts) > ds.max_partitions:
+            parts.popitem(last=False)
+
+
+def get_many(name: str, partitions: Iterable[str]) -> Dict[str, Any]:
+    """Return {partition: value} for a partitioned dataset, building all dirty partitions in one pass
+    (build_many when registered, else build per partition)."""
+    ds = _DATASETS[name]
+    if ds.build is None or not ds.partitioned:
+        raise ValueError(f"Dataset {name} is not a DAG-built partitioned dataset")
+    wanted = list(dict.fromkeys(partitions))
+    out: Dict[str, Any] = {}
+    versions: Dict[Optional[str], int] = {}
+    with _LOCK:
+        parts = _CACHE.get(name, {})
+        for p in wanted:
+            if p in parts:
+                out[p] = parts[p]
+            else:
+                versions[p] = version(name, p)
+    missing = list(versions)
+    if missing:
+        t0 = time.perf_counter()
+        if ds.build_many is not None:
+            built = ds.build_many(missing)
+        else:
+            built = {p: ds.build(p) for p in missing}
+        metrics.BUILD_SECONDS.observe((name,), time.perf_counter() - t0)
+        with _LOCK:
+            _store(ds, built, versions)
+        out.update(built)
+    return {p: out[p] for p in wanted}
+
+
+def _dirty(name: str, partitions: Partitions) -> None:
+    """Dirty partitions of one dataset (ALL = every partition) and bump their versions."""
+    ds = _DATASETS.get(name)
+    if ds is not None and ds.partitioned and partitions is not ALL:
+        parts = _CACHE.get(name)
+        # The "all partitions" view (partition None) depends on every partition.
+        for p in list(partitions) + [None]:
+            _PART_VERSION[(name, p)] = next(_COUNTER)
+            if parts is not None:
+                parts.pop(p, None)
+    else:
+        _EPOCH[name] = next(_COUNTER)
+        _CACHE.pop(name, None)
+
+
+def invalidate(name: str, partitions: Partitions = ALL) -> None:
+    """Mark a node (and everything downstream of it) dirty. partitions limits it to those league partitions."""
+    with _LOCK:
+        _dirty(name, partitions)
+        _propagate(name, partitions)
+
+
+def _propagate(name: str, partitions: Partitions) -> None:
+    for dep in _DEPENDENTS.get(name, []):
+        ds = _DATASETS[dep]
+        dep_partitions = partitions if ds.partitioned else ALL
+        _dirty(dep, dep_partitions)
+        _propagate(dep, dep_partitions)
+
+
+def downstream(name: str) -> List[str]:
+    """Return every dataset that (transitively) depends on name, in dependency order."""
+    out: List[str] = []
+    seen: Set[str] = set()
+
+    def visit(n: str) -> None:
+        for dep in _DEPENDENTS.get(n, []):
+            if dep not in seen:
+                seen.add(dep)
+                visit(dep)
+                out.append(dep)
+
+    visit(name)
+    out.reverse()
+    return out
+
+
+def describe() -> List[Dict[str, Any]]:
+    """Return registered datasets with inputs, partitioning and build state (for admin/lineage views)."""
+    with _LOCK:
+        return [
+            {
+                "name": ds.name,
+                "inputs": list(ds.inputs),
+                "partitioned": ds.partitioned,
+                "maintained": ds.build is None,
+                "built_partitions": len(_CACHE.get(ds.name, {})),
+                "version": version(ds.name),
+            }
+            for ds in _DATASETS.values()
+        ]
+
+
+def replace_build(
+    name: str,
+    build: Optional[Callable[..., Any]],
+    build_many: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+) -> Tuple[Optional[Callable[..., Any]], Optional[Callable[[List[str]], Dict[str, Any]]]]:
+    """Swap a dataset's build functions, keeping its inputs, partitioning and dependents; returns the old
+    (build, build_many). The dataset and everything downstream are dirtied."""
+    with _LOCK:
+        ds = _DATASETS[name]
+        old = (ds.build, ds.build_many)
+        ds.build, ds.build_many = build, build_many
+        _dirty(name, ALL)
+        _propagate(name, ALL)
+    return old
+
+
+def reset_bronze(source_id: str, table: str) -> None:
+    """Treat a bronze table as replaced wholesale (as on bronze clear): module-maintained indexes reset and every
+    dependent is dirtied, without touching the bronze store itself."""
+    _on_bronze_change(source_id, table, None)
+
+
+def _on_bronze_change(source_id: str, table: str, records: Optional[List[Dict[str, Any]]]) -> None:
+    node = bronze_node(source_id, table)
+    field = _BRONZE_PARTITION_FIELD.get(node)
+    partitions: Partitions = ALL
+    if records is not None and field is not None:
+        partitions = {str(r[field]) for r in records if r.get(field) is not None}
+    with _LOCK:
+        for dep in _DEPENDENTS.get(node, []):
+            ds = _DATASETS[dep]
+            if ds.on_change is not None:
+                ds.on_change(records)
+        _dirty(node, partitions)
+        _propagate(node, partitions)
+
+
+bronze_store.subscribe(_on_bronze_change)
@@ -0,0 +1,62 @@
+"""Bounded executors for the async request path.
+
+Endpoints run on the event loop and hand blocking work to one of two thread pools, so a request only ever
+waits for its own kind of work: compute (silver/gold builds, serialization, compression; config
+get_compute_workers threads) and io (blocking source fetches of adapters without a native async ingest;
+config get_ingest_workers threads). Slow upstream fetches can fill the io pool without delaying cache hits,
+which never leave the loop. Pools are created on first use; shutdown() drops them (recreated when next used).
+Calls made while a profiling session is active (profiling.current()) run under that session's profiler.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from analytics_foundry import profiling
+from analytics_foundry.config import get_compute_workers, get_ingest_workers
+
+T = TypeVar("T")
+
+_LOCK = threading.Lock()
+_POOLS: Dict[str, ThreadPoolExecutor] = {}
+_SIZES: Dict[str, Callable[[], int]] = {"compute": get_compute_workers, "io": get_ingest_workers}
+
+
+def get_executor(kind: str) -> ThreadPoolExecutor:
+    """Return the process-wide "compute" or "io" pool."""
+    with _LOCK:
+        pool = _POOLS.get(kind)
+        if pool is None:
+            pool = _POOLS[kind] = ThreadPoolExecutor(max_workers=_SIZES[kind](), thread_name_prefix=f"foundry-{kind}")
+        return pool
+
+
+async def _run(kind: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs)
+    session = profiling.current()
+    if session is not None:
+        call = functools.partial(session.call, call)
+    return await loop.run_in_executor(get_executor(kind), call)
+
+
+async def run_compute(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run fn(*args, **kwargs) in the compute pool and await its result (exceptions propagate)."""
+    return await _run("compute", fn, *args, **kwargs)
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking I/O call in the io pool and await its result."""
+    return await _run("io", fn, *args, **kwargs)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down both pools (e.g. at app shutdown)."""
+    with _LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
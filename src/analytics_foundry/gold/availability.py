@@ -0,0 +1,159 @@
+"""Gold: per-league availability bitmaps over the silver player table.
+
+Each player's dense id is its row in the silver PlayerTable. A league's rostered players are one Python int
+used as a bitset (bit i = row i rostered), rebuilt only when that league's rosters or the player table
+change. Available players = ~rostered & all-players mask, gathered in row order a byte at a time.
+
+With FOUNDRY_SQL_ENGINE=sqlite a league's rostered rows are the complement of sql/gold/available_players.sql
+(the set-based anti-join run by sql_engine), so /players/available, the batch endpoint and recommendations all
+read availability from SQLite.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from analytics_foundry import dag, sql_engine
+from analytics_foundry.config import get_sql_engine
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver import rosters as silver_rosters
+
+# Bound cached bitmaps (one bit per player each, so ~1-2 KB per league).
+_MAX_CACHED_LEAGUES = 4096
+
+# Byte value -> positions of its set bits, for gathering.
+_BYTE_BITS = tuple(tuple(b for b in range(8) if v >> b & 1) for v in range(256))
+
+
+def all_players_mask(n: int) -> int:
+    """Bitmap with the first n bits set (every row of an n-row player table)."""
+    return (1 << n) - 1
+
+
+def bitmap_of_rows(rows: Iterable[int], n: int) -> int:
+    """Build a bitmap from row ids (< n) via a bytearray, so cost is O(rows + n/8) rather than O(rows * n)."""
+    buf = bytearray((n + 7) // 8)
+    for i in rows:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def rows_of_bitmap(bits: int) -> List[int]:
+    """Return the set bit positions of a bitmap in ascending order."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return [i << 3 | b for i, v in enumerate(data) if v for b in _BYTE_BITS[v]]
+
+
+def iter_bitmap_rows(bits: int, start: int = 0) -> Iterator[int]:
+    """Yield set bit positions >= start in ascending order, lazily, so a page gathers only what it needs."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for i in range(start >> 3, len(data)):
+        v = data[i]
+        if v:
+            base = i << 3
+            for b in _BYTE_BITS[v]:
+                if base | b >= start:
+                    yield base | b
+
+
+def bitmap_bytes(bits: int, n: int) -> bytes:
+    """Return an n-bit bitmap as little-endian bytes, for O(1) bit tests: b[i >> 3] >> (i & 7) & 1."""
+    return bits.to_bytes((max(n, bits.bit_length()) + 7) // 8, "little")
+
+
+def _rostered_bitmap(table: silver_players.PlayerTable, rostered_ids: Iterable[str]) -> int:
+    index_of = table.index_of
+    rows = (index_of(pid) for pid in rostered_ids)
+    return bitmap_of_rows((i for i in rows if i is not None), len(table))
+
+
+def _sql_rostered_bitmap(table: silver_players.PlayerTable, league_id: Optional[str]) -> int:
+    """Rostered rows as the complement of the players sql/gold/available_players.sql returns for the league."""
+    available = sql_engine.get_engine().query_columns(
+        "gold", "available_players", {"league_id": league_id}, keys=["player_id"]
+    )["player_id"]
+    return all_players_mask(len(table)) & ~_rostered_bitmap(table, available)
+
+
+def _build_rostered_bitmap(league_id: Optional[str]) -> int:
+    table = silver_players.get_player_table()
+    if get_sql_engine() == "sqlite":
+        return _sql_rostered_bitmap(table, league_id)
+    return _rostered_bitmap(table, silver_rosters.get_rostered_player_ids(league_id))
+
+
+def _build_rostered_bitmaps(league_ids: List[str]) -> Dict[str, int]:
+    table = silver_players.get_player_table()
+    if get_sql_engine() == "sqlite":
+        return {lid: _sql_rostered_bitmap(table, lid) for lid in league_ids}
+    ids = dag.get_many("silver.rostered_player_ids", league_ids)
+    return {lid: _rostered_bitmap(table, pids) for lid, pids in ids.items()}
+
+
+def _build_category_bitmaps() -> Dict[str, Dict[str, int]]:
+    """One bitmap per (categorical field, value), from one pass over each code column."""
+    table = silver_players.get_player_table()
+    size = (len(table) + 7) // 8
+    out: Dict[str, Dict[str, int]] = {}
+    for key in silver_players.CATEGORICAL_KEYS:
+        col = table.column(key)
+        bufs = [bytearray(size) for _ in col.dictionary]
+        for i, c in enumerate(col.codes):
+            bufs[c][i >> 3] |= 1 << (i & 7)
+        out[key] = {v: int.from_bytes(b, "little") for v, b in zip(col.dictionary, bufs)}
+    return out
+
+
+dag.register("gold.category_bitmaps", ["silver.players"], _build_category_bitmaps)
+dag.register(
+    "gold.rostered_bitmap",
+    ["silver.players", "silver.rostered_player_ids"],
+    _build_rostered_bitmap,
+    partitioned=True,
+    max_partitions=_MAX_CACHED_LEAGUES,
+    build_many=_build_rostered_bitmaps,
+)
+
+
+@timed
+def get_rostered_bitmap(league_id: str) -> int:
+    """Return the league's rostered-player bitmap over silver player rows."""
+    return dag.get("gold.rostered_bitmap", league_id)
+
+
+@timed
+def get_available_bitmap(league_id: Optional[str] = None) -> int:
+    """Return the bitmap of players not rostered in league_id (every player when league_id is None)."""
+    mask = all_players_mask(len(silver_players.get_player_table()))
+    if not league_id:
+        return mask
+    return mask & ~get_rostered_bitmap(league_id)
+
+
+@timed
+def get_filter_bitmap(filters: Mapping[str, Optional[Sequence[str]]]) -> Optional[int]:
+    """Return rows matching every filter (field -> accepted values, any of; CATEGORICAL_KEYS fields), or None if
+    no filter is set. Unknown fields raise KeyError."""
+    bitmaps = dag.get("gold.category_bitmaps")
+    out: Optional[int] = None
+    for key, values in filters.items():
+        if values is None:
+            continue
+        by_value = bitmaps[key]
+        bits = 0
+        for v in values:
+            bits |= by_value.get(v, 0)
+        out = bits if out is None else out & bits
+    return out
+
+
+@timed
+def get_available_rows(league_id: Optional[str] = None) -> List[int]:
+    """Return silver player rows available in league_id, in table order."""
+    return rows_of_bitmap(get_available_bitmap(league_id))
+
+
+@timed
+def precompute(league_ids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Build rostered bitmaps for many leagues (default: every league with rosters) from one roster scan."""
+    ids = list(league_ids) if league_ids is not None else silver_rosters.get_league_ids()
+    return dag.get_many("gold.rostered_bitmap", ids)
@@ -0,0 +1,284 @@
+"""Gold: LRU cache of serialized API results, keyed by endpoint, league_id and parameters.
+
+Each entry stores the JSON bytes plus the DAG versions of the datasets it was computed from; a lookup whose
+versions differ is a miss and replaces the entry, so repeated reads between ingests do no gold work and
+stale results never accumulate. Entries also keep a content tag (hash of body and headers) used as the HTTP
+ETag: unlike DAG versions, which count per process, it is the same in every worker for the same data. Compressed variants of a body (gzip; br when the brotli package is installed)
+are encoded once and kept on the entry, so they expire with it. Bounded by total bytes, variants included
+(config.get_gold_cache_bytes), evicting least recently used.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.config import get_gold_cache_bytes
+from analytics_foundry import metrics
+from analytics_foundry.metrics import timed
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+# (dataset, partition) pairs whose versions decide whether a cached result is current.
+Inputs = Sequence[Tuple[str, Optional[str]]]
+Key = Tuple[str, Optional[str], Hashable]
+
+# Content codings compress() supports, in server preference order.
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Smaller bodies are not worth compressing.
+MIN_COMPRESS_BYTES = 1024
+
+
+def content_tag(body: bytes, headers: Dict[str, str]) -> str:
+    """Return the strong ETag (quoted) of a response: a hash of its identity body and headers."""
+    h = hashlib.blake2b(body, digest_size=16)
+    h.update(repr(sorted(headers.items())).encode("utf-8"))
+    return '"' + h.hexdigest() + '"'
+
+
+class _Entry:
+    __slots__ = ("versions", "body", "headers", "tag", "encoded", "size")
+
+    def __init__(self, versions: Tuple[int, ...], body: bytes, headers: Dict[str, str]):
+        self.versions = versions
+        self.body = body
+        self.headers = headers
+        self.tag = content_tag(body, headers)
+        # Content coding -> compressed body.
+        self.encoded: Dict[str, bytes] = {}
+        self.size = len(body)
+
+
+_LOCK = threading.Lock()
+# (endpoint, league_id, params) -> entry
+_ENTRIES: "OrderedDict[Key, _Entry]" = OrderedDict()
+_BYTES = 0
+_MAX_BYTES: Optional[int] = None
+_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+@timed
+def dumps(obj: Any) -> bytes:
+    """Serialize like FastAPI's JSONResponse, so cached and uncached bodies are byte-identical."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _max_bytes() -> int:
+    return _MAX_BYTES if _MAX_BYTES is not None else get_gold_cache_bytes()
+
+
+def versions(inputs: Inputs) -> Tuple[int, ...]:
+    """Return the current DAG versions of inputs (what a cached result for them is checked against)."""
+    return tuple(dag.version(name, partition) for name, partition in inputs)
+
+
+@timed
+def compress(body: bytes, encoding: str) -> bytes:
+    """Encode body with a content coding from ENCODINGS."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=5)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def _evict(max_bytes: int) -> None:
+    global _BYTES
+    while _BYTES > max_bytes and _ENTRIES:
+        _, entry = _ENTRIES.popitem(last=False)
+        _BYTES -= entry.size
+        _STATS["evictions"] += 1
+
+
+def get_json(
+    endpoint: str,
+    league_id: Optional[str],
+    params: Hashable,
+    inputs: Inputs,
+    compute: Callable[[], Any],
+) -> bytes:
+    """Return the JSON body for (endpoint, league_id, params), computing and caching it on a miss."""
+    return get_response(endpoint, league_id, params, inputs, lambda: (compute(), {}))[0]
+
+
+def _lookup(key: Key, versions: Tuple[int, ...]) -> Optional[_Entry]:
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.versions == versions:
+            _ENTRIES.move_to_end(key)
+            _STATS["hits"] += 1
+            return entry
+        _STATS["misses"] += 1
+    return None
+
+
+def _store(key: Key, versions: Tuple[int, ...], obj: Any, headers: Dict[str, str]) -> _Entry:
+    global _BYTES
+    entry = _Entry(versions, dumps(obj), headers)
+    max_bytes = _max_bytes()
+    with _LOCK:
+        old = _ENTRIES.pop(key, None)
+        if old is not None:
+            _BYTES -= old.size
+        if entry.size <= max_bytes:
+            _ENTRIES[key] = entry
+            _BYTES += entry.size
+            _evict(max_bytes)
+    return entry
+
+
+def _encoded(key: Key, entry: _Entry, encoding: str) -> bytes:
+    """The entry's body in encoding, compressed on first use and kept while the entry is."""
+    global _BYTES
+    data = entry.encoded.get(encoding)
+    if data is None:
+        data = compress(entry.body, encoding)
+        with _LOCK:
+            if encoding not in entry.encoded:
+                entry.encoded[encoding] = data
+                entry.size += len(data)
+                if _ENTRIES.get(key) is entry:
+                    _BYTES += len(data)
+                    _evict(_max_bytes())
+    return data
+
+
+def get_response(
+    endpoint: str,
+    league_id: Optional[str],
+    params: Hashable,
+    inputs: Inputs,
+    compute: Callable[[], Tuple[Any, Dict[str, str]]],
+    current: Optional[Tuple[int, ...]] = None,
+) -> Tuple[bytes, Dict[str, str]]:
+    """Like get_json, for results with response headers: compute returns (obj, headers); returns (body, headers).
+    current: the input versions, when the caller already read them (e.g. for an ETag)."""
+    body, headers, _, _ = get_encoded(endpoint, league_id, params, inputs, compute, None, current)
+    return body, headers
+
+
+def get_encoded(
+    endpoint: str,
+    league_id: Optional[str],
+    params: Hashable,
+    inputs: Inputs,
+    compute: Callable[[], Tuple[Any, Dict[str, str]]],
+    encoding: Optional[str],
+    current: Optional[Tuple[int, ...]] = None,
+) -> Tuple[bytes, Dict[str, str], Optional[str], str]:
+    """get_response with the body in a content coding from ENCODINGS (compressed once, cached with the entry);
+    bodies under MIN_COMPRESS_BYTES stay identity. Returns (body, headers, coding used or None, content tag)."""
+    key = (endpoint, league_id, params)
+    # Versions are read before computing: if data changes meanwhile, the entry is simply stale next time.
+    if current is None:
+        current = versions(inputs)
+    entry = _lookup(key, current)
+    if entry is None:
+        obj, headers = compute()
+        entry = _store(key, current, obj, headers)
+    if encoding is None or len(entry.body) < MIN_COMPRESS_BYTES:
+        return entry.body, entry.headers, None, entry.tag
+    return _encoded(key, entry, encoding), entry.headers, encoding, entry.tag
+
+
+def peek_encoded(
+    endpoint: str,
+    league_id: Optional[str],
+    params: Hashable,
+    current: Tuple[int, ...],
+    encoding: Optional[str],
+) -> Optional[Tuple[bytes, Dict[str, str], Optional[str], str]]:
+    """get_encoded's result if it needs no work (current entry, coding already encoded), else None.
+    Lets async callers serve hits inline and send only misses to an executor; only hits are counted."""
+    key = (endpoint, league_id, params)
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is None or entry.versions != current:
+            return None
+        if encoding is not None and len(entry.body) >= MIN_COMPRESS_BYTES:
+            data = entry.encoded.get(encoding)
+            if data is None:
+                return None
+        else:
+            data, encoding = entry.body, None
+        _ENTRIES.move_to_end(key)
+        _STATS["hits"] += 1
+        return data, entry.headers, encoding, entry.tag
+
+
+def peek_tag(endpoint: str, league_id: Optional[str], params: Hashable, current: Tuple[int, ...]) -> Optional[str]:
+    """Return the content tag of the current entry for (endpoint, league_id, params), or None (not counted)."""
+    with _LOCK:
+        entry = _ENTRIES.get((endpoint, league_id, params))
+        return entry.tag if entry is not None and entry.versions == current else None
+
+
+def get_many_responses(
+    endpoint: str,
+    league_ids: Sequence[str],
+    params_of: Callable[[str], Hashable],
+    inputs_of: Callable[[str], Inputs],
+    compute_many: Callable[[List[str]], Dict[str, Tuple[Any, Dict[str, str]]]],
+) -> Dict[str, Tuple[bytes, Dict[str, str]]]:
+    """Batch get_response over leagues, sharing entries with it: hits are served from the cache and all misses
+    are computed by one compute_many(missed_league_ids) call returning league_id -> (obj, headers)."""
+    out: Dict[str, Tuple[bytes, Dict[str, str]]] = {}
+    missed: Dict[str, Tuple[Tuple[str, Optional[str], Hashable], Tuple[int, ...]]] = {}
+    for lid in league_ids:
+        key = (endpoint, lid, params_of(lid))
+        current = versions(inputs_of(lid))
+        hit = _lookup(key, current)
+        if hit is not None:
+            out[lid] = hit.body, hit.headers
+        else:
+            missed[lid] = (key, current)
+    if missed:
+        for lid, (obj, headers) in compute_many(list(missed)).items():
+            key, current = missed[lid]
+            out[lid] = _store(key, current, obj, headers).body, headers
+    return {lid: out[lid] for lid in league_ids}
+
+
+def set_max_bytes(max_bytes: Optional[int]) -> None:
+    """Override the memory bound (None restores config); evicts down to the new bound."""
+    global _MAX_BYTES
+    with _LOCK:
+        _MAX_BYTES = max_bytes
+        _evict(_max_bytes())
+
+
+def clear() -> None:
+    """Drop all entries and reset metrics."""
+    global _BYTES
+    with _LOCK:
+        _ENTRIES.clear()
+        _BYTES = 0
+        for k in _STATS:
+            _STATS[k] = 0
+
+
+def stats() -> Dict[str, int]:
+    """Return hits, misses, evictions, entries, bytes and max_bytes."""
+    with _LOCK:
+        return {**_STATS, "entries": len(_ENTRIES), "bytes": _BYTES, "max_bytes": _max_bytes()}
+
+
+def _metric_samples() -> List[Tuple[str, str, str, float]]:
+    s = stats()
+    return [
+        ("foundry_gold_cache_hits_total", "counter", "Gold cache hits.", s["hits"]),
+        ("foundry_gold_cache_misses_total", "counter", "Gold cache misses.", s["misses"]),
+        ("foundry_gold_cache_evictions_total", "counter", "Gold cache evictions.", s["evictions"]),
+        ("foundry_gold_cache_entries", "gauge", "Cached gold results.", s["entries"]),
+        ("foundry_gold_cache_bytes", "gauge", "Bytes held by the gold cache.", s["bytes"]),
+    ]
+
+
+metrics.register_collector(_metric_samples)
@@ -1,18 +1,61 @@
-"""Gold: injury report for API. Reads from silver; TECH_SPEC shape: player_id, status, updated_at?."""
+"""Gold: injury report for API. Reads from silver; TECH_SPEC shape: player_id, status, updated_at?.
+
+League scopes join the injury index with the rosters' player -> leagues index, so a league report costs
+O(injured players) and holds only players relevant to the league: rostered there (with roster_id) or available.
+"""
 
 from typing import Any, Dict, List, Optional
 
+from analytics_foundry import dag
+from analytics_foundry.metrics import timed
 from analytics_foundry.silver import injuries as silver_injuries
 
+# "rostered": injured players on the league's rosters; "available": injured players not rostered there;
+# "all": every injured player.
+INJURY_SCOPES = ("rostered", "available", "all")
+
 
-def get_injury_report(league_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Return injury report: list of {player_id, status, updated_at?} from silver injuries."""
-    injuries_list = silver_injuries.get_injuries()
+def _report_rows(injuries_list: List[Dict[str, Any]], with_roster: bool = False) -> List[Dict[str, Any]]:
     out = []
     for r in injuries_list:
         rec = {"player_id": r["player_id"], "status": r["status"]}
         if r.get("updated_at") is not None:
             rec["updated_at"] = str(r["updated_at"])
+        if with_roster:
+            rec["roster_id"] = r["roster_id"]
         out.append(rec)
     return out
 
+
+def _build_injury_report() -> List[Dict[str, Any]]:
+    return _report_rows(silver_injuries.get_injuries())
+
+
+dag.register("gold.injury", ["silver.injuries"], _build_injury_report)
+# League-scoped reports are computed per request from the two indexes; tracked for lineage and versions.
+dag.register("gold.league_injury", ["silver.injuries", "silver.rosters"], partitioned=True)
+
+
+def parse_scope(raw: Optional[str]) -> str:
+    """Validate an injury scope (INJURY_SCOPES); None or blank means "all", as for get_injury_report."""
+    if raw is None or not raw.strip():
+        return "all"
+    scope = raw.strip()
+    if scope not in INJURY_SCOPES:
+        raise ValueError(f"Unknown injury scope: {scope}")
+    return scope
+
+
+@timed
+def get_injury_report(league_id: Optional[str] = None, scope: str = "all") -> List[Dict[str, Any]]:
+    """Return injury report: list of {player_id, status, updated_at?} from silver injuries.
+
+    With league_id, scope "rostered" keeps players rostered in the league (adding roster_id) and "available"
+    those not rostered there; "all" (or no league) returns every injured player.
+    """
+    if scope not in INJURY_SCOPES:
+        raise ValueError(f"Unknown injury scope: {scope}")
+    if scope == "all" or not league_id:
+        return list(dag.get("gold.injury"))
+    rostered = scope == "rostered"
+    return _report_rows(silver_injuries.get_league_injuries(league_id, rostered=rostered), with_roster=rostered)
@@ -1,22 +1,150 @@
-"""Gold helpers for league-scoped data. API layer calls ensure_league_ingested before serving."""
+"""Gold helpers for league-scoped data. API layer calls ensure_league_ingested before serving.
 
-from typing import Any, Dict
+By default (config.get_league_ttl_seconds() is 0) every league-scoped request fetches the league again, so
+responses always reflect the source. A positive FOUNDRY_LEAGUE_TTL_SECONDS opts in to freshness: a league
+ingested within the TTL is not fetched again, so repeated requests read cached silver/gold data (and DAG versions
+stay put), at the price of lagging the source by up to the TTL (admin ingests call mark_stale first).
+ensure_leagues_ingested fetches many stale leagues concurrently. Freshness is per process and is reset when
+bronze is cleared. Snapshot workers (snapshot.py) never ingest: every league counts as fresh and is served from
+the mapped snapshot.
 
-from analytics_foundry.adapters import get_adapter
+The a-prefixed coroutines are the async request path: a fresh league returns without leaving the event loop,
+a stale one is fetched with the adapter's aingest_to_bronze, and concurrent requests for one league share a
+single fetch.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+from analytics_foundry import snapshot
+from analytics_foundry.adapters import aingest, get_adapter
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_ingest_workers, get_league_ttl_seconds
+from analytics_foundry.executors import run_compute
+from analytics_foundry.metrics import timed
 from analytics_foundry.silver import league as silver_league
 
+NFL_SLEEPER = "nfl_sleeper"
+
+# league_id -> time.monotonic() of its last completed ingest.
+_INGESTED_AT: Dict[str, float] = {}
+# Striped locks: concurrent requests for one stale league ingest it once.
+_STRIPES = tuple(threading.Lock() for _ in range(64))
+# (event loop, league_id) -> in-flight async ingest, awaited by every request for that league.
+_INFLIGHT: Dict[Tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[None]"] = {}
+
+
+def _on_bronze_change(source_id: str, table: str, records: Any) -> None:
+    if records is None and source_id == NFL_SLEEPER:
+        _INGESTED_AT.clear()
+
+
+bronze_store.subscribe(_on_bronze_change)
+
+
+def is_fresh(league_id: str) -> bool:
+    """True if league_id was ingested within the TTL (always False when the TTL is 0, the default; always True on
+    a snapshot worker, whose data comes from the snapshot writer)."""
+    if snapshot.is_attached():
+        return True
+    ttl = get_league_ttl_seconds()
+    at = _INGESTED_AT.get(league_id)
+    return ttl > 0 and at is not None and time.monotonic() - at < ttl
+
+
+def mark_stale(league_id: str) -> None:
+    """Forget league_id's freshness so the next ensure_league_ingested fetches it (explicit re-ingest)."""
+    _INGESTED_AT.pop(league_id, None)
+
 
 def ensure_league_ingested(league_id: str) -> None:
-    """If league_id is present, ensure that league's data is in bronze (lazy fetch). No-op if adapter missing."""
-    adapter = get_adapter("nfl_sleeper")
-    if adapter is not None:
+    """If league_id is present, ensure that league's data is in bronze (lazy fetch). No-op if adapter missing
+    or the league is still fresh."""
+    if is_fresh(league_id):
+        return
+    adapter = get_adapter(NFL_SLEEPER)
+    if adapter is None:
+        return
+    with _STRIPES[hash(league_id) % len(_STRIPES)]:
+        # Another request may have ingested it while we waited.
+        if is_fresh(league_id):
+            return
         adapter.ingest_to_bronze(league_id=league_id)
+        _INGESTED_AT[league_id] = time.monotonic()
 
 
-def validate_league(league_id: str) -> Dict[str, Any]:
-    """Return {valid: bool, league_id: str, league_name: str} per API contract."""
-    ensure_league_ingested(league_id)
+def ensure_leagues_ingested(league_ids: Iterable[str]) -> List[str]:
+    """Ensure many leagues are in bronze, fetching the stale ones concurrently (config.get_ingest_workers threads).
+    Returns the league_ids that were stale."""
+    stale = [lid for lid in dict.fromkeys(league_ids) if not is_fresh(lid)]
+    workers = min(len(stale), get_ingest_workers())
+    if workers <= 1:
+        for lid in stale:
+            ensure_league_ingested(lid)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first ingest error.
+            list(pool.map(ensure_league_ingested, stale))
+    return stale
+
+
+async def _aingest(adapter: Any, league_id: str) -> None:
+    if is_fresh(league_id):
+        return
+    await aingest(adapter, league_id=league_id)
+    _INGESTED_AT[league_id] = time.monotonic()
+
+
+async def aensure_league_ingested(league_id: str) -> None:
+    """Async ensure_league_ingested: no-op if fresh or no adapter; otherwise one shared fetch per league."""
+    if is_fresh(league_id):
+        return
+    adapter = get_adapter(NFL_SLEEPER)
+    if adapter is None:
+        return
+    loop = asyncio.get_running_loop()
+    key = (loop, league_id)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = _INFLIGHT[key] = loop.create_task(_aingest(adapter, league_id))
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # shield: a cancelled request (client gone) does not cancel the fetch other requests await.
+    await asyncio.shield(task)
+
+
+async def aensure_leagues_ingested(league_ids: Iterable[str]) -> List[str]:
+    """Async ensure_leagues_ingested: stale leagues fetched concurrently, at most config.get_ingest_workers at
+    a time. Returns the league_ids that were stale."""
+    stale = [lid for lid in dict.fromkeys(league_ids) if not is_fresh(lid)]
+    limit = asyncio.Semaphore(get_ingest_workers())
+
+    async def one(lid: str) -> None:
+        async with limit:
+            await aensure_league_ingested(lid)
+
+    await asyncio.gather(*(one(lid) for lid in stale))
+    return stale
+
+
+@timed
+def league_validation(league_id: str) -> Dict[str, Any]:
+    """validate_league without the ingest step (reads silver only)."""
     lg = silver_league.get_league(league_id)
     if lg is not None:
         return {"valid": True, "league_id": league_id, "league_name": lg["name"]}
     return {"valid": False, "league_id": league_id, "league_name": ""}
+
+
+def validate_league(league_id: str) -> Dict[str, Any]:
+    """Return {valid: bool, league_id: str, league_name: str} per API contract."""
+    ensure_league_ingested(league_id)
+    return league_validation(league_id)
+
+
+async def avalidate_league(league_id: str) -> Dict[str, Any]:
+    """Async validate_league: silver read in the compute executor."""
+    await aensure_league_ingested(league_id)
+    return await run_compute(league_validation, league_id)
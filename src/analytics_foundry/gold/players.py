@@ -1,31 +1,297 @@
-"""Gold: available players for API. Reads from silver; shapes per TECH_SPEC player object."""
+"""Gold: available players for API. Reads from silver; shapes per TECH_SPEC player object.
 
-from typing import Any, Dict, List, Optional
+query_available_players pushes filters (category bitmaps), sorting (cached row orders), cursor and limit
+down to row ids, so only the returned page is materialized, with only the requested fields.
+"""
 
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.gold import availability, query
+from analytics_foundry.metrics import timed
 from analytics_foundry.silver import players as silver_players
-from analytics_foundry.silver import rosters as silver_rosters
 
+PLAYER_FIELDS = ("id", "player_id", "name", "position", "team", "status", "age", "trending")
+# Sortable fields; "-field" sorts descending. Nulls sort last either way; ties keep table order.
+SORT_FIELDS = ("player_id", "name", "position", "team", "status", "age", "trending")
+
+
+def _player_objects(table: silver_players.PlayerTable, rows: Iterable[int]) -> List[Dict[str, Any]]:
+    """Shape table rows to API player objects (id, name, position, team, status, age, trending) from silver columns."""
+    pid, name, position, team, status = table.player_id, table.name, table.position, table.team, table.status
+    age, trending = table.age, table.trending
+    return [
+        {
+            "id": pid[i],
+            "player_id": pid[i],
+            "name": name[i],
+            "position": position[i],
+            "team": team[i],
+            "status": status[i],
+            "age": age[i],
+            "trending": trending[i],
+        }
+        for i in rows
+    ]
+
+
+def _projected_objects(
+    table: silver_players.PlayerTable, rows: Iterable[int], fields: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """Shape table rows to player objects holding only fields (PLAYER_FIELDS; "id" is player_id)."""
+    cols = [(f, table.player_id if f == "id" else table.column(f)) for f in fields]
+    return [{f: c[i] for f, c in cols} for i in rows]
+
+
+class SortOrders:
+    """Row orders of one player table per sort spec ("name", "-trending"), computed on first use."""
+
+    __slots__ = ("table", "_orders")
+
+    def __init__(self, table: silver_players.PlayerTable):
+        self.table = table
+        self._orders: Dict[str, Tuple[List[int], List[int]]] = {}
+
+    def get(self, spec: str) -> Tuple[List[int], List[int]]:
+        """Return (order, rank): rows in sort order and each row's position in it."""
+        cached = self._orders.get(spec)
+        if cached is None:
+            col = self.table.column(spec.lstrip("-"))
+            rows = range(len(self.table))
+            present = [i for i in rows if col[i] is not None]
+            # sorted() is stable with reverse=True too, so equal values keep table order.
+            order = sorted(present, key=col.__getitem__, reverse=spec.startswith("-"))
+            if len(present) < len(self.table):
+                order += [i for i in rows if col[i] is None]
+            rank = [0] * len(order)
+            for pos, i in enumerate(order):
+                rank[i] = pos
+            cached = self._orders[spec] = (order, rank)
+        return cached
+
+
+dag.register("gold.player_sort_orders", ["silver.players"], lambda: SortOrders(silver_players.get_player_table()))
+
+
+def parse_sort(raw: Optional[str]) -> Optional[str]:
+    """Validate a sort spec ("field" or "-field", SORT_FIELDS); None or blank means table order."""
+    if raw is None or not raw.strip():
+        return None
+    spec = raw.strip()
+    if spec.lstrip("-") not in SORT_FIELDS or spec.startswith("--"):
+        raise ValueError(f"Unknown sort field: {spec}")
+    return spec
+
+
+def _walk(order: List[int], start: int, allowed: bytes) -> Iterator[int]:
+    for i in islice(order, start, None):
+        if allowed[i >> 3] >> (i & 7) & 1:
+            yield i
+
+
+class _Plan:
+    """Validated query options resolved against one player table: shared by every league of a request."""
+
+    __slots__ = ("table", "bits", "sort", "order", "rank")
+
+    def __init__(self, table: silver_players.PlayerTable, bits: int, sort: Optional[str]):
+        self.table = table
+        # Rows passing the filters, before removing a league's rostered players.
+        self.bits = bits
+        self.sort = sort
+        self.order: Optional[List[int]] = None
+        self.rank: Optional[List[int]] = None
+        if sort is not None:
+            self.order, self.rank = dag.get("gold.player_sort_orders").get(sort)
+
+
+def _plan(
+    position: Optional[Sequence[str]],
+    team: Optional[Sequence[str]],
+    status: Optional[Sequence[str]],
+    sort: Optional[str],
+    fields: Optional[Sequence[str]],
+) -> _Plan:
+    sort = parse_sort(sort)
+    if fields is not None:
+        unknown = [f for f in fields if f not in PLAYER_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    table = silver_players.get_player_table()
+    bits = availability.all_players_mask(len(table))
+    filter_bits = availability.get_filter_bitmap({"position": position, "team": team, "status": status})
+    if filter_bits is not None:
+        bits &= filter_bits
+    return _Plan(table, bits, sort)
+
+
+def _rows(plan: _Plan, rostered: int, cursor: Optional[str]) -> Iterator[int]:
+    """Lazy iterator of the plan's rows not in rostered, in order, after cursor."""
+    table, sort = plan.table, plan.sort
+    bits = plan.bits & ~rostered if rostered else plan.bits
+    after: Optional[int] = None
+    state = query.decode_cursor(cursor)
+    if state is not None:
+        pid = state.get("after")
+        after = table.index_of(pid) if isinstance(pid, str) and state.get("sort") == sort else None
+        if after is None:
+            raise ValueError("Invalid cursor")
+    if plan.order is None:
+        return availability.iter_bitmap_rows(bits, 0 if after is None else after + 1)
+    rank = plan.rank
+    start = 0 if after is None or after >= len(rank) else rank[after] + 1
+    return _walk(plan.order, start, availability.bitmap_bytes(bits, len(table)))
+
+
+def _select(
+    league_id: Optional[str],
+    position: Optional[Sequence[str]],
+    team: Optional[Sequence[str]],
+    status: Optional[Sequence[str]],
+    sort: Optional[str],
+    fields: Optional[Sequence[str]],
+    cursor: Optional[str],
+) -> Tuple[silver_players.PlayerTable, Iterator[int], Optional[str]]:
+    """Validate options and return (table, lazy iterator of matching rows in order after cursor, sort)."""
+    plan = _plan(position, team, status, sort, fields)
+    rostered = availability.get_rostered_bitmap(league_id) if league_id else 0
+    return plan.table, _rows(plan, rostered, cursor), plan.sort
 
-def _to_player_object(rec: Dict[str, Any]) -> Dict[str, Any]:
-    """Shape silver record to API player object: id, name, position, team, status, age, trending."""
-    pid = rec.get("player_id")
+
+def _shape(table: silver_players.PlayerTable, rows: Iterable[int], fields: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    if fields is None:
+        return _player_objects(table, rows)
+    return _projected_objects(table, rows, fields)
+
+
+@timed
+def query_available_players(
+    league_id: Optional[str] = None,
+    position: Optional[Sequence[str]] = None,
+    team: Optional[Sequence[str]] = None,
+    status: Optional[Sequence[str]] = None,
+    sort: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return (page, next_cursor) of available players: filtered by position/team/status (any of each),
+    sorted (parse_sort spec, default table order), projected to fields, at most limit rows after cursor.
+
+    next_cursor is None on the last page. Invalid sort, fields or cursor raise ValueError.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+    table, rows, sort = _select(league_id, position, team, status, sort, fields, cursor)
+    return _page(table, rows, sort, fields, limit)
+
+
+def _page(
+    table: silver_players.PlayerTable,
+    rows: Iterator[int],
+    sort: Optional[str],
+    fields: Optional[Sequence[str]],
+    limit: Optional[int],
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    # One extra row tells whether there is a next page.
+    page = list(rows if limit is None else islice(rows, limit + 1))
+    next_cursor = None
+    if limit is not None and len(page) > limit:
+        page = page[:limit]
+        if page:
+            next_cursor = query.encode_cursor({"after": table.player_id[page[-1]], "sort": sort})
+    return _shape(table, page, fields), next_cursor
+
+
+@timed
+def query_available_players_many(
+    league_ids: Sequence[str],
+    position: Optional[Sequence[str]] = None,
+    team: Optional[Sequence[str]] = None,
+    status: Optional[Sequence[str]] = None,
+    sort: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    cursors: Optional[Mapping[str, str]] = None,
+) -> Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Batch query_available_players: league_id -> (page, next_cursor) with the same options (cursors per league).
+
+    Options are validated and the table, filter bitmap and sort order resolved once; every league's rostered
+    bitmap comes from one roster scan (availability.precompute), so each league costs only its bitmap AND and page.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+    plan = _plan(position, team, status, sort, fields)
+    cursors = cursors or {}
+    rostered = availability.precompute(league_ids)
     return {
-        "id": str(pid) if pid is not None else "",
-        "player_id": str(pid) if pid is not None else "",
-        "name": str(rec.get("name") or ""),
-        "position": str(rec.get("position") or ""),
-        "team": str(rec.get("team") or ""),
-        "status": str(rec.get("status") or ""),
-        "age": rec.get("age"),
-        "trending": rec.get("trending"),
+        lid: _page(plan.table, _rows(plan, rostered[lid], cursors.get(lid)), plan.sort, fields, limit)
+        for lid in league_ids
     }
 
 
-def get_available_players(league_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Return available (unrostered) players. If league_id given, exclude players on rosters in that league."""
-    players_list = silver_players.get_players()
+# Rows shaped per step while streaming.
+_STREAM_BATCH = 256
+
+
+@timed
+def iter_available_players(
+    league_id: Optional[str] = None,
+    position: Optional[Sequence[str]] = None,
+    team: Optional[Sequence[str]] = None,
+    status: Optional[Sequence[str]] = None,
+    sort: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Like query_available_players, but yields player objects lazily (for streaming responses).
+
+    Options are validated before the first row is produced (ValueError raised here, not mid-stream). This call's
+    stage time covers validation and selection; producing the rows is timed as gold.players._iter_shaped.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+    table, rows, _ = _select(league_id, position, team, status, sort, fields, cursor)
+    if limit is not None:
+        rows = islice(rows, limit)
+    return _iter_shaped(table, rows, fields)
+
+
+@timed
+def _iter_shaped(
+    table: silver_players.PlayerTable, rows: Iterator[int], fields: Optional[Sequence[str]]
+) -> Iterator[Dict[str, Any]]:
+    while True:
+        batch = list(islice(rows, _STREAM_BATCH))
+        if not batch:
+            return
+        yield from _shape(table, batch, fields)
+
+
+# Gold results are cached per league; bound the number of leagues kept.
+_MAX_CACHED_LEAGUES = 256
+
+
+def _build_available_players(league_id: Optional[str]) -> List[Dict[str, Any]]:
+    table = silver_players.get_player_table()
+    rows: Iterable[int] = range(len(table))
     if league_id:
-        rostered_ids = silver_rosters.get_rostered_player_ids(league_id)
-        players_list = [p for p in players_list if p["player_id"] not in rostered_ids]
-    return [_to_player_object(p) for p in players_list]
+        rows = availability.get_available_rows(league_id)
+    return _player_objects(table, rows)
+
+
+dag.register(
+    "gold.available_players",
+    ["silver.players", "gold.rostered_bitmap"],
+    _build_available_players,
+    partitioned=True,
+    max_partitions=_MAX_CACHED_LEAGUES,
+)
 
+
+@timed
+def get_available_players(league_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Return available (unrostered) players. If league_id given, exclude players on rosters in that league."""
+    return list(dag.get("gold.available_players", league_id or None))
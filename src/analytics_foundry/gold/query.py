@@ -0,0 +1,47 @@
+"""Gold: query options shared by gold endpoints — list parameters, field projection and opaque cursors.
+
+Invalid options raise ValueError (the API answers 400).
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+def parse_list(raw: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated query value ("WR,RB") into a tuple; None when absent or blank."""
+    if raw is None:
+        return None
+    items = tuple(part.strip() for part in raw.split(",") if part.strip())
+    return items or None
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a fields projection; None means every field. Unknown fields raise ValueError."""
+    fields = parse_list(raw)
+    if fields is None:
+        return None
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode cursor state as an opaque URL-safe token."""
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a token from encode_cursor; None when absent. Malformed tokens raise ValueError."""
+    if not cursor:
+        return None
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(state, dict):
+        raise ValueError("Invalid cursor")
+    return state
@@ -1,27 +1,175 @@
-"""Gold: waiver/add recommendations. Returns available players with a simple score for ranking."""
-
-from typing import Any, Dict, List, Optional
-
-from analytics_foundry.gold import players as gold_players
-
-
-def get_waiver_recommendations(league_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
-    """Return waiver/add recommendations: available players with score (stub: trending or 0)."""
-    available = gold_players.get_available_players(league_id=league_id)
-    out = []
-    for p in available[:limit]:
-        score = p.get("trending")
-        if score is None:
-            score = 0.0
-        try:
-            score = float(score)
-        except (TypeError, ValueError):
-            score = 0.0
-        out.append({
-            "player_id": p.get("id") or p.get("player_id"),
-            "name": p.get("name"),
-            "position": p.get("position"),
-            "team": p.get("team"),
-            "score": score,
-        })
+"""Gold: waiver/add recommendations. Returns the top-scored available players for a league.
+
+Scores come from gold.scoring: a base score per player (index ordered overall and per position, rebuilt
+only when player-level inputs change) plus a per-position league term. A request merges the per-position
+lists with a heap (or walks one list), skipping players rostered in the league (bitmap test), until it has
+limit players — O(limit + rostered players skipped) heap steps, independent of the table size.
+"""
+
+import bisect
+import heapq
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.gold import availability, query, scoring
+from analytics_foundry.metrics import timed
+
+RECOMMENDATION_FIELDS = ("player_id", "name", "position", "team", "score")
+
+# Computed per request from the score index, league terms and rostered bitmap; tracked for lineage and versions.
+dag.register(
+    "gold.waiver_recommendations",
+    ["gold.score_index", "gold.position_need", "gold.rostered_bitmap"],
+    partitioned=True,
+)
+
+
+@timed
+def top_available(
+    league_id: Optional[str],
+    limit: int,
+    position: Optional[str | Sequence[str]] = None,
+    index: Optional[scoring.ScoreIndex] = None,
+    filter_bits: Optional[int] = None,
+    after: Optional[Tuple[float, int]] = None,
+) -> List[Tuple[int, float]]:
+    """Return up to limit (row, score) pairs of the best-scored players not rostered in league_id.
+
+    position restricts to one or more positions, filter_bits to rows set in it (availability.get_filter_bitmap);
+    after = (score, row) of the previous page's last entry resumes just past it.
+    """
+    if index is None:
+        index = scoring.get_score_index()
+    if limit <= 0:
+        return []
+    scores = index.scores
+    positions = [position] if isinstance(position, str) else position
+    if not league_id and filter_bits is None and after is None and (positions is None or len(positions) == 1):
+        return [(i, scores[i]) for i in index.ranked(positions[0] if positions else None)[:limit]]
+    allowed = availability.all_players_mask(len(index.table))
+    if league_id:
+        allowed &= ~availability.get_rostered_bitmap(league_id)
+    if filter_bits is not None:
+        allowed &= filter_bits
+    allowed_bytes = availability.bitmap_bytes(allowed, len(index.table))
+    boosts = scoring.get_league_boosts(league_id)
+    lists = [(index.ranked(p), boosts.get(p, 0.0)) for p in (positions or list(index.by_position))]
+    # Heap of (-score, row, list, offset): rows tie-break by table order, as in the overall index.
+    heap = []
+    for k, (rows, b) in enumerate(lists):
+        j = 0
+        if after is not None:
+            j = bisect.bisect_right(rows, (-after[0], after[1]), key=lambda r, b=b: (-(scores[r] + b), r))
+        if j < len(rows):
+            heap.append((-(scores[rows[j]] + b), rows[j], k, j))
+    heapq.heapify(heap)
+    out: List[Tuple[int, float]] = []
+    while heap and len(out) < limit:
+        neg, i, k, j = heapq.heappop(heap)
+        if allowed_bytes[i >> 3] >> (i & 7) & 1:
+            out.append((i, -neg))
+        rows, b = lists[k]
+        j += 1
+        if j < len(rows):
+            heapq.heappush(heap, (-(scores[rows[j]] + b), rows[j], k, j))
     return out
+
+
+def _check_fields(fields: Optional[Sequence[str]]) -> None:
+    if fields is not None:
+        unknown = [f for f in fields if f not in RECOMMENDATION_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+
+def _recommend(
+    index: scoring.ScoreIndex,
+    league_id: Optional[str],
+    limit: int,
+    position: Optional[str | Sequence[str]],
+    filter_bits: Optional[int],
+    fields: Optional[Sequence[str]],
+    cursor: Optional[str],
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    if limit < 0:
+        raise ValueError("limit must be >= 0")
+    table = index.table
+    after: Optional[Tuple[float, int]] = None
+    state = query.decode_cursor(cursor)
+    if state is not None:
+        pid, score = state.get("after"), state.get("score")
+        row = table.index_of(pid) if isinstance(pid, str) else None
+        if row is None or not isinstance(score, (int, float)):
+            raise ValueError("Invalid cursor")
+        after = (float(score), row)
+    # One extra entry tells whether there is a next page.
+    top = top_available(league_id, limit + 1, position, index, filter_bits, after) if limit > 0 else []
+    next_cursor = None
+    if len(top) > limit:
+        top = top[:limit]
+        i, score = top[-1]
+        next_cursor = query.encode_cursor({"after": table.player_id[i], "score": score})
+    cols = {
+        "player_id": table.player_id,
+        "name": table.name,
+        "position": table.position,
+        "team": table.team,
+    }
+    keys = fields or RECOMMENDATION_FIELDS
+    recs = [
+        {k: score if k == "score" else cols[k][i] for k in keys}
+        for i, score in top
+    ]
+    return recs, next_cursor
+
+
+@timed
+def query_waiver_recommendations(
+    league_id: Optional[str] = None,
+    limit: int = 20,
+    position: Optional[str | Sequence[str]] = None,
+    team: Optional[Sequence[str]] = None,
+    status: Optional[Sequence[str]] = None,
+    fields: Optional[Sequence[str]] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return (recommendations, next_cursor): top available players by score (see gold.scoring), best first,
+    filtered by position/team/status, projected to fields, after cursor. Invalid fields, cursor or a negative
+    limit raise ValueError."""
+    _check_fields(fields)
+    filter_bits = availability.get_filter_bitmap({"team": team, "status": status})
+    return _recommend(scoring.get_score_index(), league_id, limit, position, filter_bits, fields, cursor)
+
+
+@timed
+def query_waiver_recommendations_many(
+    league_ids: Sequence[str],
+    limit: int = 20,
+    position: Optional[str | Sequence[str]] = None,
+    team: Optional[Sequence[str]] = None,
+    status: Optional[Sequence[str]] = None,
+    fields: Optional[Sequence[str]] = None,
+    cursors: Optional[Mapping[str, str]] = None,
+) -> Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Batch query_waiver_recommendations: league_id -> (recommendations, next_cursor), cursors per league.
+
+    The score index and filter bitmap are resolved once and every league's rostered bitmap is built from one
+    roster scan (availability.precompute); each league then runs only its heap merge.
+    """
+    _check_fields(fields)
+    index = scoring.get_score_index()
+    filter_bits = availability.get_filter_bitmap({"team": team, "status": status})
+    availability.precompute(league_ids)
+    cursors = cursors or {}
+    return {
+        lid: _recommend(index, lid, limit, position, filter_bits, fields, cursors.get(lid))
+        for lid in league_ids
+    }
+
+
+@timed
+def get_waiver_recommendations(
+    league_id: Optional[str] = None, limit: int = 20, position: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Return waiver/add recommendations: top available players by score (see gold.scoring), best first."""
+    return query_waiver_recommendations(league_id=league_id, limit=limit, position=position)[0]
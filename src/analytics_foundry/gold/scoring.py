@@ -0,0 +1,205 @@
+"""Gold: multi-factor player scoring for recommendations.
+
+Player-level features (trending, age, injury, matchup points) are computed for all players in one column
+pass and cached until silver players or matchups change; the weighted base score is derived from them.
+The league term (position_need: share of a position's players already rostered in the league) is one
+number per position, recomputed only when that league's rosters change. Weights: config.get_score_weights
+or set_weights().
+"""
+
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from analytics_foundry import config, dag
+from analytics_foundry.gold import availability
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver import matchups as silver_matchups
+from analytics_foundry.silver import players as silver_players
+
+PLAYER_FEATURES = ("trending", "age", "injury", "matchup_points")
+LEAGUE_FEATURES = ("position_need",)
+
+# Age feature: (PRIME_AGE - age) / AGE_SCALE, clamped to [-1, 1]; younger players score higher.
+PRIME_AGE = 26
+AGE_SCALE = 10.0
+
+# Injury feature: -severity of the player's status (injury_status, else status). Unknown non-Active
+# statuses count as DEFAULT_INJURY_SEVERITY.
+INJURY_SEVERITY = {
+    "": 0.0,
+    "Active": 0.0,
+    "Probable": 0.1,
+    "Questionable": 0.25,
+    "Doubtful": 0.75,
+    "Out": 1.0,
+    "IR": 1.0,
+    "PUP": 1.0,
+    "Suspended": 1.0,
+}
+DEFAULT_INJURY_SEVERITY = 0.5
+
+_WEIGHTS: Optional[Dict[str, float]] = None
+
+
+class PlayerFeatures:
+    """Per-player feature columns (one array('d') per PLAYER_FEATURES name, indexed by silver player row)."""
+
+    __slots__ = ("table", "columns", "position_counts")
+
+    def __init__(self, table: silver_players.PlayerTable, columns: Dict[str, Sequence[float]]):
+        self.table = table
+        self.columns = columns
+        # Players per position code, for league position_need.
+        counts = [0] * len(table.position.dictionary)
+        for c in table.position.codes:
+            counts[c] += 1
+        self.position_counts = counts
+
+
+def _finite(v: Optional[float]) -> float:
+    return 0.0 if v is None or v != v or v in (float("inf"), float("-inf")) else v
+
+
+def _severity(status: str) -> float:
+    return INJURY_SEVERITY.get(status, DEFAULT_INJURY_SEVERITY)
+
+
+def compute_features(table: silver_players.PlayerTable, player_points: Mapping[str, float]) -> PlayerFeatures:
+    """Compute PLAYER_FEATURES columns for every row of the table; missing inputs give 0."""
+    trending = array("d", [_finite(t) for t in table.trending])
+    age = array("d", [
+        0.0 if a is None else max(-1.0, min(1.0, (PRIME_AGE - a) / AGE_SCALE)) for a in table.age
+    ])
+    # Severity per dictionary code, so the row pass is two list lookups.
+    inj, st = table.injury_status, table.status
+    inj_sev = [_severity(v) for v in inj.dictionary]
+    st_sev = [_severity(v) for v in st.dictionary]
+    inj_empty = inj.code_of("")
+    injury = array("d", [
+        -(st_sev[sc] if ic == inj_empty else inj_sev[ic]) for ic, sc in zip(inj.codes, st.codes)
+    ])
+    get_points = player_points.get
+    points = array("d", [_finite(get_points(pid)) for pid in table.player_id])
+    return PlayerFeatures(table, {"trending": trending, "age": age, "injury": injury, "matchup_points": points})
+
+
+def combine(features: PlayerFeatures, weights: Mapping[str, float]) -> List[float]:
+    """Return the weighted base score per row: sum of weight * feature over PLAYER_FEATURES."""
+    terms = [(weights.get(f, 0.0), features.columns[f]) for f in PLAYER_FEATURES]
+    terms = [(w, col) for w, col in terms if w]
+    if not terms:
+        return [0.0] * len(features.table)
+    (w0, c0), rest = terms[0], terms[1:]
+    scores = [w0 * v for v in c0]
+    for w, col in rest:
+        scores = [s + w * v for s, v in zip(scores, col)]
+    return scores
+
+
+def position_need(features: PlayerFeatures, rostered_rows: Sequence[int]) -> Dict[str, float]:
+    """Return position -> share of that position's players rostered in the league (0 for blank positions)."""
+    pos = features.table.position
+    codes, n = pos.codes, len(pos.codes)
+    rostered = [0] * len(pos.dictionary)
+    for i in rostered_rows:
+        if i < n:
+            rostered[codes[i]] += 1
+    return {
+        p: (r / total if p and total else 0.0)
+        for p, r, total in zip(pos.dictionary, rostered, features.position_counts)
+    }
+
+
+def _build_player_features() -> PlayerFeatures:
+    return compute_features(silver_players.get_player_table(), silver_matchups.get_player_points())
+
+
+def _build_position_need(league_id: Optional[str]) -> Dict[str, float]:
+    features = get_player_features()
+    if not league_id:
+        return {}
+    return position_need(features, availability.rows_of_bitmap(availability.get_rostered_bitmap(league_id)))
+
+
+class ScoreIndex:
+    """Silver player rows ordered by base score descending (ties: table order), overall and per position.
+
+    The league term is constant within a position, so per-position order holds for every league.
+    """
+
+    __slots__ = ("table", "scores", "order", "by_position")
+
+    def __init__(self, features: PlayerFeatures, weights: Mapping[str, float]):
+        table = features.table
+        self.table = table
+        self.scores: List[float] = combine(features, weights)
+        neg = [-s for s in self.scores]
+        self.order: List[int] = sorted(range(len(table)), key=neg.__getitem__)
+        by_code: List[List[int]] = [[] for _ in table.position.dictionary]
+        codes = table.position.codes
+        for i in self.order:
+            by_code[codes[i]].append(i)
+        self.by_position: Dict[str, List[int]] = dict(zip(table.position.dictionary, by_code))
+
+    def ranked(self, position: Optional[str] = None) -> List[int]:
+        """Return rows in base score order, optionally for one position."""
+        if position is None:
+            return self.order
+        return self.by_position.get(position, [])
+
+
+def _build_score_index() -> ScoreIndex:
+    return ScoreIndex(get_player_features(), get_weights())
+
+
+dag.register("gold.player_features", ["silver.players", "silver.player_points"], _build_player_features)
+# Depends on weights too: set_weights() invalidates it.
+dag.register("gold.score_index", ["gold.player_features"], _build_score_index)
+dag.register(
+    "gold.position_need",
+    ["gold.player_features", "gold.rostered_bitmap"],
+    _build_position_need,
+    partitioned=True,
+    max_partitions=availability._MAX_CACHED_LEAGUES,
+)
+
+
+@timed
+def get_player_features() -> PlayerFeatures:
+    """Return cached player feature columns."""
+    return dag.get("gold.player_features")
+
+
+def get_weights() -> Dict[str, float]:
+    """Return the active feature weights (set_weights override, else config)."""
+    return dict(_WEIGHTS) if _WEIGHTS is not None else config.get_score_weights()
+
+
+def set_weights(weights: Optional[Mapping[str, float]]) -> None:
+    """Override some feature weights (None restores config weights); scores are recomputed on next use."""
+    global _WEIGHTS
+    if weights is None:
+        _WEIGHTS = None
+    else:
+        unknown = set(weights) - set(PLAYER_FEATURES) - set(LEAGUE_FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown score features: {sorted(unknown)}")
+        _WEIGHTS = {**config.get_score_weights(), **{k: float(v) for k, v in weights.items()}}
+    dag.invalidate("gold.score_index")
+
+
+@timed
+def get_score_index() -> ScoreIndex:
+    """Return the current score index (rebuilt after silver players, matchups or weights change)."""
+    return dag.get("gold.score_index")
+
+
+@timed
+def get_league_boosts(league_id: Optional[str]) -> Dict[str, float]:
+    """Return position -> league score term (position_need weight * need); empty when no league."""
+    if not league_id:
+        return {}
+    w = get_weights().get("position_need", 0.0)
+    if not w:
+        return {}
+    return {p: w * v for p, v in dag.get("gold.position_need", league_id).items() if v}
@@ -0,0 +1,91 @@
+"""HTTP conditional requests and compression for cached gold reads.
+
+Each response carries a strong ETag hashed from its body and headers (gold_cache.content_tag), so every worker
+process gives the same data the same tag. When the result is cached and current, a matching If-None-Match
+returns 304 without gold work; otherwise the result is computed (and cached) first, then compared. Bodies
+are served in the best content coding the client accepts (Accept-Encoding; br when brotli is installed, else
+gzip), using the compressed bytes cached with the gold result (small bodies go as-is). Cache hits are served
+on the event loop; computing or compressing a result runs in the compute executor.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Response
+
+from analytics_foundry.executors import run_compute
+from analytics_foundry.gold import cache as gold_cache
+
+# Clients may keep responses but must revalidate (If-None-Match) before reuse; bodies vary by coding.
+_VALIDATE = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+def _tagged(tag: str, encoding: Optional[str]) -> str:
+    # Encoded bodies are different bytes, so each coding gets its own strong tag.
+    return tag if encoding is None else f'{tag[:-1]}-{encoding}"'
+
+
+def matches(if_none_match: Optional[str], tag: str) -> bool:
+    """True if an If-None-Match header matches the result tagged tag, in any content coding (weak comparison)."""
+    if not if_none_match:
+        return False
+    wanted = {_tagged(tag, enc) for enc in (None, *gold_cache.ENCODINGS)}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in wanted:
+            return True
+    return False
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Return the preferred supported content coding the client accepts (q > 0), or None for identity."""
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, rest = part.strip().partition(";")
+        q = 1.0
+        rest = rest.strip()
+        if rest.startswith("q="):
+            try:
+                q = float(rest[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    best: Optional[str] = None
+    best_q = 0.0
+    for coding in gold_cache.ENCODINGS:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+async def cached_response(
+    endpoint: str,
+    league_id: Optional[str],
+    params: Hashable,
+    inputs: gold_cache.Inputs,
+    compute: Callable[[], Tuple[Any, Dict[str, str]]],
+    if_none_match: Optional[str] = None,
+    accept_encoding: Optional[str] = None,
+) -> Response:
+    """gold_cache.get_response as an HTTP response: 304 if If-None-Match matches (compute not called when the
+    result is cached), else the JSON body in the negotiated coding, with ETag and Vary: Accept-Encoding."""
+    current = gold_cache.versions(inputs)
+    tag = gold_cache.peek_tag(endpoint, league_id, params, current)
+    if tag is not None and matches(if_none_match, tag):
+        return Response(status_code=304, headers={"ETag": tag, **_VALIDATE})
+    coding = negotiate(accept_encoding)
+    hit = gold_cache.peek_encoded(endpoint, league_id, params, current, coding)
+    if hit is None:
+        hit = await run_compute(gold_cache.get_encoded, endpoint, league_id, params, inputs, compute, coding, current)
+    body, headers, encoding, tag = hit
+    if matches(if_none_match, tag):
+        return Response(status_code=304, headers={"ETag": tag, **_VALIDATE})
+    out = {**headers, "ETag": _tagged(tag, encoding), **_VALIDATE}
+    if encoding is not None:
+        out["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=out)
@@ -0,0 +1,267 @@
+"""In-process metrics: stage timers, counters and per-route request histograms in Prometheus text format.
+
+Instrumented functions are wrapped with @timed: each call observes its wall time (inclusive of nested stages)
+in foundry_stage_duration_seconds{layer, stage}, where stage is "<module>.<function>" below analytics_foundry
+(e.g. "silver.players.get_player_table") and layer its first part (generators: the time spent producing
+items); calls that raise an Exception also count in foundry_stage_errors_total. DAG builds are timed per
+dataset, and RequestMetrics (ASGI middleware) times each request by method, route template and status. An
+observation is two perf_counter reads, a bisect and a short locked update, so instrumentation stays on.
+GET /admin/metrics serves render().
+"""
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds (seconds) of histogram buckets; +Inf is implicit.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+        _METRICS.append(self)
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Bucketed observations (seconds) per label set: per-bucket counts, sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        # labels -> [count per bucket (last = +Inf), sum]
+        self._series: Dict[Labels, List[Any]] = {}
+        self._lock = threading.Lock()
+        _METRICS.append(self)
+
+    def observe(self, labels: Labels, value: float) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def count(self, labels: Labels) -> int:
+        series = self._series.get(labels)
+        return 0 if series is None else sum(series[0])
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(counts), total) for k, (counts, total) in self._series.items())
+        out = []
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, "+Inf"), counts):
+                cumulative += n
+                le = f'le="{bound}"'
+                out.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}")
+            out.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}")
+            out.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+_METRICS: List[Any] = []
+# Callables returning extra (name, kind, help, value) samples at render time (e.g. gold cache stats).
+_COLLECTORS: List[Callable[[], List[Tuple[str, str, str, float]]]] = []
+
+STAGE_SECONDS = Histogram(
+    "foundry_stage_duration_seconds", "Wall time per instrumented stage (inclusive of nested stages).",
+    ("layer", "stage"),
+)
+STAGE_ERRORS = Counter("foundry_stage_errors_total", "Instrumented stage calls that raised.", ("layer", "stage"))
+BUILD_SECONDS = Histogram("foundry_dataset_build_seconds", "Wall time per DAG dataset (re)build.", ("dataset",))
+REQUEST_SECONDS = Histogram(
+    "foundry_http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+BRONZE_RECORDS = Counter("foundry_bronze_records_appended_total", "Records appended to bronze.", ("source", "table"))
+
+
+def register_collector(collector: Callable[[], List[Tuple[str, str, str, float]]]) -> None:
+    """Add a render-time source of (name, kind, help, value) samples (idempotent)."""
+    if collector not in _COLLECTORS:
+        _COLLECTORS.append(collector)
+
+
+def stage_name(fn: Callable[..., Any]) -> str:
+    """Return the stage label of fn: module path below analytics_foundry plus qualified name."""
+    module = fn.__module__
+    if module.startswith("analytics_foundry."):
+        module = module[len("analytics_foundry."):]
+    return f"{module}.{fn.__qualname__}"
+
+
+def timed(fn: F) -> F:
+    """Decorator: observe each call of fn (sync or async) in foundry_stage_duration_seconds.
+
+    A generator function is observed once per generator, over the time spent producing its items (summed
+    across steps, so time the consumer holds it suspended is excluded); send() and throw() are forwarded to
+    it as with yield from. Errors count exceptions only; cancellation, GeneratorExit and KeyboardInterrupt
+    are not errors.
+    """
+    stage = stage_name(fn)
+    labels = (stage.split(".", 1)[0], stage)
+    observe = STAGE_SECONDS.observe
+    perf_counter = time.perf_counter
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def awrapper(*args: Any, **kwargs: Any) -> Any:
+            t0 = perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except Exception:
+                STAGE_ERRORS.inc(labels)
+                raise
+            finally:
+                observe(labels, perf_counter() - t0)
+
+        return awrapper  # type: ignore[return-value]
+
+    if inspect.isgeneratorfunction(fn):
+        @functools.wraps(fn)
+        def gwrapper(*args: Any, **kwargs: Any) -> Any:
+            elapsed = 0.0
+            gen = fn(*args, **kwargs)
+            try:
+                # yield from, with each step of gen timed: the next step sends the consumer's value, or throws
+                # what the consumer threw in.
+                step: Callable[[Any], Any] = gen.send
+                value: Any = None
+                while True:
+                    t0 = perf_counter()
+                    try:
+                        item = step(value)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        elapsed += perf_counter() - t0
+                    try:
+                        value = yield item
+                        step = gen.send
+                    except GeneratorExit:
+                        raise
+                    except BaseException as e:
+                        step, value = gen.throw, e
+            except Exception:
+                STAGE_ERRORS.inc(labels)
+                raise
+            finally:
+                gen.close()
+                observe(labels, elapsed)
+
+        return gwrapper  # type: ignore[return-value]
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        t0 = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            STAGE_ERRORS.inc(labels)
+            raise
+        finally:
+            observe(labels, perf_counter() - t0)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class RequestMetrics:
+    """ASGI middleware: observe each HTTP request in foundry_http_request_duration_seconds by method, matched
+    route template (e.g. /tables/{layer}/{source_or_name}; "unmatched" for 404s) and response status."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = [500]
+
+        async def send_status(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            REQUEST_SECONDS.observe((scope["method"], route, str(status[0])), time.perf_counter() - t0)
+
+
+def render() -> str:
+    """Return every metric in the Prometheus text exposition format (version 0.0.4)."""
+    lines: List[str] = []
+    for metric in _METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    for collector in _COLLECTORS:
+        for name, kind, help, value in collector():
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}", f"{name} {_number(value)}"]
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Zero every metric (for tests)."""
+    for metric in _METRICS:
+        metric.reset()
@@ -0,0 +1,99 @@
+"""Startup prewarm: ingest hot leagues and warm their silver/gold data and response caches before taking traffic.
+
+Prewarming is opt-in (FOUNDRY_PREWARM=1), since it fetches from the source on every startup. The hot leagues are
+config.get_prewarm_league_ids() (the default league, then FOUNDRY_PREWARM_LEAGUES). After startup a background task ingests them (at most config.get_ingest_workers at a time) and requests each league's
+default views in-process through the app, so the DAG builds the silver/gold datasets behind them and the gold
+cache holds the exact entries, in the preferred content coding, that real requests hit. Readiness (/readyz)
+waits for the run to finish (at once when prewarm is off); a league that fails to warm is reported but does not
+hold readiness back. A run cancelled at shutdown ends in state "cancelled", never left "running".
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from analytics_foundry import metrics
+from analytics_foundry.config import get_ingest_workers, get_prewarm_league_ids
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import league as gold_league
+
+# Default views warmed per league (league_id is the only query parameter).
+PATHS = ("/players/available", "/injury", "/recommendations/waiver")
+
+# Last (or current) run: state pending | running | done | cancelled | failed; per-league "ok" or error; timing in
+# seconds.
+_STATUS: Dict[str, Any] = {"state": "pending", "leagues": {}, "started_at": None, "duration_seconds": None}
+
+
+def status() -> Dict[str, Any]:
+    """Return the prewarm state, per-league results, start time (epoch seconds) and duration."""
+    return {**_STATUS, "leagues": dict(_STATUS["leagues"])}
+
+
+def is_ready() -> bool:
+    """True once prewarm has finished (or was never needed)."""
+    return _STATUS["state"] == "done"
+
+
+def reset() -> None:
+    """Forget the last run (for tests)."""
+    _STATUS.update(state="pending", leagues={}, started_at=None, duration_seconds=None)
+
+
+async def _warm_league(client: httpx.AsyncClient, league_id: str, limit: asyncio.Semaphore) -> str:
+    try:
+        async with limit:
+            await gold_league.aensure_league_ingested(league_id)
+        for path in PATHS:
+            resp = await client.get(path, params={"league_id": league_id})
+            if resp.status_code != 200:
+                return f"{path}: HTTP {resp.status_code}"
+    except Exception as e:  # reported per league; others still warm
+        return f"{type(e).__name__}: {e}"
+    return "ok"
+
+
+async def run(app: Any, league_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Prewarm league_ids (default config.get_prewarm_league_ids) against app; returns status()."""
+    ids = get_prewarm_league_ids() if league_ids is None else list(dict.fromkeys(league_ids))
+    _STATUS.update(state="running", leagues={lid: "pending" for lid in ids}, started_at=time.time())
+    t0 = time.perf_counter()
+    limit = asyncio.Semaphore(get_ingest_workers())
+    # Ask for the preferred coding so the compressed variant real clients get is cached too.
+    headers = {"Accept-Encoding": ", ".join(gold_cache.ENCODINGS)}
+    transport = httpx.ASGITransport(app=app)
+    leagues = _STATUS["leagues"]
+
+    async def warm(client: httpx.AsyncClient, league_id: str) -> None:
+        leagues[league_id] = await _warm_league(client, league_id, limit)
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://prewarm", headers=headers) as client:
+            await asyncio.gather(*(warm(client, lid) for lid in ids))
+    except BaseException as e:
+        # Cancelled (e.g. at shutdown) or failed: the run and its unfinished leagues end in a terminal state.
+        state = "cancelled" if isinstance(e, asyncio.CancelledError) else "failed"
+        for lid, result in leagues.items():
+            if result == "pending":
+                leagues[lid] = state
+        _STATUS.update(state=state, duration_seconds=round(time.perf_counter() - t0, 3))
+        raise
+    _STATUS.update(state="done", duration_seconds=round(time.perf_counter() - t0, 3))
+    return status()
+
+
+def _metric_samples() -> List[Tuple[str, str, str, float]]:
+    duration = _STATUS["duration_seconds"]
+    if duration is None:
+        return []
+    return [("foundry_prewarm_duration_seconds", "gauge", "Duration of the last startup prewarm.", duration)]
+
+
+metrics.register_collector(_metric_samples)
+
+
+def start(app: Any) -> "asyncio.Task[Dict[str, Any]]":
+    """Schedule run(app) in the background on the running loop (call from the app lifespan)."""
+    return asyncio.get_running_loop().create_task(run(app))
@@ -0,0 +1,339 @@
+"""On-demand profiling of admin ingest runs and sampled read requests (cProfile plus tracemalloc).
+
+A profiled run is a Session: cProfile records the event-loop thread while the run is in flight, and every
+call the run hands to the compute/io executors (executors.py checks current()) is recorded in its worker
+thread by its own profiler; they are merged into one pstats file when the run ends. With allocations on,
+tracemalloc traces the run and the growth per allocation site (file:line) between its start and end is kept,
+plus the full end snapshot. Both are process-wide views: work of concurrent requests on the loop thread and
+their allocations appear in the run's profile too.
+
+Sessions are kept newest first (at most KEEP) with top functions and allocation sites; the .prof
+(pstats.Stats / snakeviz) and .tracemalloc (tracemalloc.Snapshot.load) files live under <data dir>/profiles.
+Nothing is traced unless a run is profiled: off, the cost is one context-variable read per executor call
+and one global check per request.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from analytics_foundry.bronze import store as bronze_store
+
+T = TypeVar("T")
+
+# Finished sessions kept (older ones and their files are dropped).
+KEEP = 20
+# Functions / allocation sites kept in a session summary.
+TOP = 50
+SORTS = ("cumulative", "tottime", "calls")
+
+_CURRENT: "contextvars.ContextVar[Optional[Session]]" = contextvars.ContextVar("foundry_profile", default=None)
+_LOCK = threading.Lock()
+_SESSIONS: "OrderedDict[str, Session]" = OrderedDict()
+# Threads with a session profiler enabled (one sys.setprofile hook per thread).
+_BUSY_THREADS: set = set()
+# Sessions currently tracing allocations; tracemalloc is stopped again when the last one ends (if it started it).
+_TRACING = {"sessions": 0, "started": False}
+_TMP_DIR: List[Path] = []
+
+
+def profile_dir() -> Path:
+    """Return <data dir>/profiles (a temporary directory when running in memory only)."""
+    root = bronze_store.get_data_root()
+    if root is not None:
+        path = root / "profiles"
+    else:
+        if not _TMP_DIR:
+            _TMP_DIR.append(Path(tempfile.mkdtemp(prefix="foundry-profiles-")))
+        path = _TMP_DIR[0]
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _enable(profiler: cProfile.Profile) -> bool:
+    ident = threading.get_ident()
+    with _LOCK:
+        if ident in _BUSY_THREADS:
+            return False
+        _BUSY_THREADS.add(ident)
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler owns this thread
+        with _LOCK:
+            _BUSY_THREADS.discard(ident)
+        return False
+    return True
+
+
+def _disable(profiler: cProfile.Profile) -> None:
+    profiler.disable()
+    with _LOCK:
+        _BUSY_THREADS.discard(threading.get_ident())
+
+
+def _start_tracing() -> tracemalloc.Snapshot:
+    with _LOCK:
+        if _TRACING["sessions"] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACING["started"] = True
+        _TRACING["sessions"] += 1
+    return tracemalloc.take_snapshot()
+
+
+def _stop_tracing() -> tracemalloc.Snapshot:
+    snap = tracemalloc.take_snapshot()
+    with _LOCK:
+        _TRACING["sessions"] -= 1
+        if _TRACING["sessions"] == 0 and _TRACING["started"]:
+            tracemalloc.stop()
+            _TRACING["started"] = False
+    return snap
+
+
+_ALLOC_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _function_rows(stats: pstats.Stats, sort: str, limit: int) -> List[Dict[str, Any]]:
+    key = {"cumulative": 3, "tottime": 2, "calls": 1}[sort]
+    items = sorted(stats.stats.items(), key=lambda kv: kv[1][key], reverse=True)[:limit]  # type: ignore[attr-defined]
+    return [
+        {
+            "function": pstats.func_std_string(func),
+            "calls": nc,
+            "primitive_calls": cc,
+            "tottime": round(tt, 6),
+            "cumtime": round(ct, 6),
+        }
+        for func, (cc, nc, tt, ct, _callers) in items
+    ]
+
+
+class Session:
+    """One profiled run: kind ("ingest.league", "ingest.broad", "request"), target, profilers and results."""
+
+    def __init__(self, kind: str, target: str, allocations: bool = True):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.target = target
+        self.allocations = allocations
+        self.created_at = time.time()
+        self.duration_seconds: Optional[float] = None
+        self.functions: List[Dict[str, Any]] = []
+        self.allocation_sites: List[Dict[str, Any]] = []
+        self.allocated_bytes: Optional[int] = None
+        self._profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn in this thread under a fresh profiler merged into the session (executor hook)."""
+        profiler = cProfile.Profile()
+        if not _enable(profiler):
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _disable(profiler)
+            with self._lock:
+                self._profilers.append(profiler)
+
+    def path(self, fmt: str) -> Path:
+        """Return the file of this session's pstats ("prof") or allocation snapshot ("tracemalloc")."""
+        return profile_dir() / f"{self.id}.{fmt}"
+
+    def files(self) -> List[str]:
+        return [fmt for fmt in ("prof", "tracemalloc") if self.path(fmt).is_file()]
+
+    def stats(self) -> Optional[pstats.Stats]:
+        """Load the merged profile, or None if nothing was recorded."""
+        path = self.path("prof")
+        return pstats.Stats(str(path)) if path.is_file() else None
+
+    def _finish(self, duration: float, start: Optional[tracemalloc.Snapshot], end: Optional[tracemalloc.Snapshot]) -> None:
+        self.duration_seconds = round(duration, 6)
+        with self._lock:
+            profilers, self._profilers = self._profilers, []
+        if profilers:
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                stats.add(profiler)
+            stats.dump_stats(str(self.path("prof")))
+            self.functions = _function_rows(stats, "cumulative", TOP)
+        if start is not None and end is not None:
+            end = end.filter_traces(_ALLOC_FILTERS)
+            diff = end.compare_to(start.filter_traces(_ALLOC_FILTERS), "lineno")
+            grown = [d for d in diff if d.size_diff > 0]
+            self.allocated_bytes = sum(d.size_diff for d in grown)
+            self.allocation_sites = [
+                {
+                    "site": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                    "size_bytes": d.size_diff,
+                    "count": d.count_diff,
+                }
+                for d in grown[:TOP]
+            ]
+            end.dump(str(self.path("tracemalloc")))
+
+    def summary(self, limit: int = 20, sort: str = "cumulative") -> Dict[str, Any]:
+        """Return metadata, the top limit functions (by sort) and allocation sites (by bytes allocated)."""
+        if sort == "cumulative" or not self.functions:
+            functions = self.functions[:limit]
+        else:
+            stats = self.stats()
+            functions = [] if stats is None else _function_rows(stats, sort, limit)
+        return {
+            **self.info(),
+            "functions": functions,
+            "allocation_sites": self.allocation_sites[:limit],
+        }
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "target": self.target,
+            "created_at": self.created_at,
+            "duration_seconds": self.duration_seconds,
+            "allocated_bytes": self.allocated_bytes,
+            "files": self.files(),
+        }
+
+
+def current() -> Optional[Session]:
+    """Return the session profiling the running context, if any."""
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def profiled(kind: str, target: str, allocations: bool = True) -> Iterator[Session]:
+    """Profile the enclosed run (sync or awaited code on this thread plus its executor calls) as a new session."""
+    session = Session(kind, target, allocations)
+    start = _start_tracing() if allocations else None
+    profiler = cProfile.Profile()
+    enabled = _enable(profiler)
+    token = _CURRENT.set(session)
+    t0 = time.perf_counter()
+    try:
+        yield session
+    finally:
+        duration = time.perf_counter() - t0
+        _CURRENT.reset(token)
+        if enabled:
+            _disable(profiler)
+            with session._lock:
+                session._profilers.append(profiler)
+        end = _stop_tracing() if allocations else None
+        session._finish(duration, start, end)
+        _keep(session)
+
+
+def _keep(session: Session) -> None:
+    with _LOCK:
+        _SESSIONS[session.id] = session
+        _SESSIONS.move_to_end(session.id, last=False)
+        dropped = [_SESSIONS.popitem()[1] for _ in range(max(0, len(_SESSIONS) - KEEP))]
+    for old in dropped:
+        for fmt in old.files():
+            old.path(fmt).unlink(missing_ok=True)
+
+
+def sessions() -> List[Dict[str, Any]]:
+    """Return info() of kept sessions, newest first."""
+    with _LOCK:
+        kept = list(_SESSIONS.values())
+    return [s.info() for s in kept]
+
+
+def get_session(session_id: str) -> Optional[Session]:
+    return _SESSIONS.get(session_id)
+
+
+class _Sampler:
+    """Profile every request whose running share crosses the next 1/rate step, until limit sessions are taken."""
+
+    def __init__(self, rate: float, limit: int, allocations: bool):
+        self.rate = rate
+        self.limit = limit
+        self.allocations = allocations
+        self.seen = 0
+        self.taken = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.taken >= self.limit:
+                return False
+            self.seen += 1
+            if int(self.seen * self.rate) == int((self.seen - 1) * self.rate):
+                return False
+            self.taken += 1
+            return True
+
+    def info(self) -> Dict[str, Any]:
+        return {"rate": self.rate, "limit": self.limit, "allocations": self.allocations, "seen": self.seen, "taken": self.taken}
+
+
+_SAMPLER: Optional[_Sampler] = None
+
+
+def sample_requests(rate: float, limit: int = 10, allocations: bool = True) -> Dict[str, Any]:
+    """Profile a deterministic share rate (0 < rate <= 1) of read requests until limit sessions are taken."""
+    global _SAMPLER
+    if not 0 < rate <= 1:
+        raise ValueError("rate must be in (0, 1]")
+    _SAMPLER = _Sampler(rate, max(1, limit), allocations)
+    return sampling()
+
+
+def stop_sampling() -> Dict[str, Any]:
+    """Stop request sampling; returns the final sampler state."""
+    global _SAMPLER
+    state = sampling()
+    _SAMPLER = None
+    return state
+
+
+def sampling() -> Dict[str, Any]:
+    """Return {"active": bool, ...sampler state}."""
+    sampler = _SAMPLER
+    return {"active": False} if sampler is None else {"active": sampler.taken < sampler.limit, **sampler.info()}
+
+
+def reset() -> None:
+    """Stop sampling and forget every session and its files (for tests)."""
+    stop_sampling()
+    with _LOCK:
+        kept = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in kept:
+        for fmt in session.files():
+            session.path(fmt).unlink(missing_ok=True)
+
+
+class RequestProfiler:
+    """ASGI middleware: while sampling is on, profile the sampled share of HTTP requests outside /admin."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        sampler = _SAMPLER
+        if sampler is None or scope["type"] != "http" or scope["path"].startswith("/admin") or not sampler.take():
+            await self.app(scope, receive, send)
+            return
+        query = scope.get("query_string", b"").decode("latin-1")
+        target = f"{scope['method']} {scope['path']}" + (f"?{query}" if query else "")
+        with profiled("request", target, sampler.allocations):
+            await self.app(scope, receive, send)
@@ -1,5 +1,5 @@
-"""Silver layer: cleaned, conformed, deduplicated. Canonical entity shapes (players, leagues, rosters, injuries)."""
+"""Silver layer: cleaned, conformed, deduplicated. Canonical entity shapes (players, leagues, rosters, matchups, injuries)."""
 
-from analytics_foundry.silver import injuries, league, players, rosters
+from analytics_foundry.silver import injuries, league, matchups, players, rosters
 
-__all__ = ["players", "league", "rosters", "injuries"]
+__all__ = ["players", "league", "rosters", "matchups", "injuries"]
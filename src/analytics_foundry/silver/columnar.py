@@ -0,0 +1,164 @@
+"""Silver: columnar batch helpers. Column coercion with null masks and last-wins dedup over whole batches."""
+
+from array import array
+from itertools import count, repeat
+from typing import Any, Dict, Hashable, Iterator, List, Sequence, Tuple
+
+# A columnar batch: column name -> list of values (all columns the same length).
+ColumnBatch = Dict[str, List[Any]]
+
+
+def coerce_int(val: Any) -> int | None:
+    if val is None:
+        return None
+    if isinstance(val, int):
+        return val
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def coerce_float(val: Any) -> float | None:
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_column(rows: Sequence[Dict[str, Any]], key: str) -> List[Any]:
+    """Return rows' values for key (None when missing) as a column, in one C-level pass."""
+    return list(map(dict.get, rows, repeat(key)))
+
+
+def str_column(values: Sequence[Any]) -> List[str]:
+    """Conform a column to str: falsy values become "", strings pass through (same as str(v or ""))."""
+    return [v if type(v) is str else str(v) if v else "" for v in values]
+
+
+def coerce_int_column(values: Sequence[Any]) -> Tuple[List[int | None], List[bool]]:
+    """Coerce a column to int (None when not coercible). Returns (values, null_mask)."""
+    out = [v if type(v) is int else coerce_int(v) for v in values]
+    return out, [v is None for v in out]
+
+
+def coerce_float_column(values: Sequence[Any]) -> Tuple[List[float | None], List[bool]]:
+    """Coerce a column to float (None when not coercible). Returns (values, null_mask)."""
+    out = [v if type(v) is float else coerce_float(v) for v in values]
+    return out, [v is None for v in out]
+
+
+def last_wins(keys: Sequence[Hashable]) -> List[int]:
+    """Return positions of the last occurrence of each key, ordered by the key's first occurrence.
+
+    Same semantics as assigning into a dict row by row: first-seen order, latest value. Without duplicates
+    this is every position in order (len(result) == len(keys)).
+    """
+    return list(dict(zip(keys, count())).values())
+
+
+def non_null_positions(values: Sequence[Any]) -> Sequence[int]:
+    """Return positions of non-None values (a range when there are no nulls)."""
+    if None not in values:
+        return range(len(values))
+    return [i for i, v in enumerate(values) if v is not None]
+
+
+def rows_from_columns(batch: ColumnBatch, keys: Sequence[str]) -> List[Dict[str, Any]]:
+    """Materialize a columnar batch as a list of dicts with the given key order."""
+    return [dict(zip(keys, vals)) for vals in zip(*(batch[k] for k in keys))]
+
+
+class NullableColumn:
+    """Typed numeric column: values in an array (typecode 'q' or 'd') plus a null mask (1 = null).
+
+    Falls back to a plain list when a value does not fit the typecode exactly (e.g. bools, huge ints),
+    so decoded values are always identical to the input.
+    """
+
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, typecode: str, values: Sequence[Any], null_mask: Sequence[bool]):
+        self.nulls = bytearray(null_mask)
+        exact = int if typecode == "q" else float
+        if all(type(v) is exact for v in values if v is not None):
+            try:
+                self.values: Sequence[Any] = array(typecode, [exact() if v is None else v for v in values])
+                return
+            except OverflowError:
+                pass
+        self.values = list(values)
+
+    @classmethod
+    def from_arrays(cls, values: Sequence[Any], nulls: Sequence[int]) -> "NullableColumn":
+        """Wrap existing values and null mask (e.g. views over a mapped snapshot) without copying."""
+        col = cls.__new__(cls)
+        col.values, col.nulls = values, nulls
+        return col
+
+    def __len__(self) -> int:
+        return len(self.nulls)
+
+    def __getitem__(self, i: int) -> Any:
+        return None if self.nulls[i] else self.values[i]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (None if n else v for v, n in zip(self.values, self.nulls))
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+
+class CategoricalColumn:
+    """Dictionary-encoded string column: one small integer code per row plus a shared dictionary of values.
+
+    For low-cardinality fields (position, team, status). Filters compare codes; values are decoded on access.
+    """
+
+    __slots__ = ("codes", "dictionary", "_lookup")
+
+    def __init__(self, values: Sequence[str]):
+        lookup: Dict[str, int] = {}
+        codes = [lookup.setdefault(v, len(lookup)) for v in values]
+        self.dictionary: List[str] = list(lookup)
+        self._lookup = lookup
+        n = len(lookup)
+        self.codes = array("B" if n <= 1 << 8 else "H" if n <= 1 << 16 else "I", codes)
+
+    @classmethod
+    def from_codes(cls, codes: Sequence[int], dictionary: List[str]) -> "CategoricalColumn":
+        """Wrap existing codes and their dictionary (e.g. views over a mapped snapshot) without re-encoding."""
+        col = cls.__new__(cls)
+        col.codes, col.dictionary = codes, dictionary
+        col._lookup = {v: i for i, v in enumerate(dictionary)}
+        return col
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> str:
+        return self.dictionary[self.codes[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.dictionary.__getitem__, self.codes)
+
+    def to_list(self) -> List[str]:
+        return list(self)
+
+    def code_of(self, value: str) -> int | None:
+        """Return the code for value, or None if it never occurs in this column."""
+        return self._lookup.get(value)
+
+    def positions(self, values: Sequence[str]) -> List[int]:
+        """Return row positions whose value is one of values (compares codes, not strings)."""
+        wanted = {self._lookup[v] for v in values if v in self._lookup}
+        if not wanted:
+            return []
+        if len(wanted) == 1:
+            (code,) = wanted
+            return [i for i, c in enumerate(self.codes) if c == code]
+        return [i for i, c in enumerate(self.codes) if c in wanted]
@@ -1,24 +1,208 @@
-"""Silver: injury report derived from silver players. Canonical schema: player_id, status, updated_at."""
+"""Silver: injury report derived from silver players. Canonical schema: player_id, status, updated_at.
 
-from typing import Any, Dict, List
+Maintained as an incremental index: built once from the silver player table, then updated from each
+bronze players append (latest record per player wins), emitting enter/change/exit events. Queries cost
+O(injured players), not O(all players).
+"""
 
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.metrics import timed
 from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver import rosters as silver_rosters
+
+NFL_SLEEPER = silver_players.NFL_SLEEPER
 
 # Canonical silver schema: player_id, status, updated_at
 SILVER_INJURY_KEYS = ("player_id", "status", "updated_at")
 
+_MAX_EVENTS = 1000
+
+_LOCK = threading.RLock()
+_BUILT = False
+# player_id -> first-seen position among all players (silver order), for stable output order.
+_ORDINAL: Dict[str, int] = {}
+# player_id -> silver injury record, for currently injured players only.
+_CURRENT: Dict[str, Dict[str, Any]] = {}
+_BY_STATUS: Dict[str, set[str]] = {}
+_EVENTS: Deque[Dict[str, Any]] = deque(maxlen=_MAX_EVENTS)
+_EVENT_SEQ = 0
+_SORTED: Optional[List[Dict[str, Any]]] = None
+
+
+def _is_injured(status: str) -> bool:
+    return bool(status) and status != "Active"
 
-def get_injuries() -> List[Dict[str, Any]]:
-    """Return silver injuries: players with non-empty injury_status (excluding 'Active')."""
-    players = silver_players.get_players()
-    out: List[Dict[str, Any]] = []
-    for p in players:
-        status = p.get("injury_status") or p.get("status") or ""
-        if not status or status == "Active":
+
+def _reset() -> None:
+    global _BUILT, _EVENT_SEQ, _SORTED
+    _BUILT = False
+    _ORDINAL.clear()
+    _CURRENT.clear()
+    _BY_STATUS.clear()
+    _EVENTS.clear()
+    _EVENT_SEQ = 0
+    _SORTED = None
+
+
+def _build(table: silver_players.PlayerTable) -> None:
+    """Full build from the silver player table: per-code flags, so the scan compares integers only."""
+    global _BUILT, _SORTED
+    inj, st = table.injury_status, table.status
+    # A status counts as injured if non-empty and not Active; status is only consulted when
+    # injury_status is empty.
+    inj_injured = [_is_injured(v) for v in inj.dictionary]
+    st_injured = [_is_injured(v) for v in st.dictionary]
+    inj_empty = inj.code_of("")
+    _ORDINAL.update((pid, i) for i, pid in enumerate(table.player_id))
+    for i, (ic, sc) in enumerate(zip(inj.codes, st.codes)):
+        if inj_injured[ic]:
+            status = inj.dictionary[ic]
+        elif ic == inj_empty and st_injured[sc]:
+            status = st.dictionary[sc]
+        else:
             continue
-        out.append({
-            "player_id": p["player_id"],
-            "status": str(status),
-            "updated_at": p.get("updated_at"),
-        })
+        pid = table.player_id[i]
+        _CURRENT[pid] = {"player_id": pid, "status": status, "updated_at": table.updated_at[i]}
+        _BY_STATUS.setdefault(status, set()).add(pid)
+    _SORTED = None
+    _BUILT = True
+
+
+def _emit(event: str, player_id: str, status: str, previous_status: Optional[str]) -> None:
+    global _EVENT_SEQ
+    _EVENT_SEQ += 1
+    _EVENTS.append({
+        "seq": _EVENT_SEQ,
+        "event": event,
+        "player_id": player_id,
+        "status": status,
+        "previous_status": previous_status,
+    })
+
+
+def _apply(records: List[Dict[str, Any]]) -> None:
+    """Apply newly appended bronze player records (each becomes the latest for its player_id)."""
+    global _SORTED
+    batch = silver_players._players_columns(records)
+    for pid, injury_status, status, updated_at in zip(
+        batch["player_id"], batch["injury_status"], batch["status"], batch["updated_at"]
+    ):
+        if pid not in _ORDINAL:
+            _ORDINAL[pid] = len(_ORDINAL)
+        status = injury_status or status
+        prev = _CURRENT.get(pid)
+        if _is_injured(status):
+            _CURRENT[pid] = {"player_id": pid, "status": status, "updated_at": updated_at}
+            if prev is None:
+                _emit("enter", pid, status, None)
+            elif prev["status"] != status:
+                _BY_STATUS[prev["status"]].discard(pid)
+                _emit("change", pid, status, prev["status"])
+            _BY_STATUS.setdefault(status, set()).add(pid)
+        elif prev is not None:
+            del _CURRENT[pid]
+            _BY_STATUS[prev["status"]].discard(pid)
+            _emit("exit", pid, status, prev["status"])
+    _SORTED = None
+
+
+def _on_bronze_players(records: Optional[List[Dict[str, Any]]]) -> None:
+    """DAG hook: called with each bronze players append (None on reset) before dependents are dirtied."""
+    with _LOCK:
+        if records is None:
+            _reset()
+        elif _BUILT:
+            _apply(records)
+
+
+dag.register(
+    "silver.injuries",
+    [dag.bronze_node(NFL_SLEEPER, "players")],
+    on_change=_on_bronze_players,
+)
+
+
+def _ensure_built() -> None:
+    while not _BUILT:
+        # Fetch the table without holding _LOCK (the DAG calls our hook under its own lock), then
+        # build only if bronze players did not change meanwhile; appends after that are applied by the hook.
+        v = dag.version("silver.players")
+        table = silver_players.get_player_table()
+        with _LOCK:
+            if _BUILT:
+                return
+            if dag.version("silver.players") == v:
+                _build(table)
+
+
+def _ordered(pids: Iterable[str]) -> List[Dict[str, Any]]:
+    return [dict(_CURRENT[pid]) for pid in sorted(pids, key=_ORDINAL.__getitem__)]
+
+
+@timed
+def get_injuries(status: Optional[str | Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """Return silver injuries: players with non-empty injury_status (excluding 'Active').
+
+    Optional status (one or several) filters via the by-status index. Order is silver player order.
+    """
+    global _SORTED
+    _ensure_built()
+    with _LOCK:
+        if status is None:
+            if _SORTED is None:
+                _SORTED = _ordered(_CURRENT)
+            return [dict(r) for r in _SORTED]
+        statuses = [status] if isinstance(status, str) else list(status)
+        pids: set[str] = set()
+        for s in statuses:
+            pids |= _BY_STATUS.get(s, set())
+        return _ordered(pids)
+
+
+@timed
+def get_injury(player_id: str) -> Optional[Dict[str, Any]]:
+    """Return the silver injury record for player_id, or None if not currently injured."""
+    _ensure_built()
+    with _LOCK:
+        rec = _CURRENT.get(player_id)
+        return dict(rec) if rec is not None else None
+
+
+@timed
+def get_league_injuries(league_id: str, rostered: bool = True) -> List[Dict[str, Any]]:
+    """Return injuries of players rostered in league_id (rostered=False: not rostered there), each with
+    roster_id (None when not rostered). Joined through the rosters' player -> leagues index: O(injured players)."""
+    _ensure_built()
+    with _LOCK:
+        injured = list(_CURRENT)
+    roster_of = silver_rosters.get_roster_ids(league_id, injured)
+    with _LOCK:
+        pids = [pid for pid in injured if (pid in roster_of) == rostered and pid in _CURRENT]
+        out = _ordered(pids)
+    for r in out:
+        r["roster_id"] = roster_of.get(r["player_id"])
     return out
+
+
+def count() -> Optional[int]:
+    """Return the number of currently injured players, or None if the index is not built yet (no build)."""
+    with _LOCK:
+        return len(_CURRENT) if _BUILT else None
+
+
+def index_parts() -> Optional[Tuple[Any, ...]]:
+    """Return the index containers (ordinals, current records, status sets, events), or None if not built
+    (for the statistics catalog's size estimate)."""
+    with _LOCK:
+        return (_ORDINAL, _CURRENT, _BY_STATUS, _EVENTS, _SORTED) if _BUILT else None
+
+
+@timed
+def get_injury_events(since: int = 0) -> List[Dict[str, Any]]:
+    """Return enter/change/exit events with seq > since (most recent _MAX_EVENTS kept), oldest first."""
+    with _LOCK:
+        return [dict(e) for e in _EVENTS if e["seq"] > since]
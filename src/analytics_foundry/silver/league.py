@@ -2,7 +2,10 @@
 
 from typing import Any, Dict, List, Optional
 
+from analytics_foundry import dag
 from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver.columnar import ColumnBatch, last_wins, rows_from_columns
 
 NFL_SLEEPER = "nfl_sleeper"
 
@@ -21,19 +24,33 @@ def _to_silver_league(rec: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _leagues_columns(raw: List[Dict[str, Any]]) -> ColumnBatch:
+    """Batch transform: dedup raw records by league_id (latest wins), then conform columns."""
+    lids = [rec.get("league_id") for rec in raw]
+    present = [i for i, lid in enumerate(lids) if lid]
+    keys = [str(lids[i]) for i in present]
+    survivors = last_wins(keys)
+    return {
+        "league_id": [keys[j] for j in survivors],
+        "name": [str(raw[present[j]].get("name") or raw[present[j]].get("league_name") or "") for j in survivors],
+    }
+
+
+def _build_leagues() -> List[Dict[str, Any]]:
+    raw = bronze_store.get_raw(NFL_SLEEPER, "league")
+    return rows_from_columns(_leagues_columns(raw), SILVER_LEAGUE_KEYS)
+
+
+dag.register("silver.leagues", [dag.bronze_node(NFL_SLEEPER, "league")], _build_leagues)
+
+
+@timed
 def get_leagues() -> List[Dict[str, Any]]:
     """Return silver leagues: cleaned, deduplicated by league_id (latest wins)."""
-    raw = bronze_store.get_raw(NFL_SLEEPER, "league")
-    by_id: Dict[str, Dict[str, Any]] = {}
-    for rec in raw:
-        silver = _to_silver_league(rec)
-        if not silver:
-            continue
-        lid = silver["league_id"]
-        by_id[lid] = silver
-    return list(by_id.values())
+    return list(dag.get("silver.leagues"))
 
 
+@timed
 def get_league(league_id: str) -> Optional[Dict[str, Any]]:
     """Return single silver league by league_id, or None if not found."""
     for lg in get_leagues():
@@ -0,0 +1,82 @@
+"""Silver: cleaned, conformed matchups. Canonical schema; dedup by (league_id, week, roster_id) (latest wins)."""
+
+from typing import Any, Dict, List
+
+from analytics_foundry import dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver.columnar import ColumnBatch, coerce_float, last_wins, rows_from_columns
+
+NFL_SLEEPER = "nfl_sleeper"
+
+# Canonical silver schema: league_id, week, roster_id, matchup_id, points, players_points (player_id -> points)
+SILVER_MATCHUP_KEYS = ("league_id", "week", "roster_id", "matchup_id", "points", "players_points")
+
+
+def _players_points(raw: Any) -> Dict[str, float]:
+    if not isinstance(raw, dict):
+        return {}
+    out: Dict[str, float] = {}
+    for pid, pts in raw.items():
+        val = coerce_float(pts)
+        if pid is not None and val is not None and val == val:
+            out[str(pid)] = val
+    return out
+
+
+def _matchups_columns(raw: List[Dict[str, Any]], league_id: str | None = None) -> ColumnBatch:
+    """Batch transform: filter by league, dedup by (league_id, week, roster_id) (latest wins), then conform columns."""
+    lids = [rec.get("league_id") for rec in raw]
+    rids = [rec.get("roster_id") for rec in raw]
+    present = [
+        i for i in range(len(raw))
+        if lids[i] is not None and rids[i] is not None
+        and (league_id is None or str(lids[i]) == league_id)
+    ]
+    keys = [(str(lids[i]), str(raw[i].get("week")), str(rids[i])) for i in present]
+    survivors = last_wins(keys)
+    rows = [present[j] for j in survivors]
+    return {
+        "league_id": [keys[j][0] for j in survivors],
+        "week": [raw[i].get("week") for i in rows],
+        "roster_id": [rids[i] if isinstance(rids[i], int) else str(rids[i]) for i in rows],
+        "matchup_id": [raw[i].get("matchup_id") for i in rows],
+        "points": [coerce_float(raw[i].get("points")) for i in rows],
+        "players_points": [_players_points(raw[i].get("players_points")) for i in rows],
+    }
+
+
+def _build_matchups(league_id: str | None) -> List[Dict[str, Any]]:
+    # A league partition reads only that league's records (an index lookup with the SQLite bronze backend).
+    if league_id:
+        raw = bronze_store.get_where(NFL_SLEEPER, "matchups", "league_id", league_id)
+    else:
+        raw = bronze_store.get_raw(NFL_SLEEPER, "matchups")
+    return rows_from_columns(_matchups_columns(raw, league_id), SILVER_MATCHUP_KEYS)
+
+
+def _build_player_points() -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    games: Dict[str, int] = {}
+    for m in get_matchups():
+        for pid, pts in m["players_points"].items():
+            totals[pid] = totals.get(pid, 0.0) + pts
+            games[pid] = games.get(pid, 0) + 1
+    return {pid: totals[pid] / games[pid] for pid in totals}
+
+
+dag.partition_bronze(NFL_SLEEPER, "matchups", "league_id")
+dag.register("silver.matchups", [dag.bronze_node(NFL_SLEEPER, "matchups")], _build_matchups, partitioned=True)
+dag.register("silver.player_points", ["silver.matchups"], _build_player_points)
+
+
+@timed
+def get_matchups(league_id: str | None = None) -> List[Dict[str, Any]]:
+    """Return silver matchups. If league_id given, filter to that league. Dedup by (league_id, week, roster_id)."""
+    return list(dag.get("silver.matchups", league_id))
+
+
+@timed
+def get_player_points() -> Dict[str, float]:
+    """Return mean matchup points per player_id across all silver matchups."""
+    return dag.get("silver.player_points")
@@ -0,0 +1,88 @@
+"""Silver: parallel rebuilds. Transform + pre-dedup bronze chunks in a persistent process pool, merge latest-wins."""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from analytics_foundry.silver.columnar import ColumnBatch, last_wins
+
+# Below this many bronze rows a rebuild stays serial; pool startup would dominate.
+PARALLEL_MIN_ROWS = 50_000
+
+BatchTransform = Callable[[List[Dict[str, Any]]], ColumnBatch]
+
+# Rebuilds are started from request and executor threads, and forking a threaded process can copy a lock
+# another thread holds; workers come from a fork server (or are spawned) instead.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_LOCK = threading.Lock()
+# The process pool, kept across rebuilds (created on first use, replaced when the worker count changes).
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide rebuild pool with `workers` processes."""
+    global _POOL, _POOL_WORKERS
+    with _LOCK:
+        if _POOL is None or _POOL_WORKERS != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            ctx = multiprocessing.get_context(_START_METHOD)
+            _POOL, _POOL_WORKERS = ProcessPoolExecutor(max_workers=workers, mp_context=ctx), workers
+        return _POOL
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down the rebuild pool (e.g. at app shutdown); the next parallel rebuild starts a new one."""
+    global _POOL, _POOL_WORKERS
+    with _LOCK:
+        pool, _POOL, _POOL_WORKERS = _POOL, None, 0
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def _transform_chunk(transform: BatchTransform, chunk: List[Dict[str, Any]]) -> ColumnBatch:
+    return transform(chunk)
+
+
+def merge_batches(batches: Sequence[ColumnBatch], key_columns: Sequence[str]) -> ColumnBatch:
+    """Merge pre-deduplicated chunk batches (in bronze order) with latest-wins on key_columns.
+
+    Concatenating chunk results and keeping the last occurrence per key gives the same rows and
+    first-seen order as deduplicating the whole input at once.
+    """
+    if len(batches) == 1:
+        return batches[0]
+    columns = list(batches[0])
+    merged: ColumnBatch = {c: [v for b in batches for v in b[c]] for c in columns}
+    if len(key_columns) == 1:
+        keys: Sequence[Any] = merged[key_columns[0]]
+    else:
+        keys = list(zip(*(map(str, merged[c]) for c in key_columns)))
+    survivors = last_wins(keys)
+    return {c: [merged[c][i] for i in survivors] for c in columns}
+
+
+def transform_parallel(
+    raw: List[Dict[str, Any]],
+    transform: BatchTransform,
+    key_columns: Sequence[str],
+    workers: int,
+    min_rows: Optional[int] = None,
+) -> ColumnBatch:
+    """Run a batch transform over raw in `workers` processes; serial when workers <= 1 or raw is small.
+
+    transform must be a module-level function (picklable) returning a deduplicated ColumnBatch. Each chunk is
+    passed to its worker as an argument (pickled). min_rows defaults to PARALLEL_MIN_ROWS.
+    """
+    if min_rows is None:
+        min_rows = PARALLEL_MIN_ROWS
+    if workers <= 1 or len(raw) < max(min_rows, 2):
+        return transform(raw)
+    size = -(-len(raw) // workers)
+    chunks = [raw[start:start + size] for start in range(0, len(raw), size)]
+    pool = get_pool(workers)
+    batches = list(pool.map(_transform_chunk, [transform] * len(chunks), chunks))
+    return merge_batches(batches, key_columns)
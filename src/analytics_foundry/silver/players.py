@@ -1,35 +1,34 @@
 """Silver: cleaned, conformed players. Canonical schema; dedup by player_id (latest wins)."""
 
-from typing import Any, Dict, List
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from analytics_foundry import dag
 from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_silver_workers, get_sql_engine
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver.parallel import transform_parallel
+from analytics_foundry.silver.columnar import (
+    CategoricalColumn,
+    ColumnBatch,
+    NullableColumn,
+    coerce_float as _coerce_float,
+    coerce_float_column,
+    coerce_int as _coerce_int,
+    coerce_int_column,
+    get_column,
+    last_wins,
+    non_null_positions,
+    str_column,
+)
 
 NFL_SLEEPER = "nfl_sleeper"
 
 # Canonical silver schema: player_id, name, position, team, status, injury_status, age, trending, updated_at
 SILVER_PLAYER_KEYS = ("player_id", "name", "position", "team", "status", "injury_status", "age", "trending", "updated_at")
 
-
-def _coerce_int(val: Any) -> int | None:
-    if val is None:
-        return None
-    if isinstance(val, int):
-        return val
-    try:
-        return int(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _coerce_float(val: Any) -> float | None:
-    if val is None:
-        return None
-    if isinstance(val, (int, float)):
-        return float(val)
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
+# Low-cardinality fields stored dictionary-encoded in PlayerTable.
+CATEGORICAL_KEYS = ("position", "team", "status", "injury_status")
 
 
 def _to_silver_player(rec: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,14 +49,181 @@ def _to_silver_player(rec: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def get_players() -> List[Dict[str, Any]]:
-    """Return silver players: cleaned, deduplicated by player_id (latest record wins)."""
+def _players_columns(raw: List[Dict[str, Any]]) -> ColumnBatch:
+    """Batch transform: dedup raw records by player_id (latest wins), then conform whole columns.
+
+    Produces the same rows as _to_silver_player + dict dedup, but only transforms surviving records: ids are
+    deduplicated first, then each field is read with one pass over the survivors (get_column) and conformed
+    with one pass per column, without building a dict per row.
+    """
+    pids = get_column(raw, "player_id")
+    if not all(pids):
+        pids = [pid or rec.get("id") for pid, rec in zip(pids, raw)]
+    present = non_null_positions(pids)
+    # Ids are str(pid) even when falsy (an id fallback of 0 is "0"), unlike the str(v or "") text columns.
+    if isinstance(present, range):
+        keys = [p if type(p) is str else str(p) for p in pids]
+    else:
+        keys = [str(pids[i]) for i in present]
+    survivors = last_wins(keys)
+    if isinstance(present, range) and len(survivors) == len(keys):
+        rows, ids = raw, keys  # no missing ids, no duplicates: survivors are the raw records in order
+    else:
+        rows = [raw[present[j]] for j in survivors]
+        ids = [keys[j] for j in survivors]
+    names = get_column(rows, "display_name")
+    if not all(names):
+        names = [n or r.get("name") for n, r in zip(names, rows)]
+    updated = get_column(rows, "updated_at")
+    if not all(updated):
+        updated = [u or r.get("injury_updated") for u, r in zip(updated, rows)]
+    age, _ = coerce_int_column(get_column(rows, "age"))
+    trending, _ = coerce_float_column(get_column(rows, "trending"))
+    return {
+        "player_id": ids,
+        "name": str_column(names),
+        "position": str_column(get_column(rows, "position")),
+        "team": str_column(get_column(rows, "team")),
+        "status": str_column(get_column(rows, "status")),
+        "injury_status": str_column(get_column(rows, "injury_status")),
+        "age": age,
+        "trending": trending,
+        "updated_at": updated,
+    }
+
+
+class PlayerTable:
+    """Compact silver players: one column per SILVER_PLAYER_KEYS field instead of one dict per player.
+
+    player_id/name are lists of str; position, team, status and injury_status are dictionary-encoded
+    (CATEGORICAL_KEYS); age/trending are typed arrays with null masks. Row i is player i (first-seen
+    bronze order). Gold code reads columns directly; dict-based callers use row views.
+    """
+
+    __slots__ = (
+        "player_id", "name", "position", "team", "status", "injury_status",
+        "age", "trending", "updated_at", "_index",
+    )
+
+    def __init__(self, batch: ColumnBatch):
+        self.player_id: List[str] = batch["player_id"]
+        self.name: List[str] = batch["name"]
+        self.position = CategoricalColumn(batch["position"])
+        self.team = CategoricalColumn(batch["team"])
+        self.status = CategoricalColumn(batch["status"])
+        self.injury_status = CategoricalColumn(batch["injury_status"])
+        ages = batch["age"]
+        self.age = NullableColumn("q", ages, [v is None for v in ages])
+        trending = batch["trending"]
+        self.trending = NullableColumn("d", trending, [v is None for v in trending])
+        self.updated_at: List[Any] = batch["updated_at"]
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any], index: Any = None) -> "PlayerTable":
+        """Assemble a table from already-built columns (one per SILVER_PLAYER_KEYS field), without copying.
+
+        index serves index_of when given (anything with .get(player_id)); otherwise a dict is built on first use.
+        """
+        table = cls.__new__(cls)
+        for key in SILVER_PLAYER_KEYS:
+            setattr(table, key, columns[key])
+        table._index = index
+        return table
+
+    def __len__(self) -> int:
+        return len(self.player_id)
+
+    def __iter__(self) -> Iterator["PlayerRow"]:
+        return (PlayerRow(self, i) for i in range(len(self)))
+
+    def row(self, i: int) -> "PlayerRow":
+        """Return a read-only dict-like view of row i."""
+        return PlayerRow(self, i)
+
+    def index_of(self, player_id: str) -> Optional[int]:
+        """Return the row of player_id, or None. Index is built on first use."""
+        if self._index is None:
+            self._index = {pid: i for i, pid in enumerate(self.player_id)}
+        return self._index.get(player_id)
+
+    def column(self, key: str) -> Any:
+        """Return the column for a SILVER_PLAYER_KEYS field (indexable by row)."""
+        if key not in SILVER_PLAYER_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def rows_where(self, key: str, values: Iterable[str]) -> List[int]:
+        """Return rows whose categorical field (CATEGORICAL_KEYS) is one of values, comparing codes."""
+        if key not in CATEGORICAL_KEYS:
+            raise KeyError(key)
+        return getattr(self, key).positions(list(values))
+
+    def to_dicts(self, rows: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Materialize rows (default: all) as silver player dicts."""
+        cols = [self.column(k) for k in SILVER_PLAYER_KEYS]
+        if rows is None:
+            return [dict(zip(SILVER_PLAYER_KEYS, vals)) for vals in zip(*cols)]
+        return [dict(zip(SILVER_PLAYER_KEYS, [c[i] for c in cols])) for i in rows]
+
+    def iter_dicts(self, rows: Optional[Iterable[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield rows (default: all) as silver player dicts one at a time (for streaming)."""
+        cols = [self.column(k) for k in SILVER_PLAYER_KEYS]
+        if rows is None:
+            return (dict(zip(SILVER_PLAYER_KEYS, vals)) for vals in zip(*cols))
+        return (dict(zip(SILVER_PLAYER_KEYS, [c[i] for c in cols])) for i in rows)
+
+
+class PlayerRow(Mapping):
+    """Read-only dict view of one PlayerTable row (keys: SILVER_PLAYER_KEYS)."""
+
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: PlayerTable, i: int):
+        self._table = table
+        self._i = i
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in SILVER_PLAYER_KEYS:
+            raise KeyError(key)
+        return getattr(self._table, key)[self._i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SILVER_PLAYER_KEYS)
+
+    def __len__(self) -> int:
+        return len(SILVER_PLAYER_KEYS)
+
+    def __repr__(self) -> str:
+        return f"PlayerRow({dict(self)!r})"
+
+
+def _build_player_table() -> PlayerTable:
+    """Rebuild the table from bronze. Large rebuilds run in a process pool when FOUNDRY_SILVER_WORKERS > 1;
+    with FOUNDRY_SQL_ENGINE=sqlite the sql/silver/players.sql artifact builds it instead."""
+    if get_sql_engine() == "sqlite":
+        from analytics_foundry import sql_engine
+
+        return PlayerTable(sql_engine.get_engine().query_columns("silver", "players", keys=SILVER_PLAYER_KEYS))
     raw = bronze_store.get_raw(NFL_SLEEPER, "players")
-    by_id: Dict[str, Dict[str, Any]] = {}
-    for rec in raw:
-        silver = _to_silver_player(rec)
-        if not silver:
-            continue
-        pid = silver["player_id"]
-        by_id[pid] = silver
-    return list(by_id.values())
+    return PlayerTable(transform_parallel(raw, _players_columns, ("player_id",), get_silver_workers()))
+
+
+dag.register("silver.players", [dag.bronze_node(NFL_SLEEPER, "players")], _build_player_table)
+
+
+@timed
+def get_player_table() -> PlayerTable:
+    """Return the compact silver player table; rebuilt lazily only after bronze players change."""
+    return dag.get("silver.players")
+
+
+@timed
+def get_players() -> List[Dict[str, Any]]:
+    """Return silver players: cleaned, deduplicated by player_id (latest record wins).
+
+    Materializes one dict per player from the table, which costs more than the columnar build itself (at low
+    duplication, more than the old per-record transform); kept for dict-based callers. In-tree readers use
+    get_player_table() columns, row views or PlayerTable.iter_dicts instead.
+    """
+    return get_player_table().to_dicts()
@@ -1,8 +1,17 @@
-"""Silver: cleaned, conformed rosters. Canonical schema; dedup by (league_id, roster_id) (latest wins)."""
+"""Silver: cleaned, conformed rosters. Canonical schema; dedup by (league_id, roster_id) (latest wins).
 
-from typing import Any, Dict, List
+Also maintains a player -> {league_id: roster_id} join index: built once from silver rosters, then updated
+from each bronze rosters append (a roster's latest record replaces its players), so joins from a player set
+(e.g. injured players) cost O(those players), not O(all rosters).
+"""
 
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from analytics_foundry import dag
 from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.metrics import timed
+from analytics_foundry.silver.columnar import ColumnBatch, last_wins, rows_from_columns
 
 NFL_SLEEPER = "nfl_sleeper"
 
@@ -25,25 +34,171 @@ def _to_silver_roster(rec: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _rosters_columns(raw: List[Dict[str, Any]], league_id: str | None = None) -> ColumnBatch:
+    """Batch transform: filter by league, dedup by (league_id, roster_id) (latest wins), then conform columns."""
+    lids = [rec.get("league_id") for rec in raw]
+    rids = [rec.get("roster_id") for rec in raw]
+    present = [
+        i for i in range(len(raw))
+        if lids[i] is not None and rids[i] is not None
+        and (league_id is None or str(lids[i]) == league_id)
+    ]
+    keys = [(str(lids[i]), str(rids[i])) for i in present]
+    survivors = last_wins(keys)
+    rows = [present[j] for j in survivors]
+    return {
+        "league_id": [keys[j][0] for j in survivors],
+        "roster_id": [rids[i] if isinstance(rids[i], int) else str(rids[i]) for i in rows],
+        "players": [[str(p) for p in (raw[i].get("players") or []) if p is not None] for i in rows],
+    }
+
+
+def _build_rosters(league_id: str | None) -> List[Dict[str, Any]]:
+    # A league partition reads only that league's records (an index lookup with the SQLite bronze backend).
+    if league_id:
+        raw = bronze_store.get_where(NFL_SLEEPER, "rosters", "league_id", league_id)
+    else:
+        raw = bronze_store.get_raw(NFL_SLEEPER, "rosters")
+    return rows_from_columns(_rosters_columns(raw, league_id), SILVER_ROSTER_KEYS)
+
+
+def _build_rosters_many(league_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Build several leagues' rosters from one bronze scan."""
+    out: Dict[str, List[Dict[str, Any]]] = {lid: [] for lid in league_ids}
+    raw = bronze_store.get_raw(NFL_SLEEPER, "rosters")
+    for r in rows_from_columns(_rosters_columns(raw), SILVER_ROSTER_KEYS):
+        if r["league_id"] in out:
+            out[r["league_id"]].append(r)
+    return out
+
+
+def _player_ids(rosters: List[Dict[str, Any]]) -> frozenset[str]:
+    ids: set[str] = set()
+    for r in rosters:
+        ids.update(r.get("players") or [])
+    return frozenset(ids)
+
+
+def _build_rostered_player_ids(league_id: str | None) -> frozenset[str]:
+    return _player_ids(get_rosters(league_id=league_id))
+
+
+def _build_rostered_player_ids_many(league_ids: List[str]) -> Dict[str, frozenset[str]]:
+    return {lid: _player_ids(rs) for lid, rs in dag.get_many("silver.rosters", league_ids).items()}
+
+
+# Bronze roster records carry league_id, so a league's ingest only dirties that league's partitions.
+dag.partition_bronze(NFL_SLEEPER, "rosters", "league_id")
+dag.register(
+    "silver.rosters", [dag.bronze_node(NFL_SLEEPER, "rosters")], _build_rosters,
+    partitioned=True, build_many=_build_rosters_many,
+)
+dag.register(
+    "silver.rostered_player_ids", ["silver.rosters"], _build_rostered_player_ids,
+    partitioned=True, build_many=_build_rostered_player_ids_many,
+)
+
+
+_INDEX_LOCK = threading.RLock()
+_INDEX_BUILT = False
+# (league_id, str(roster_id)) -> (roster_id, players) of its latest record.
+_ROSTER_PLAYERS: Dict[Tuple[str, str], Tuple[Any, List[str]]] = {}
+# player_id -> {(league_id, str(roster_id)): roster_id} for every roster holding the player.
+_PLAYER_ROSTERS: Dict[str, Dict[Tuple[str, str], Any]] = {}
+
+
+def _index_reset() -> None:
+    global _INDEX_BUILT
+    _INDEX_BUILT = False
+    _ROSTER_PLAYERS.clear()
+    _PLAYER_ROSTERS.clear()
+
+
+def _index_roster(league_id: str, roster_id: Any, players: List[str]) -> None:
+    """Replace one roster's players in the index."""
+    key = (league_id, str(roster_id))
+    old = _ROSTER_PLAYERS.get(key)
+    if old is not None:
+        for pid in old[1]:
+            rosters = _PLAYER_ROSTERS.get(pid)
+            if rosters is not None:
+                rosters.pop(key, None)
+                if not rosters:
+                    del _PLAYER_ROSTERS[pid]
+    _ROSTER_PLAYERS[key] = (roster_id, players)
+    for pid in players:
+        _PLAYER_ROSTERS.setdefault(pid, {})[key] = roster_id
+
+
+def _index_columns(batch: ColumnBatch) -> None:
+    for lid, rid, players in zip(batch["league_id"], batch["roster_id"], batch["players"]):
+        _index_roster(lid, rid, players)
+
+
+def _on_bronze_rosters(records: Optional[List[Dict[str, Any]]]) -> None:
+    """DAG hook: called with each bronze rosters append (None on reset) before dependents are dirtied."""
+    with _INDEX_LOCK:
+        if records is None:
+            _index_reset()
+        elif _INDEX_BUILT:
+            _index_columns(_rosters_columns(records))
+
+
+dag.register("silver.player_leagues", [dag.bronze_node(NFL_SLEEPER, "rosters")], on_change=_on_bronze_rosters)
+
+
+def _ensure_index_built() -> None:
+    global _INDEX_BUILT
+    while not _INDEX_BUILT:
+        # Read rosters without holding the index lock (the DAG calls our hook under its own lock), then build
+        # only if bronze rosters did not change meanwhile; later appends are applied by the hook.
+        v = dag.version("silver.rosters")
+        rosters = get_rosters()
+        with _INDEX_LOCK:
+            if _INDEX_BUILT:
+                return
+            if dag.version("silver.rosters") == v:
+                for r in rosters:
+                    _index_roster(r["league_id"], r["roster_id"], r["players"])
+                _INDEX_BUILT = True
+
+
+@timed
+def get_player_leagues(player_id: str) -> Dict[str, Any]:
+    """Return {league_id: roster_id} for every roster holding player_id (join index lookup)."""
+    _ensure_index_built()
+    with _INDEX_LOCK:
+        return {lid: rid for (lid, _), rid in _PLAYER_ROSTERS.get(player_id, {}).items()}
+
+
+@timed
+def get_roster_ids(league_id: str, player_ids: Iterable[str]) -> Dict[str, Any]:
+    """Return {player_id: roster_id} for the given players rostered in league_id (others omitted).
+
+    O(len(player_ids)) via the join index."""
+    _ensure_index_built()
+    with _INDEX_LOCK:
+        out = {}
+        for pid in player_ids:
+            for (lid, _), rid in _PLAYER_ROSTERS.get(pid, {}).items():
+                if lid == league_id:
+                    out[pid] = rid
+        return out
+
+
+@timed
 def get_rosters(league_id: str | None = None) -> List[Dict[str, Any]]:
     """Return silver rosters. If league_id given, filter to that league. Dedup by (league_id, roster_id)."""
-    raw = bronze_store.get_raw(NFL_SLEEPER, "rosters")
-    by_key: Dict[tuple, Dict[str, Any]] = {}
-    for rec in raw:
-        silver = _to_silver_roster(rec)
-        if not silver:
-            continue
-        lid = silver["league_id"]
-        if league_id is not None and lid != league_id:
-            continue
-        key = (lid, str(silver["roster_id"]))
-        by_key[key] = silver
-    return list(by_key.values())
+    return list(dag.get("silver.rosters", league_id))
+
+
+@timed
+def get_league_ids() -> List[str]:
+    """Return league_ids that have silver rosters, in first-seen order."""
+    return list(dict.fromkeys(r["league_id"] for r in get_rosters()))
 
 
+@timed
 def get_rostered_player_ids(league_id: str) -> set[str]:
     """Return set of player_ids that are on rosters in the given league."""
-    ids: set[str] = set()
-    for r in get_rosters(league_id=league_id):
-        ids.update(r.get("players") or [])
-    return ids
+    return set(dag.get("silver.rostered_player_ids", league_id))
@@ -0,0 +1,490 @@
+"""Shared read-only data plane: silver datasets published as memory-mapped snapshot files.
+
+One writer process (python -m analytics_foundry.snapshot) ingests, builds the silver datasets and publishes
+them as one immutable file under <data dir>/snapshots/, then atomically repoints CURRENT at it. API workers
+started with FOUNDRY_DATA_PLANE=snapshot (e.g. uvicorn --workers 8) attach instead of loading bronze: they
+never ingest, and the DAG builds their silver datasets from the mapped file. Player table code and numeric
+columns are memoryviews over the mapping and strings are decoded on access, so the table's pages are shared
+by every worker through the OS page cache; rosters, matchups and leagues are decoded per league on demand.
+Workers poll CURRENT and swap to a new file by resetting the DAG over it; requests already running keep the
+old mapping until they finish. Gold indexes and response caches stay per worker, built from the mapped data.
+"""
+
+import argparse
+import asyncio
+import json
+import mmap
+import os
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from analytics_foundry import dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_data_plane, get_snapshot_poll_seconds
+from analytics_foundry.executors import run_io
+from analytics_foundry.silver import league as silver_league
+from analytics_foundry.silver import matchups as silver_matchups
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver import rosters as silver_rosters
+from analytics_foundry.silver.columnar import CategoricalColumn, NullableColumn
+
+NFL_SLEEPER = "nfl_sleeper"
+
+# File layout: MAGIC, header length (8 bytes little-endian), JSON header padded to 8 bytes, data section.
+# Header spans are [offset, length] into the data section; every span starts 8-byte aligned.
+MAGIC = b"AFSNAP01"
+POINTER = "CURRENT"
+# Published files kept besides the current one, for workers that have not swapped yet.
+KEEP = 2
+_ALIGN = 8
+
+# Silver datasets served from the snapshot, and the bronze tables behind them (reset on every swap).
+DATASETS = ("silver.players", "silver.rosters", "silver.leagues", "silver.matchups")
+_BRONZE_TABLES = ("players", "rosters", "league", "matchups")
+
+Span = List[int]
+
+
+def snapshot_dir() -> Optional[Path]:
+    """Return <data dir>/snapshots, or None when running in memory only."""
+    root = bronze_store.get_data_root()
+    return None if root is None else root / "snapshots"
+
+
+def _current_name(directory: Path) -> Optional[str]:
+    try:
+        name = (directory / POINTER).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return name or None
+
+
+def _generation(name: Optional[str]) -> int:
+    return int(name.split("-")[1].split(".")[0]) if name else 0
+
+
+# --- Writer ---
+
+
+class _Sections:
+    """Data section under construction: appended byte ranges, each 8-byte aligned."""
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+
+    def add(self, data: bytes) -> Span:
+        self.buf += bytes(-len(self.buf) % _ALIGN)
+        start = len(self.buf)
+        self.buf += data
+        return [start, len(data)]
+
+    def strings(self, values: Iterator[str]) -> Dict[str, Span]:
+        """Add a string column: concatenated UTF-8 plus n + 1 row offsets."""
+        offsets = array("q", [0])
+        blob = bytearray()
+        for v in values:
+            blob += v.encode("utf-8")
+            offsets.append(len(blob))
+        return {"offsets": self.add(offsets.tobytes()), "data": self.add(bytes(blob))}
+
+    def json(self, value: Any) -> Span:
+        return self.add(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _typecode(values: Any) -> str:
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def _encode_players(table: silver_players.PlayerTable, out: _Sections) -> Dict[str, Any]:
+    columns: Dict[str, Any] = {}
+    for key in silver_players.SILVER_PLAYER_KEYS:
+        col = table.column(key)
+        if isinstance(col, CategoricalColumn):
+            columns[key] = {
+                "kind": "categorical", "typecode": _typecode(col.codes),
+                "codes": out.add(bytes(col.codes)), "dictionary": col.dictionary,
+            }
+        elif isinstance(col, NullableColumn) and not isinstance(col.values, list):
+            columns[key] = {
+                "kind": "nullable", "typecode": _typecode(col.values),
+                "values": out.add(bytes(col.values)), "nulls": out.add(bytes(col.nulls)),
+            }
+        elif key in ("player_id", "name"):
+            columns[key] = {"kind": "str", **out.strings(iter(col))}
+        else:
+            columns[key] = {"kind": "json", **out.strings(json.dumps(v) for v in col)}
+    order = sorted(range(len(table)), key=table.player_id.__getitem__)
+    return {"rows": len(table), "columns": columns, "index": out.add(array("q", order).tobytes())}
+
+
+def _encode_by_league(rows: List[Dict[str, Any]], out: _Sections) -> Dict[str, Span]:
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        groups.setdefault(r["league_id"], []).append(r)
+    return {lid: out.json(group) for lid, group in groups.items()}
+
+
+def _write_atomic(path: Path, *parts: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        for part in parts:
+            f.write(part)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _prune(directory: Path, current: str) -> None:
+    old = sorted(p for p in directory.glob("snapshot-*.bin") if p.name != current)
+    for p in old[:max(0, len(old) - KEEP)]:
+        try:
+            p.unlink()  # workers still mapping it keep their pages (POSIX)
+        except OSError:
+            pass
+
+
+_PUBLISH_LOCK = threading.Lock()
+# Directory -> served dataset versions at its last publish from this process.
+_PUBLISHED: Dict[Path, Tuple[int, ...]] = {}
+
+
+def _versions() -> Tuple[int, ...]:
+    return tuple(dag.version(name) for name in DATASETS)
+
+
+def publish(directory: Optional[Path] = None) -> Path:
+    """Build the silver datasets (via the DAG, so only dirty ones rebuild) and publish them as the next
+    generation: the file is written in full, then CURRENT is atomically replaced to name it."""
+    directory = Path(directory) if directory is not None else snapshot_dir()
+    if directory is None:
+        raise ValueError("No data directory: set FOUNDRY_DATA_DIR to publish snapshots")
+    directory.mkdir(parents=True, exist_ok=True)
+    with _PUBLISH_LOCK:
+        # Versions before reading: a change while we build is published again next time.
+        versions = _versions()
+        out = _Sections()
+        header = {
+            "generation": _generation(_current_name(directory)) + 1,
+            "created_at": time.time(),
+            "players": _encode_players(silver_players.get_player_table(), out),
+            "leagues": out.json(silver_league.get_leagues()),
+            "rosters": _encode_by_league(silver_rosters.get_rosters(), out),
+            "matchups": _encode_by_league(silver_matchups.get_matchups(), out),
+        }
+        name = f"snapshot-{header['generation']:012d}.bin"
+        head = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        head += b" " * (-(len(MAGIC) + 8 + len(head)) % _ALIGN)
+        _write_atomic(directory / name, MAGIC, len(head).to_bytes(8, "little"), head, bytes(out.buf))
+        _write_atomic(directory / POINTER, name.encode("utf-8"))
+        _PUBLISHED[directory] = versions
+        _prune(directory, name)
+    return directory / name
+
+
+def publish_if_changed(directory: Optional[Path] = None) -> Optional[Path]:
+    """publish() unless no served silver dataset changed since this process last published there."""
+    target = Path(directory) if directory is not None else snapshot_dir()
+    if target is not None and _PUBLISHED.get(target) == _versions():
+        return None
+    return publish(target)
+
+
+def unpublish(directory: Optional[Path] = None) -> int:
+    """Remove CURRENT and every published snapshot file from directory (default snapshot_dir()); returns the
+    number of snapshot files removed. Workers keep any file they have mapped until they swap."""
+    directory = Path(directory) if directory is not None else snapshot_dir()
+    if directory is None or not directory.is_dir():
+        return 0
+    with _PUBLISH_LOCK:
+        _PUBLISHED.pop(directory, None)
+        (directory / POINTER).unlink(missing_ok=True)
+        removed = 0
+        for p in directory.glob("snapshot-*.bin"):
+            try:
+                p.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def _on_bronze_change(source_id: str, table: str, records: Any) -> None:
+    # A bronze clear on the writer invalidates what it published from that bronze.
+    if records is None and source_id == NFL_SLEEPER and table in _BRONZE_TABLES and not is_attached():
+        unpublish()
+
+
+bronze_store.subscribe(_on_bronze_change)
+
+
+# --- Reader ---
+
+
+class _Strings:
+    """Read-only string column over a mapped snapshot: UTF-8 bytes plus row offsets, decoded on access."""
+
+    __slots__ = ("_offsets", "_data")
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    @staticmethod
+    def _decode(text: str) -> Any:
+        return text
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Any:
+        if i < 0:
+            i += len(self)
+        return self._decode(str(self._data[self._offsets[i]:self._offsets[i + 1]], "utf-8"))
+
+    def __iter__(self) -> Iterator[Any]:
+        data, offsets, decode = self._data, self._offsets, self._decode
+        return (decode(str(data[offsets[i]:offsets[i + 1]], "utf-8")) for i in range(len(self)))
+
+
+class _Json(_Strings):
+    """Read-only column of JSON-encoded values (any type), decoded on access."""
+
+    __slots__ = ()
+
+    _decode = staticmethod(json.loads)
+
+
+class _SortedIndex:
+    """player_id -> row by binary search over the snapshot's rows in player_id order, so workers share the
+    index instead of each building a dict."""
+
+    __slots__ = ("_keys", "_order")
+
+    def __init__(self, keys: _Strings, order: memoryview):
+        self._keys = keys
+        self._order = order
+
+    def get(self, key: str, default: Any = None) -> Any:
+        keys, order = self._keys, self._order
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[order[mid]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and keys[order[lo]] == key:
+            return order[lo]
+        return default
+
+
+class Snapshot:
+    """One published snapshot file, mapped read-only."""
+
+    __slots__ = ("path", "generation", "created_at", "size", "_header", "_data", "_table")
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"Not a snapshot file: {path}")
+        start = len(MAGIC) + 8
+        end = start + int.from_bytes(view[len(MAGIC):start], "little")
+        self._header: Dict[str, Any] = json.loads(str(view[start:end], "utf-8"))
+        self._data = view[end:]
+        self._table: Optional[silver_players.PlayerTable] = None
+        self.path = path
+        self.size = len(view)
+        self.generation: int = self._header["generation"]
+        self.created_at: float = self._header["created_at"]
+
+    def _span(self, span: Span) -> memoryview:
+        offset, length = span
+        return self._data[offset:offset + length]
+
+    def _json(self, span: Span) -> Any:
+        return json.loads(str(self._span(span), "utf-8"))
+
+    def player_table(self) -> silver_players.PlayerTable:
+        """Return the silver player table as views over the mapping (assembled once per snapshot)."""
+        if self._table is None:
+            spec = self._header["players"]
+            columns: Dict[str, Any] = {}
+            for key, col in spec["columns"].items():
+                kind = col["kind"]
+                if kind == "categorical":
+                    columns[key] = CategoricalColumn.from_codes(
+                        self._span(col["codes"]).cast(col["typecode"]), col["dictionary"]
+                    )
+                elif kind == "nullable":
+                    columns[key] = NullableColumn.from_arrays(
+                        self._span(col["values"]).cast(col["typecode"]), self._span(col["nulls"])
+                    )
+                else:
+                    cls = _Json if kind == "json" else _Strings
+                    columns[key] = cls(self._span(col["offsets"]).cast("q"), self._span(col["data"]))
+            index = _SortedIndex(columns["player_id"], self._span(spec["index"]).cast("q"))
+            self._table = silver_players.PlayerTable.from_columns(columns, index)
+        return self._table
+
+    def leagues(self) -> List[Dict[str, Any]]:
+        return self._json(self._header["leagues"])
+
+    def rows(self, kind: str, league_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return silver "rosters" or "matchups" rows of one league (decoding only that league), or all."""
+        spans = self._header[kind]
+        if league_id is None:
+            return [r for span in spans.values() for r in self._json(span)]
+        span = spans.get(league_id)
+        return [] if span is None else self._json(span)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "created_at": self.created_at,
+            "file": self.path.name,
+            "bytes": self.size,
+            "players": self._header["players"]["rows"],
+            "leagues": len(self._header["rosters"]),
+        }
+
+
+_LOCK = threading.Lock()
+_CURRENT: Optional[Snapshot] = None
+# Local (bronze-built) builders of DATASETS, saved while this process serves from snapshots.
+_LOCAL: Dict[str, Tuple[Any, Any]] = {}
+
+
+def _players() -> silver_players.PlayerTable:
+    snap = _CURRENT
+    if snap is None:
+        return silver_players.PlayerTable({k: [] for k in silver_players.SILVER_PLAYER_KEYS})
+    return snap.player_table()
+
+
+def _leagues() -> List[Dict[str, Any]]:
+    snap = _CURRENT
+    return [] if snap is None else snap.leagues()
+
+
+def _by_league(kind: str) -> Tuple[Callable[[Optional[str]], Any], Callable[[List[str]], Dict[str, Any]]]:
+    def build(league_id: Optional[str]) -> List[Dict[str, Any]]:
+        snap = _CURRENT
+        return [] if snap is None else snap.rows(kind, league_id)
+
+    def build_many(league_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        snap = _CURRENT
+        return {lid: [] if snap is None else snap.rows(kind, lid) for lid in league_ids}
+
+    return build, build_many
+
+
+_BUILDERS = {
+    "silver.players": (_players, None),
+    "silver.rosters": _by_league("rosters"),
+    "silver.leagues": (_leagues, None),
+    "silver.matchups": (_by_league("matchups")[0], None),
+}
+
+
+def _reset_dependents() -> None:
+    for table in _BRONZE_TABLES:
+        dag.reset_bronze(NFL_SLEEPER, table)
+
+
+def attach(directory: Optional[Path] = None) -> bool:
+    """Serve the silver datasets from the newest published snapshot, read-only (empty until the first publish).
+    Returns True if what this process serves changed (first attach or a newer snapshot mapped)."""
+    global _CURRENT
+    directory = Path(directory) if directory is not None else snapshot_dir()
+    with _LOCK:
+        changed = not _LOCAL
+        if changed:
+            for name, builders in _BUILDERS.items():
+                _LOCAL[name] = dag.replace_build(name, *builders)
+        name = None if directory is None else _current_name(directory)
+        if name is not None and (_CURRENT is None or _CURRENT.path != directory / name):
+            _CURRENT = Snapshot(directory / name)
+            changed = True
+        if changed:
+            _reset_dependents()
+        return changed
+
+
+def detach() -> None:
+    """Build silver datasets from local bronze again (restores the local builders)."""
+    global _CURRENT
+    with _LOCK:
+        for name, builders in _LOCAL.items():
+            dag.replace_build(name, *builders)
+        _LOCAL.clear()
+        _CURRENT = None
+        _reset_dependents()
+
+
+def is_attached() -> bool:
+    """True if this process serves silver data from snapshots (and so never ingests)."""
+    return bool(_LOCAL)
+
+
+def current() -> Optional[Snapshot]:
+    """Return the mapped snapshot, or None."""
+    return _CURRENT
+
+
+async def poll(directory: Optional[Path] = None) -> None:
+    """Worker loop: attach to each newly published snapshot, checking every get_snapshot_poll_seconds."""
+    while True:
+        await asyncio.sleep(get_snapshot_poll_seconds())
+        try:
+            await run_io(attach, directory)
+        except (OSError, ValueError):
+            continue  # e.g. CURRENT named a file pruned before we mapped it; the next poll retries
+
+
+def info() -> Dict[str, Any]:
+    """Return the data plane and, when attached, the mapped snapshot (generation, file, bytes, players, leagues)."""
+    snap = _CURRENT
+    out: Dict[str, Any] = {"data_plane": get_data_plane(), "attached": is_attached(), "generation": None}
+    if snap is not None:
+        out.update(snap.info())
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Snapshot writer: keep leagues ingested and publish a new snapshot whenever silver data changes."""
+    from analytics_foundry.adapters import get_adapter, register_adapter
+    from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+    from analytics_foundry.config import get_default_league_id
+    from analytics_foundry.gold import league as gold_league
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--league", action="append", help="league_id to keep ingested (repeatable; default: the default league)"
+    )
+    parser.add_argument("--broad", action="store_true", help="also run the broad players ingest every round")
+    parser.add_argument(
+        "--interval", type=float, default=0.0, help="seconds between rounds (0 = publish once and exit)"
+    )
+    args = parser.parse_args(argv)
+    register_adapter(NFLSleeperAdapter)
+    bronze_store.load_from_disk()
+    leagues = args.league or [get_default_league_id()]
+    while True:
+        if args.broad:
+            get_adapter(NFL_SLEEPER).ingest_to_bronze()
+        gold_league.ensure_leagues_ingested(leagues)
+        path = publish_if_changed()
+        if path is not None:
+            print(f"published {path}")
+        if args.interval <= 0:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""SQL execution engine: runs the sql/ medallion artifacts against bronze data in embedded SQLite.
+
+Bronze tables are loaded into an in-memory database as typed columns (BRONZE_TABLES; numeric fields are
+coerced like the Python silver transforms, so malformed values become NULL) and kept in sync incrementally:
+bronze is append-only, so only new records are inserted; a bronze clear reloads the table. Silver artifacts
+are materialized as tables (silver_<name>); which ones, and in what order, comes from the sql_loader lineage
+graph: a query materializes only the silver artifacts upstream of it, and refresh() re-runs only those
+downstream of changed bronze tables, level by level in topological order (the process engine refreshes on
+every bronze write while selected, so reads find silver already materialized). An artifact is re-run when one of
+its inputs (bronze version or upstream materialization) or its file changed. Gold artifacts run on demand
+with :league_id bound. Compiled artifacts come from sql_loader (recompiled on mtime change) and SQLite keeps
+the prepared statements (cached_statements).
+
+Selected by config.get_sql_engine() ("sqlite"); the default "python" backend uses the columnar transforms.
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_sql_engine
+from analytics_foundry.silver.columnar import ColumnBatch, coerce_float, coerce_int
+from analytics_foundry import sql_loader
+
+NFL_SLEEPER = "nfl_sleeper"
+
+# Prepared statements kept per connection.
+_STATEMENT_CACHE_SIZE = 128
+
+
+def _text(v: Any) -> Optional[str]:
+    return None if v is None else str(v)
+
+
+def _truthy_text(v: Any) -> Optional[str]:
+    # Fields the Python transform reads as `x or fallback`: falsy values (0, False, "") load as NULL.
+    return str(v) if v else None
+
+
+def _scalar(v: Any) -> Any:
+    return v if v is None or isinstance(v, (str, int, float)) else str(v)
+
+
+def _truthy_scalar(v: Any) -> Any:
+    return _scalar(v) if v else None
+
+
+# Bronze (source_id, table) -> columns loaded into bronze_<source_id>_<table>, with their coercions.
+# Every table also has seq: the record's position in the bronze table.
+BRONZE_TABLES: Dict[Tuple[str, str], Tuple[Tuple[str, Callable[[Any], Any]], ...]] = {
+    (NFL_SLEEPER, "players"): (
+        ("player_id", _truthy_text),
+        ("id", _text),
+        ("display_name", _truthy_text),
+        ("name", _truthy_text),
+        ("position", _truthy_text),
+        ("team", _truthy_text),
+        ("status", _truthy_text),
+        ("injury_status", _truthy_text),
+        ("age", coerce_int),
+        ("trending", coerce_float),
+        ("updated_at", _truthy_scalar),
+        ("injury_updated", _scalar),
+    ),
+    (NFL_SLEEPER, "rosters"): (
+        ("league_id", _text),
+        ("roster_id", _scalar),
+    ),
+}
+
+# Child tables flattening a list field (one row per element, joined to the parent on seq):
+# parent bronze table -> (child table, list field, child column).
+BRONZE_LISTS: Dict[Tuple[str, str], Tuple[str, str, str]] = {
+    (NFL_SLEEPER, "rosters"): ("bronze_nfl_sleeper_roster_players", "players", "player_id"),
+}
+
+# Indexes created on materialized silver tables (for the gold joins).
+SILVER_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "silver_players": ("player_id",),
+    "silver_roster_players": ("league_id", "player_id"),
+}
+
+_TABLE_REF = re.compile(r"\b((?:bronze|silver)_[a-z0-9_]+)\b")
+
+
+def bronze_table_name(source_id: str, table: str) -> str:
+    """Return the engine table name of a bronze table (bronze_<source_id>_<table>)."""
+    return f"bronze_{source_id}_{table}"
+
+
+def referenced_tables(sql: str) -> List[str]:
+    """Return bronze_/silver_ table names referenced by a SQL text, in first-use order."""
+    return list(dict.fromkeys(_TABLE_REF.findall(sql)))
+
+
+def bronze_key(relation: str) -> Optional[Tuple[str, str]]:
+    """Return the bronze (source_id, table) loaded into an engine table (or its list child table), or None."""
+    for key in BRONZE_TABLES:
+        child = BRONZE_LISTS.get(key)
+        if relation == bronze_table_name(*key) or (child is not None and relation == child[0]):
+            return key
+    return None
+
+
+class SqliteEngine:
+    """In-memory SQLite database holding bronze tables and materialized silver artifacts.
+
+    One connection guarded by a lock (safe to share across threads).
+    """
+
+    def __init__(self) -> None:
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE)
+        self._lock = threading.RLock()
+        # Bronze (source_id, table) -> (version, records) loaded; tables missing here are (re)created on next sync.
+        self._loaded: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        # Silver table -> (input versions, artifact mtime) it was materialized from.
+        self._materialized: Dict[str, Tuple[int, ...]] = {}
+        # Silver table -> times materialized (the version its downstream artifacts compare).
+        self._generation: Dict[str, int] = {}
+        # Engine bronze tables changed since the last refresh().
+        self._changed: Set[str] = set()
+        bronze_store.subscribe(self._on_bronze_change)
+
+    def _on_bronze_change(self, source_id: str, table: str, records: Optional[List[Dict[str, Any]]]) -> None:
+        key = (source_id, table)
+        if key not in BRONZE_TABLES:
+            return
+        with self._lock:
+            self._changed.add(bronze_table_name(*key))
+            if records is None:
+                self._loaded.pop(key, None)
+            if self is _ENGINE and get_sql_engine() == "sqlite":
+                # The serving engine re-runs the affected silver artifacts on write, off the read path.
+                self.refresh()
+
+    def _create_bronze(self, key: Tuple[str, str]) -> None:
+        name = bronze_table_name(*key)
+        cols = ", ".join(c for c, _ in BRONZE_TABLES[key])
+        self._conn.execute(f"DROP TABLE IF EXISTS {name}")
+        self._conn.execute(f"CREATE TABLE {name} (seq INTEGER PRIMARY KEY, {cols})")
+        child = BRONZE_LISTS.get(key)
+        if child is not None:
+            child_name, _, child_col = child
+            self._conn.execute(f"DROP TABLE IF EXISTS {child_name}")
+            self._conn.execute(f"CREATE TABLE {child_name} (seq INTEGER, {child_col})")
+            self._conn.execute(f"CREATE INDEX {child_name}_seq ON {child_name} (seq)")
+
+    def _sync_bronze(self, key: Tuple[str, str]) -> int:
+        """Insert bronze records appended since the last sync (recreating the table after a clear).
+
+        Returns the bronze version synced. An unchanged version costs one lookup; otherwise only the new
+        records are read (bronze_store.get_range), never a copy of the table.
+        """
+        version = bronze_store.get_version(*key)
+        synced = self._loaded.get(key)
+        if synced is not None and synced[0] == version:
+            return version
+        total = bronze_store.row_count(*key)
+        start = None if synced is None else synced[1]
+        if start is None or start > total:
+            self._create_bronze(key)
+            start = 0
+        if start < total:
+            self._insert_bronze(key, start, bronze_store.get_range(*key, start, total))
+        self._loaded[key] = (version, total)
+        return version
+
+    def _insert_bronze(self, key: Tuple[str, str], start: int, new: List[Dict[str, Any]]) -> None:
+        columns = BRONZE_TABLES[key]
+        name = bronze_table_name(*key)
+        marks = ", ".join("?" * (len(columns) + 1))
+        self._conn.executemany(
+            f"INSERT INTO {name} VALUES ({marks})",
+            ([seq] + [coerce(rec.get(c)) for c, coerce in columns] for seq, rec in enumerate(new, start)),
+        )
+        child = BRONZE_LISTS.get(key)
+        if child is not None:
+            child_name, field, _ = child
+            self._conn.executemany(
+                f"INSERT INTO {child_name} VALUES (?, ?)",
+                (
+                    (seq, str(p))
+                    for seq, rec in enumerate(new, start)
+                    for p in (rec.get(field) or [])
+                    if p is not None
+                ),
+            )
+
+    def _input_version(self, relation: str) -> int:
+        key = bronze_key(relation)
+        if key is not None:
+            return self._sync_bronze(key)
+        return self._generation.get(relation, 0)
+
+    def _materialize(self, name: str) -> bool:
+        """(Re)create silver_<name> if its inputs or artifact changed since it was built; True if it ran."""
+        art = sql_loader.load_artifact("silver", name)
+        table = art.output
+        versions = tuple(self._input_version(r) for r in art.inputs) + (art.mtime,)
+        if self._materialized.get(table) == versions:
+            return False
+        self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.execute(f"CREATE TABLE {table} AS {art.sql.rstrip().rstrip(';')}")
+        cols = SILVER_INDEXES.get(table)
+        if cols:
+            self._conn.execute(f"CREATE INDEX {table}_idx ON {table} ({', '.join(cols)})")
+        self._materialized[table] = versions
+        self._generation[table] = self._generation.get(table, 0) + 1
+        return True
+
+    def _run_levels(self, keys: Iterable[Tuple[str, str]]) -> List[List[str]]:
+        """Materialize the silver artifacts among keys level by level; returns the tables re-run per level.
+
+        Artifacts of one level are independent, but SQLite runs one statement per connection at a time, so
+        they run one after another on the engine connection.
+        """
+        out: List[List[str]] = []
+        for level in sql_loader.topological_levels([k for k in keys if k[0] == "silver"]):
+            ran = [sql_loader.relation_name(*key) for key in level if self._materialize(key[1])]
+            if ran:
+                out.append(ran)
+        return out
+
+    def _prepare_inputs(self, inputs: Sequence[str]) -> None:
+        for relation in inputs:
+            key = bronze_key(relation)
+            if key is not None:
+                self._sync_bronze(key)
+        self._run_levels(sql_loader.upstream(inputs, layers=("silver",)))
+
+    def refresh(self, relations: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """Re-run the silver artifacts downstream of changed bronze tables (engine names, e.g.
+        bronze_nfl_sleeper_players; default: those changed since the last refresh), in topological order.
+        Artifacts whose inputs did not change are skipped. Returns the tables re-run, grouped by level."""
+        with self._lock:
+            if relations is None:
+                relations, self._changed = self._changed, set()
+            return self._run_levels(sql_loader.downstream(list(relations)))
+
+    def execute(self, layer: str, name: str, params: Optional[Dict[str, Any]] = None) -> Tuple[List[str], List[tuple]]:
+        """Run sql/<layer>/<name>.sql with named parameters bound; returns (column names, rows)."""
+        with self._lock:
+            art = sql_loader.load_artifact(layer, name)
+            self._prepare_inputs(art.relations)
+            cur = self._conn.execute(art.sql, params or {})
+            rows = cur.fetchall()
+            return [d[0] for d in cur.description], rows
+
+    def query(self, layer: str, name: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run an artifact and return rows as dicts."""
+        cols, rows = self.execute(layer, name, params)
+        return [dict(zip(cols, r)) for r in rows]
+
+    def query_columns(
+        self, layer: str, name: str, params: Optional[Dict[str, Any]] = None, keys: Optional[Sequence[str]] = None
+    ) -> ColumnBatch:
+        """Run an artifact and return its result as columns (only keys, when given)."""
+        cols, rows = self.execute(layer, name, params)
+        wanted = keys or cols
+        data = list(zip(*rows)) if rows else [()] * len(cols)
+        by_name = dict(zip(cols, data))
+        return {k: list(by_name[k]) for k in wanted}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_ENGINE: Optional[SqliteEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_engine() -> SqliteEngine:
+    """Return the process-wide SQLite engine, created on first use."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = SqliteEngine()
+        return _ENGINE
@@ -1,11 +1,24 @@
-"""Load SQL artifacts from sql/ directory. Medallion flow: bronze → silver → gold."""
+"""Load SQL artifacts from sql/ directory. Medallion flow: bronze → silver → gold.
 
-import os
+Artifacts are compiled once (text, input relations from FROM/JOIN minus CTE names, output relation
+<layer>_<name>, :named parameters) and recompiled when the file's mtime changes. Their inputs and outputs
+form the lineage graph used to schedule refreshes: downstream() and topological_levels().
+"""
+
+import re
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 _SQL_ROOT = Path(__file__).resolve().parent.parent.parent / "sql"
 
+ArtifactKey = Tuple[str, str]
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_RELATION = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w.]*)", re.I)
+_CTE = re.compile(r"(?:\bWITH(?:\s+RECURSIVE)?|,)\s*([A-Za-z_]\w*)\s+AS\s*\(", re.I)
+_PARAM = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
 
 def get_sql_root() -> Path:
     """Return path to sql/ directory."""
@@ -20,12 +33,153 @@ def list_sql_files(layer: str) -> List[str]:
     return [f.name for f in folder.iterdir() if f.suffix == ".sql"]
 
 
+def _path(layer: str, name: str) -> Path:
+    return _SQL_ROOT / layer / f"{name}.sql" if not name.endswith(".sql") else _SQL_ROOT / layer / name
+
+
 def read_sql(layer: str, name: str) -> str:
     """Read contents of sql/<layer>/<name>.sql."""
-    path = _SQL_ROOT / layer / f"{name}.sql" if not name.endswith(".sql") else _SQL_ROOT / layer / name
-    return path.read_text(encoding="utf-8")
+    return _path(layer, name).read_text(encoding="utf-8")
 
 
 def medallion_layers() -> List[str]:
     """Return medallion layer order: bronze, silver, gold."""
     return ["bronze", "silver", "gold"]
+
+
+def relation_name(layer: str, name: str) -> str:
+    """Return the relation an artifact produces (<layer>_<name>, e.g. silver_players)."""
+    return f"{layer}_{name}"
+
+
+def parse_relations(sql: str) -> Tuple[List[str], List[str]]:
+    """Return (input relations, parameter names) of a SQL text, in first-use order; CTE names are not inputs."""
+    body = _COMMENT.sub(" ", sql)
+    ctes = {m.lower() for m in _CTE.findall(body)}
+    inputs = [r for r in _RELATION.findall(body) if r.lower() not in ctes]
+    return list(dict.fromkeys(inputs)), list(dict.fromkeys(_PARAM.findall(body)))
+
+
+class Artifact:
+    """A compiled sql/<layer>/<name>.sql: text, input and output relations, parameters, and source mtime."""
+
+    __slots__ = ("layer", "name", "sql", "relations", "inputs", "output", "params", "mtime")
+
+    def __init__(self, layer: str, name: str, sql: str, mtime: int):
+        self.layer = layer
+        self.name = name
+        self.sql = sql
+        self.mtime = mtime
+        self.output = relation_name(layer, name)
+        # Every relation the text reads (what an engine must load to run it).
+        self.relations, self.params = parse_relations(sql)
+        # Lineage inputs: a bronze artifact describes the source table it reads (same name); that is not an edge.
+        self.inputs = [r for r in self.relations if r != self.output]
+
+    @property
+    def key(self) -> ArtifactKey:
+        return (self.layer, self.name)
+
+
+_COMPILED: Dict[ArtifactKey, Artifact] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def load_artifact(layer: str, name: str) -> Artifact:
+    """Return the compiled artifact sql/<layer>/<name>.sql, recompiled when the file's mtime changes.
+
+    Raises FileNotFoundError when the file does not exist.
+    """
+    name = name[:-4] if name.endswith(".sql") else name
+    key = (layer, name)
+    path = _path(layer, name)
+    mtime = path.stat().st_mtime_ns
+    with _COMPILED_LOCK:
+        art = _COMPILED.get(key)
+        if art is not None and art.mtime == mtime:
+            return art
+    art = Artifact(layer, name, read_sql(layer, name), mtime)
+    with _COMPILED_LOCK:
+        _COMPILED[key] = art
+    return art
+
+
+def list_artifacts() -> List[Artifact]:
+    """Return every compiled artifact, by layer then name."""
+    return [
+        load_artifact(layer, f[:-4]) for layer in medallion_layers() for f in sorted(list_sql_files(layer))
+    ]
+
+
+def producer(relation: str) -> Optional[ArtifactKey]:
+    """Return the artifact producing a relation (<layer>_<name>), or None (e.g. a raw bronze child table)."""
+    layer, _, name = relation.partition("_")
+    if layer not in medallion_layers() or not name or not _path(layer, name).is_file():
+        return None
+    return (layer, name)
+
+
+def downstream(relations: Iterable[str], artifacts: Optional[List[Artifact]] = None) -> List[ArtifactKey]:
+    """Return artifacts that (transitively) read any of the relations, in topological order."""
+    arts = artifacts if artifacts is not None else list_artifacts()
+    readers: Dict[str, List[Artifact]] = {}
+    for art in arts:
+        for rel in art.inputs:
+            readers.setdefault(rel, []).append(art)
+    found: Set[ArtifactKey] = set()
+    stack = list(relations)
+    while stack:
+        for art in readers.get(stack.pop(), ()):
+            if art.key not in found:
+                found.add(art.key)
+                stack.append(art.output)
+    return [key for level in topological_levels(found, arts) for key in level]
+
+
+def upstream(relations: Iterable[str], layers: Optional[Sequence[str]] = None) -> List[ArtifactKey]:
+    """Return artifacts producing the relations and (transitively) their inputs, in topological order.
+    With layers, only producers in those layers are followed."""
+    found: Dict[ArtifactKey, Artifact] = {}
+    stack = list(relations)
+    while stack:
+        key = producer(stack.pop())
+        if key is not None and key not in found and (layers is None or key[0] in layers):
+            art = found[key] = load_artifact(*key)
+            stack.extend(art.inputs)
+    return [key for level in topological_levels(found, list(found.values())) for key in level]
+
+
+def topological_levels(
+    keys: Iterable[ArtifactKey], artifacts: Optional[List[Artifact]] = None
+) -> List[List[ArtifactKey]]:
+    """Group artifacts into levels: each depends only on artifacts of earlier levels (among keys), so the
+    artifacts of one level are independent of each other. Raises ValueError on a cycle."""
+    wanted = set(keys)
+    if artifacts is None:
+        artifacts = [load_artifact(*key) for key in wanted]
+    by_output = {art.output: art for art in artifacts if art.key in wanted}
+    deps = {art.key: {by_output[r].key for r in art.inputs if r in by_output} for art in by_output.values()}
+    levels: List[List[ArtifactKey]] = []
+    done: Set[ArtifactKey] = set()
+    while len(done) < len(deps):
+        level = sorted(k for k, d in deps.items() if k not in done and d <= done)
+        if not level:
+            raise ValueError(f"SQL lineage cycle among: {sorted(set(deps) - done)}")
+        levels.append(level)
+        done.update(level)
+    return levels
+
+
+def lineage() -> Dict[str, Any]:
+    """Return the lineage graph: artifacts (inputs, output, params), relation edges, and refresh levels."""
+    arts = list_artifacts()
+    return {
+        "artifacts": [
+            {"layer": a.layer, "name": a.name, "inputs": a.inputs, "output": a.output, "params": a.params}
+            for a in arts
+        ],
+        "edges": [{"from": rel, "to": a.output} for a in arts for rel in a.inputs],
+        "levels": [
+            [f"{layer}/{name}" for layer, name in level] for level in topological_levels([a.key for a in arts], arts)
+        ],
+    }
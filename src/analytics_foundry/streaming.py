@@ -0,0 +1,43 @@
+"""Streaming responses: NDJSON (one JSON object per line) from row iterators, for large gold/admin reads.
+
+Rows are pulled from the iterator and encoded in small batches, so server memory per response stays constant
+and clients can consume rows as soon as the first batch is sent. Opt in with format=ndjson or an
+Accept: application/x-ndjson header.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows encoded per chunk written to the socket.
+_BATCH_ROWS = 256
+
+
+def wants_ndjson(fmt: Optional[str], accept: Optional[str]) -> bool:
+    """True if the request asked for NDJSON (format=ndjson, or Accept lists application/x-ndjson)."""
+    if fmt is not None:
+        return fmt.lower() == "ndjson"
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def ndjson_chunks(rows: Iterable[Any], batch_rows: int = _BATCH_ROWS) -> Iterator[bytes]:
+    """Encode rows as NDJSON, yielding one bytes chunk per batch_rows rows."""
+    encode = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode
+    batch = []
+    for row in rows:
+        batch.append(encode(row))
+        if len(batch) >= batch_rows:
+            batch.append("")
+            yield "\n".join(batch).encode("utf-8")
+            batch = []
+    if batch:
+        batch.append("")
+        yield "\n".join(batch).encode("utf-8")
+
+
+def ndjson_response(rows: Iterable[Any], headers: Optional[dict] = None) -> StreamingResponse:
+    """Stream rows as an NDJSON response."""
+    return StreamingResponse(ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE, headers=headers)
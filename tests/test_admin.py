@@ -1,6 +1,6 @@
 """Tests for Foundry Admin API: tables, transformations, ingest (with mocks), runs stub."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -12,7 +12,7 @@ from analytics_foundry.bronze import store as bronze_store
 @pytest.fixture
 def client():
     """TestClient with league/adapter mocks to avoid real Sleeper API calls."""
-    with patch("analytics_foundry.gold.league.ensure_league_ingested", lambda _: None), \
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()), \
          patch("analytics_foundry.admin_routes.get_adapter") as mock_get:
         adapter = type("MockAdapter", (), {"ingest_to_bronze": lambda self, **kw: None})()
         mock_get.return_value = adapter
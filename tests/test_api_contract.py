@@ -1,6 +1,6 @@
 """Phase 2.1: Contract tests for sleeper-stream-scribe API (all three endpoints + optional league_id)."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -12,7 +12,7 @@ from analytics_foundry.bronze import store as bronze_store
 @pytest.fixture
 def client():
     """TestClient with ensure_league_ingested mocked to avoid real Sleeper API calls."""
-    with patch("analytics_foundry.gold.league.ensure_league_ingested", lambda _: None):
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
         yield TestClient(app)
 
 
@@ -112,10 +112,10 @@ def test_injury_object_shape(client):
 def test_players_available_uses_default_league_when_omitted(client):
     """GET /players/available without league_id uses default league."""
     with patch("analytics_foundry.api.get_default_league_id", return_value="1261894762944802816"), \
-         patch("analytics_foundry.gold.league.ensure_league_ingested") as mock_ensure:
+         patch("analytics_foundry.gold.league.aensure_league_ingested") as mock_ensure:
         resp = client.get("/players/available")
     assert resp.status_code == 200
-    mock_ensure.assert_called_once_with("1261894762944802816")
+    mock_ensure.assert_awaited_once_with("1261894762944802816")
 
 
 def test_cors_headers_present(client):
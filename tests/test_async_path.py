@@ -0,0 +1,128 @@
+"""Phase 3.20: Async request path — async adapter ingest, shared league fetches, executors, no head-of-line blocking."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from analytics_foundry.adapters import aingest
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import league as gold_league
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+def _adapter(calls, gate=None):
+    """Sleeper adapter over in-memory fetches; league "SLOW" blocks until gate is set."""
+
+    def fetch_league(lid):
+        calls.append(lid)
+        if lid == "SLOW":
+            assert gate.wait(5)
+        return {"name": f"League {lid}"}
+
+    return NFLSleeperAdapter(
+        fetch_players=lambda: {"p1": {"full_name": "A", "position": "WR"}},
+        fetch_league=fetch_league,
+        fetch_rosters=lambda lid: [{"roster_id": 1, "players": ["p1"]}],
+        fetch_matchups=lambda lid, week: [{"roster_id": 1, "points": 10}],
+    )
+
+
+def test_async_ingest_matches_sync_ingest():
+    _adapter([]).ingest_to_bronze(league_id="L1")
+    _adapter([]).ingest_to_bronze()
+    expected = {t: bronze_store.get_raw("nfl_sleeper", t) for t in ("league", "rosters", "matchups", "players")}
+    bronze_store.clear()
+    asyncio.run(_adapter([]).aingest_to_bronze(league_id="L1"))
+    asyncio.run(_adapter([]).aingest_to_bronze())
+    assert {t: bronze_store.get_raw("nfl_sleeper", t) for t in expected} == expected
+
+
+def test_concurrent_requests_share_one_league_fetch(monkeypatch):
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    calls = []
+
+    async def run():
+        await asyncio.gather(*(gold_league.aensure_league_ingested("D1") for _ in range(5)))
+        await gold_league.aensure_league_ingested("D1")  # fresh now
+
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter(calls)):
+        asyncio.run(run())
+        assert asyncio.run(gold_league.aensure_leagues_ingested(["D1", "D2", "D2"])) == ["D2"]
+    assert calls == ["D1", "D2"]
+    assert gold_league.is_fresh("D1") and gold_league.is_fresh("D2")
+
+
+def test_sync_only_adapter_ingests_in_io_executor():
+    threads = []
+    adapter = type("SyncOnly", (), {"ingest_to_bronze": lambda self, **kw: threads.append(threading.current_thread())})()
+    asyncio.run(aingest(adapter, league_id="L1"))
+    assert threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("foundry-io")
+
+
+def test_cache_hits_do_not_wait_for_slow_league_fetch(monkeypatch):
+    """While one request waits on a slow upstream fetch, requests for fresh leagues are still answered."""
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    calls, gate = [], threading.Event()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            assert (await client.get("/players/available", params={"league_id": "FAST"})).status_code == 200
+            slow = asyncio.create_task(client.get("/players/available", params={"league_id": "SLOW"}))
+            while "SLOW" not in calls:
+                await asyncio.sleep(0.01)
+            for _ in range(20):
+                resp = await asyncio.wait_for(client.get("/players/available", params={"league_id": "FAST"}), 2)
+                assert resp.status_code == 200
+            assert not slow.done()
+            gate.set()
+            assert (await slow).status_code == 200
+
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter(calls, gate)):
+        try:
+            asyncio.run(run())
+        finally:
+            gate.set()
+    assert calls == ["FAST", "SLOW"]
+
+
+def test_slow_bronze_write_does_not_block_the_event_loop():
+    real_append = bronze_store.append_raw
+
+    def slow_append(*args, **kwargs):
+        time.sleep(0.5)
+        return real_append(*args, **kwargs)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            ingest = asyncio.create_task(_adapter([]).aingest_to_bronze(league_id="L1"))
+            await asyncio.sleep(0.05)
+            t0 = time.perf_counter()
+            resp = await client.get("/healthz")
+            elapsed = time.perf_counter() - t0
+            assert not ingest.done()
+            await ingest
+        return resp, elapsed
+
+    with patch("analytics_foundry.adapters.nfl_sleeper.bronze_store.append_raw", slow_append):
+        resp, elapsed = asyncio.run(run())
+    assert resp.status_code == 200
+    assert elapsed < 0.25
+    assert bronze_store.get_raw("nfl_sleeper", "league")[0]["league_id"] == "L1"
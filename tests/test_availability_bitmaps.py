@@ -0,0 +1,72 @@
+"""Phase 3.7: Per-league availability bitmaps — dense player ids, rostered bitmaps, batch precompute."""
+
+import pytest
+
+from analytics_foundry import dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import availability
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.silver import players as silver_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+def _seed(n_players=20):
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}"} for i in range(n_players)])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p0", "p9", "ghost"]},
+        {"league_id": "L1", "roster_id": 2, "players": ["p17"]},
+        {"league_id": "L2", "roster_id": 1, "players": ["p1"]},
+    ])
+
+
+@pytest.mark.parametrize("rows", [[], [0], [3, 7, 8, 15, 16], list(range(0, 1000, 3))])
+def test_bitmap_round_trip(rows):
+    """rows_of_bitmap(bitmap_of_rows(rows)) returns the rows in ascending order."""
+    bits = availability.bitmap_of_rows(rows, 1000)
+    assert bits == sum(1 << i for i in rows)
+    assert availability.rows_of_bitmap(bits) == sorted(rows)
+
+
+def test_rostered_bitmap_uses_player_rows():
+    """Bit i is set when silver player row i is rostered in the league; unknown ids are ignored."""
+    _seed()
+    table = silver_players.get_player_table()
+    bits = availability.get_rostered_bitmap("L1")
+    assert availability.rows_of_bitmap(bits) == [table.index_of(p) for p in ("p0", "p9", "p17")]
+    assert availability.get_available_bitmap(None) == availability.all_players_mask(20)
+
+
+def test_available_players_match_set_filter():
+    """Bitmap-based availability returns the same players, in order, as filtering by the rostered set."""
+    _seed()
+    for lid in ("L1", "L2", "L_missing"):
+        rostered = {"L1": {"p0", "p9", "p17"}, "L2": {"p1"}}.get(lid, set())
+        expected = [p for p in silver_players.get_player_table().player_id if p not in rostered]
+        assert [p["id"] for p in gold_players.get_available_players(lid)] == expected
+
+
+def test_roster_change_rebuilds_only_that_league_bitmap():
+    """A roster write in L1 dirties L1's bitmap and leaves L2's cached."""
+    _seed()
+    availability.precompute()
+    assert not dag.is_dirty("gold.rostered_bitmap", "L1")
+    assert not dag.is_dirty("gold.rostered_bitmap", "L2")
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 3, "players": ["p2"]}])
+    assert dag.is_dirty("gold.rostered_bitmap", "L1")
+    assert not dag.is_dirty("gold.rostered_bitmap", "L2")
+    assert 2 not in availability.get_available_rows("L1")
+
+
+def test_precompute_all_leagues():
+    """precompute() builds bitmaps for every league with rosters in one pass."""
+    _seed()
+    bitmaps = availability.precompute()
+    assert list(bitmaps) == ["L1", "L2"]
+    assert bitmaps["L2"] == availability.get_rostered_bitmap("L2")
+    assert availability.precompute(["L2"]) == {"L2": bitmaps["L2"]}
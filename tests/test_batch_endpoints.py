@@ -0,0 +1,154 @@
+"""Phase 3.14: Multi-league batch endpoints — league freshness, concurrent ingest, one shared pass per batch."""
+
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import league as gold_league
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.gold import recommendations as gold_recommendations
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _seed(n=40, leagues=("L1", "L2", "L3")):
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": f"p{i}", "display_name": f"N{i}", "position": ["QB", "RB", "WR"][i % 3],
+         "team": ["KC", "BUF"][i % 2], "trending": float(i % 7)}
+        for i in range(n)
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": lid, "roster_id": 1, "players": [f"p{i}" for i in range(k, n, 3 + k)]}
+        for k, lid in enumerate(leagues)
+    ])
+
+
+def _counting_adapter(calls, delay=0.0):
+    def fetch_rosters(lid):
+        calls.append(lid)
+        time.sleep(delay)
+        return [{"roster_id": 1, "players": []}]
+
+    return NFLSleeperAdapter(
+        fetch_league=lambda lid: {"name": lid},
+        fetch_rosters=fetch_rosters,
+        fetch_matchups=lambda lid, week: [],
+    )
+
+
+def test_stale_leagues_ingest_concurrently(monkeypatch):
+    """ensure_leagues_ingested fetches only stale leagues, in parallel threads."""
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    calls = []
+    threads = set()
+    adapter = _counting_adapter(calls, delay=0.05)
+    fetch = adapter._fetch_rosters
+
+    def tracking(lid):
+        threads.add(threading.get_ident())
+        return fetch(lid)
+
+    adapter._fetch_rosters = tracking
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=adapter):
+        gold_league.ensure_league_ingested("C0")
+        stale = gold_league.ensure_leagues_ingested(["C0", "C1", "C2", "C3", "C1"])
+    assert stale == ["C1", "C2", "C3"]
+    assert sorted(calls) == ["C0", "C1", "C2", "C3"]
+    assert len(threads) > 1
+
+
+def test_players_batch_matches_single_league_requests(client):
+    """Each league's batch result equals its /players/available response."""
+    _seed()
+    params = {"position": "WR,RB", "sort": "-trending", "limit": 5}
+    r = client.post("/players/available/batch", json={"league_ids": ["L1", "L2", "L3"], **params})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert list(results) == ["L1", "L2", "L3"]
+    gold_cache.clear()
+    for lid in ("L1", "L2", "L3"):
+        single = client.get("/players/available", params={"league_id": lid, **params})
+        assert results[lid]["players"] == single.json()
+        assert results[lid]["next_cursor"] == single.headers.get("X-Next-Cursor")
+
+
+def test_players_batch_cursors_page_per_league(client):
+    """Per-league cursors resume each league independently until next_cursor is null."""
+    _seed()
+    seen = {"L1": [], "L2": []}
+    pending, cursors = list(seen), {}
+    while pending:
+        body = {"league_ids": pending, "limit": 7, "fields": "id", "cursors": cursors}
+        results = client.post("/players/available/batch", json=body).json()["results"]
+        for lid, res in results.items():
+            seen[lid] += [p["id"] for p in res["players"]]
+        cursors = {lid: res["next_cursor"] for lid, res in results.items() if res["next_cursor"]}
+        pending = list(cursors)
+    for lid, ids in seen.items():
+        full = client.get("/players/available", params={"league_id": lid, "fields": "id"}).json()
+        assert ids == [p["id"] for p in full]
+
+
+def test_batch_computes_missed_leagues_together(client):
+    """One batch call computes all missed leagues in one query; cached leagues are not recomputed."""
+    _seed()
+    client.get("/players/available", params={"league_id": "L1"})
+    with patch.object(
+        gold_players, "query_available_players_many", wraps=gold_players.query_available_players_many
+    ) as many:
+        results = client.post("/players/available/batch", json={"league_ids": ["L1", "L2", "L3"]}).json()["results"]
+    many.assert_called_once()
+    assert many.call_args.args[0] == ["L2", "L3"]
+    assert set(results) == {"L1", "L2", "L3"}
+
+
+def test_recommendations_batch_matches_single_league_requests(client):
+    _seed()
+    r = client.post("/recommendations/waiver/batch", json={"league_ids": ["L2", "L1"], "limit": 4, "team": "KC"})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert list(results) == ["L2", "L1"]
+    for lid in ("L1", "L2"):
+        recs, next_cursor = gold_recommendations.query_waiver_recommendations(league_id=lid, limit=4, team=("KC",))
+        assert results[lid] == {"recommendations": recs, "league_id": lid, "next_cursor": next_cursor}
+
+
+def test_batch_ingests_requested_leagues():
+    """The batch endpoint ensures every requested league once (duplicates collapsed)."""
+    calls = []
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock(side_effect=calls.append)):
+        r = TestClient(app).post("/recommendations/waiver/batch", json={"league_ids": ["B1", "B2", "B1"]})
+    assert r.status_code == 200
+    assert sorted(calls) == ["B1", "B2"]
+
+
+def test_batch_rejects_invalid_requests(client):
+    _seed()
+    assert client.post("/players/available/batch", json={"league_ids": []}).status_code == 400
+    assert client.post("/players/available/batch", json={"league_ids": ["L1"], "sort": "bogus"}).status_code == 400
+    too_many = [f"L{i}" for i in range(101)]
+    assert client.post("/recommendations/waiver/batch", json={"league_ids": too_many}).status_code == 400
+    assert client.post(
+        "/recommendations/waiver/batch", json={"league_ids": ["L1"], "cursors": {"L1": "bad"}}
+    ).status_code == 400
+    assert client.post("/recommendations/waiver/batch", json={"league_ids": ["L1"], "limit": -1}).status_code == 400
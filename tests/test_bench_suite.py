@@ -0,0 +1,52 @@
+"""Phase 3.25: Benchmark suite — deterministic generators, per-layer and API benchmarks, result comparison."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import bench_suite  # noqa: E402
+import generators  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+def test_generators_are_deterministic_and_prefix_stable():
+    small = generators.Workload(200, 3, seed=7)
+    again = generators.Workload(200, 3, seed=7)
+    more_players = generators.Workload(500, 3, seed=7)
+    more_leagues = generators.Workload(200, 5, seed=7)
+    assert small.players == again.players and small.rosters == again.rosters and small.matchups == again.matchups
+    assert all(more_players.players[pid] == p for pid, p in small.players.items())
+    assert all(more_leagues.rosters[lid] == small.rosters[lid] for lid in small.league_ids)
+    assert generators.Workload(200, 3, seed=8).players != small.players
+    for lid in small.league_ids:
+        ids = [pid for r in small.rosters[lid] for pid in r["players"]]
+        assert len(ids) == len(set(ids)) and set(ids) <= set(small.players)
+
+
+def test_suite_runs_every_layer_and_compare_flags_regressions():
+    out = bench_suite.run_suite(300, 3, repeat=1, echo=lambda line: None)
+    names = [r["name"] for r in out["results"]]
+    assert {name.split(".")[0] for name in names} == {"bronze", "silver", "gold", "api"}
+    assert out["scale"]["players"] == 300 and out["scale"]["leagues"] == 3
+    assert out["bronze"]["persisted"] is False
+    assert all(r["min_s"] <= r["median_s"] for r in out["results"])
+
+    head = {"results": [dict(r) for r in out["results"]]}
+    head["results"][0]["median_s"] *= 2
+    head["results"][1]["median_s"] /= 2
+    rows = bench_suite.compare(out, head, threshold=0.1)
+    assert [row["status"] for row in rows[:3]] == ["slower", "faster", "same"]
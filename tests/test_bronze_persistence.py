@@ -47,10 +47,15 @@ def test_list_tables_includes_persisted_tables():
 
 
 def test_clear_removes_persisted_files():
-    """clear() removes bronze jsonl files for tables that were in memory."""
+    """clear() removes bronze jsonl files, including tables only on disk (never loaded)."""
     bronze_store.append_raw("nfl_sleeper", "players", [{"id": "1"}])
     root = bronze_store.get_data_root()
     path = root / "bronze" / "nfl_sleeper" / "players.jsonl"
+    disk_only = root / "bronze" / "other" / "unloaded.jsonl"
+    disk_only.parent.mkdir(parents=True, exist_ok=True)
+    disk_only.write_text('{"a": 1}\n', encoding="utf-8")
     assert path.is_file()
     bronze_store.clear()
     assert not path.is_file()
+    assert not disk_only.is_file()
+    assert bronze_store.list_tables() == []
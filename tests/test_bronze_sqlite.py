@@ -0,0 +1,123 @@
+"""Phase 3.17: SQLite bronze backend — WAL database, batches, indexed key/partition/range reads."""
+
+from unittest.mock import patch
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.bronze.sqlite_backend import DB_FILENAME, SqliteBronze
+from analytics_foundry.silver import rosters as silver_rosters
+
+
+@pytest.fixture(autouse=True)
+def sqlite_bronze(monkeypatch, tmp_path):
+    monkeypatch.setenv("FOUNDRY_BRONZE_BACKEND", "sqlite")
+    bronze_store.set_data_root(tmp_path)
+    bronze_store.clear()
+    yield tmp_path
+    bronze_store.clear()
+    bronze_store.set_data_root(None)
+
+
+def _db(root):
+    return root / "bronze" / DB_FILENAME
+
+
+def _rosters():
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p1"]},
+        {"league_id": 2, "roster_id": 1, "players": ["p2"]},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p3"]}])
+
+
+def test_append_persists_to_wal_database(sqlite_bronze):
+    """Records land in the database, readable by another connection (e.g. another process); no JSONL files."""
+    _rosters()
+    other = SqliteBronze(_db(sqlite_bronze))
+    try:
+        assert other._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert other.read("nfl_sleeper", "rosters") == bronze_store.get_raw("nfl_sleeper", "rosters")
+        batches = [r[0] for r in other._conn.execute("SELECT DISTINCT batch_id FROM nfl_sleeper__rosters")]
+        assert len(batches) == 2
+    finally:
+        other.close()
+    assert not (sqlite_bronze / "bronze" / "nfl_sleeper" / "rosters.jsonl").exists()
+
+
+def test_key_and_partition_reads_use_indexes(sqlite_bronze):
+    _rosters()
+    got = bronze_store.get_where("nfl_sleeper", "rosters", "league_id", "L1")
+    assert [r["players"] for r in got] == [["p1"], ["p3"]]
+    # Keys compare as text, like silver keys.
+    assert [r["players"] for r in bronze_store.get_where("nfl_sleeper", "rosters", "league_id", "2")] == [["p2"]]
+    db = bronze_store._sqlite()
+    plan = db._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT payload FROM nfl_sleeper__rosters WHERE league_id = ? ORDER BY seq", ("L1",)
+    ).fetchall()
+    assert any("USING INDEX" in str(row) for row in plan)
+    assert silver_rosters.get_rostered_player_ids("L1") == {"p3"}
+
+
+def test_get_where_matches_the_in_memory_scan(sqlite_bronze, monkeypatch):
+    """Key and non-key filters return the same records on both backends, for bool, numeric and text values."""
+    records = [
+        {"league_id": v, "roster_id": i, "flag": v, "n": v}
+        for i, v in enumerate([True, False, 1, 0, 1.5, 2.0, "1", "True", None, "x"])
+    ]
+    queries = [(f, v) for f in ("league_id", "flag") for v in (True, False, 1, 0, 1.5, 2.0, "1", "True", "x")]
+
+    def results():
+        bronze_store.append_raw("nfl_sleeper", "rosters", records)
+        out = [bronze_store.get_where("nfl_sleeper", "rosters", f, v) for f, v in queries]
+        bronze_store.clear()
+        return out
+
+    on_sqlite = results()
+    monkeypatch.setenv("FOUNDRY_BRONZE_BACKEND", "jsonl")
+    assert results() == on_sqlite
+    assert [r["roster_id"] for r in on_sqlite[queries.index(("flag", True))]] == [0, 7]
+
+
+def test_range_reads(sqlite_bronze):
+    bronze_store.append_raw("other", "t", [{"x": i} for i in range(10)])
+    assert bronze_store.get_range("other", "t", 3, 6) == [{"x": 3}, {"x": 4}, {"x": 5}]
+    assert bronze_store.get_range("other", "t", 8) == [{"x": 8}, {"x": 9}]
+
+
+def test_unloaded_tables_listed_from_batch_metadata(sqlite_bronze):
+    """Tables only in the database are listed with counts from batch metadata; reads go to the database and
+    never copy rows into memory."""
+    db = SqliteBronze(_db(sqlite_bronze))
+    try:
+        db.append("disk", "only", ['{"a": 1}', '{"a": 2}'], [{"a": 1}, {"a": 2}])
+    finally:
+        db.close()
+    assert ("disk", "only", 2) in bronze_store.list_tables()
+    assert ("disk", "only") not in bronze_store._RAW
+    db = bronze_store._sqlite()
+    assert db.table_stats("disk", "only") == next(t for t in db.stats() if t["table"] == "only")
+    assert db.table_stats("disk", "missing") is None
+    # Loading one table looks up only its own stats, not every table's.
+    with patch.object(db, "stats", side_effect=AssertionError("all-table stats")):
+        assert bronze_store.get_raw("disk", "only") == [{"a": 1}, {"a": 2}]
+    version = bronze_store.get_version("disk", "only")
+    assert version > 0
+    bronze_store.append_raw("disk", "only", [{"a": 3}])
+    assert bronze_store.get_version("disk", "only") > version
+    assert bronze_store.row_count("disk", "only") == 3
+    assert list(bronze_store.iter_raw("disk", "only")) == [{"a": 1}, {"a": 2}, {"a": 3}]
+    assert bronze_store._RAW == {}
+
+
+def test_clear_drops_tables(sqlite_bronze):
+    """clear() drops every table in the database, including ones never loaded into memory."""
+    _rosters()
+    db = SqliteBronze(_db(sqlite_bronze))
+    try:
+        db.append("disk", "only", ['{"a": 1}'], [{"a": 1}])
+    finally:
+        db.close()
+    bronze_store.clear()
+    assert bronze_store.list_tables() == []
+    assert bronze_store._sqlite().tables() == []
@@ -0,0 +1,99 @@
+"""Phase 3.13: Statistics catalog — /admin/tables from stats maintained on write, without loading or rebuilding."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import catalog
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.silver import players as silver_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("n", [10, 1000, 50_000])
+def test_hyperloglog_estimate(n):
+    """HLL estimates distinct counts within a few percent (exact-ish when small)."""
+    hll = catalog.HyperLogLog()
+    hll.update(f"p{i % n}" for i in range(2 * n))
+    assert abs(hll.count() - n) <= max(1, 0.05 * n)
+
+
+def test_bronze_stats_maintained_on_write():
+    """Row count, encoded bytes, distinct keys, updated_at and version are kept per bronze table."""
+    records = [{"player_id": "p1"}, {"player_id": "p2"}, {"player_id": "p1", "team": "KC"}]
+    bronze_store.append_raw("nfl_sleeper", "players", records)
+    (stats,) = [t for t in catalog.bronze_stats() if t["table"] == "players"]
+    assert stats["row_count"] == 3
+    assert stats["distinct_keys"] == 2
+    assert stats["bytes"] == sum(len(json.dumps(r).encode()) + 1 for r in records)
+    assert stats["updated_at"] is not None
+    assert stats["version"] == bronze_store.get_version("nfl_sleeper", "players")
+
+
+def test_disk_tables_counted_without_loading():
+    """Tables only on disk are line-counted, not parsed into memory."""
+    root = bronze_store.get_data_root()
+    path = root / "bronze" / "other" / "big.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('{"a": 1}\n{"a": 2}\n{"a": 3}', encoding="utf-8")
+    try:
+        with patch.object(bronze_store, "_load_table", side_effect=AssertionError("loaded")):
+            (stats,) = [t for t in catalog.bronze_stats() if t["table"] == "big"]
+            assert bronze_store.list_tables() == [("other", "big", 3)]
+        assert (stats["row_count"], stats["bytes"], stats["version"]) == (3, path.stat().st_size, None)
+        assert stats["distinct_keys"] is None
+    finally:
+        path.unlink()
+
+
+def test_admin_tables_reports_built_datasets_only(client):
+    """/admin/tables never rebuilds: silver/gold row_count is null until built, then the cached length."""
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}"} for i in range(5)])
+    with patch.object(silver_players, "_build_player_table", side_effect=AssertionError("rebuilt")):
+        data = client.get("/admin/tables").json()
+    silver = {t["name"]: t for t in data["silver"]}
+    assert silver["players"]["row_count"] is None
+    silver_players.get_player_table()
+    silver = {t["name"]: t for t in client.get("/admin/tables").json()["silver"]}
+    assert silver["players"]["row_count"] == 5
+    assert silver["players"]["updated_at"] is not None
+    gold = {t["name"]: t for t in data["gold"]}
+    assert set(gold) == {"available_players", "injury"}
+
+
+def test_derived_bytes_estimated_once_per_version():
+    """Silver/gold bytes estimate every cached partition; None until built, reused until the dataset changes."""
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}", "position": "WR"} for i in range(50)])
+    assert catalog.dataset_stats("silver", "players", "silver.players")["bytes"] is None
+    silver_players.get_player_table()
+    gold_players.get_available_players("L1")
+    with patch.object(catalog, "estimate_bytes", wraps=catalog.estimate_bytes) as estimate:
+        size = catalog.dataset_stats("silver", "players", "silver.players")["bytes"]
+        assert catalog.dataset_stats("silver", "players", "silver.players")["bytes"] == size
+        assert estimate.call_count == 1
+        assert catalog.dataset_stats("gold", "available_players", "gold.available_players")["bytes"] > size
+        bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p99"}])
+        silver_players.get_player_table()
+        assert catalog.dataset_stats("silver", "players", "silver.players")["bytes"] > size
+        assert estimate.call_count == 3
+
+
+def test_estimate_bytes_counts_shared_objects_once():
+    shared = ["x" * 1000]
+    assert catalog.estimate_bytes([shared, shared]) < catalog.estimate_bytes([shared, ["x" * 1000]])
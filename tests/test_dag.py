@@ -0,0 +1,104 @@
+"""Phase 3.6: Medallion dataset DAG — declared inputs, partition-scoped dirtying, lazy rebuilds."""
+
+import pytest
+
+from analytics_foundry import dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.silver import players as silver_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}"} for i in range(4)])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p0"]},
+        {"league_id": "L2", "roster_id": 1, "players": ["p1"]},
+    ])
+
+
+def test_medallion_nodes_declare_inputs():
+    """Silver and gold datasets declare their inputs; lineage runs bronze -> silver -> gold."""
+    nodes = {d["name"]: d for d in dag.describe()}
+    assert nodes["silver.players"]["inputs"] == ["bronze.nfl_sleeper.players"]
+    assert nodes["gold.available_players"]["inputs"] == ["silver.players", "gold.rostered_bitmap"]
+    assert nodes["gold.available_players"]["partitioned"] is True
+    assert nodes["silver.injuries"]["maintained"] is True
+    down = dag.downstream("bronze.nfl_sleeper.rosters")
+    order = ["silver.rosters", "silver.rostered_player_ids", "gold.rostered_bitmap", "gold.available_players"]
+    assert [down.index(n) for n in order] == sorted(down.index(n) for n in order)
+    assert "silver.players" not in down
+
+
+def test_roster_change_only_dirties_that_league():
+    """A roster write for L1 leaves silver players and L2 gold outputs built."""
+    _seed()
+    table = silver_players.get_player_table()
+    l1 = gold_players.get_available_players("L1")
+    l2 = gold_players.get_available_players("L2")
+    v_players = dag.version("silver.players")
+    v_l2 = dag.version("gold.available_players", "L2")
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 2, "players": ["p2"]}])
+    assert not dag.is_dirty("silver.players")
+    assert not dag.is_dirty("gold.available_players", "L2")
+    assert dag.is_dirty("gold.available_players", "L1")
+    assert dag.version("silver.players") == v_players
+    assert dag.version("gold.available_players", "L2") == v_l2
+    assert silver_players.get_player_table() is table
+    assert gold_players.get_available_players("L2") == l2
+    assert [p["id"] for p in gold_players.get_available_players("L1")] == ["p1", "p3"]
+    assert len(l1) == 3
+
+
+def test_player_change_dirties_all_leagues():
+    """A bronze players write dirties silver players and every league's gold output."""
+    _seed()
+    gold_players.get_available_players("L1")
+    gold_players.get_available_players("L2")
+    v_l1 = dag.version("gold.available_players", "L1")
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p9"}])
+    assert dag.is_dirty("silver.players")
+    assert dag.is_dirty("gold.available_players", "L1")
+    assert dag.is_dirty("gold.available_players", "L2")
+    assert dag.version("gold.available_players", "L1") != v_l1
+    assert "p9" in {p["id"] for p in gold_players.get_available_players("L2")}
+
+
+def test_lazy_rebuild_and_partition_bound():
+    """Dirty datasets rebuild on the next get only; max_partitions evicts least recently used partitions."""
+    calls = []
+    dag.register("test.source", [])
+    dag.register("test.per_league", ["test.source"], lambda p: calls.append(p) or p.upper(),
+                 partitioned=True, max_partitions=2)
+    try:
+        _exercise_lazy_rebuild(calls)
+    finally:
+        dag.unregister("test.per_league")
+        dag.unregister("test.source")
+    assert "test.per_league" not in {d["name"] for d in dag.describe()}
+
+
+def _exercise_lazy_rebuild(calls):
+    assert dag.get("test.per_league", "a") == "A"
+    assert dag.get("test.per_league", "a") == "A"
+    assert calls == ["a"]
+    dag.invalidate("test.source", {"a"})
+    assert calls == ["a"]
+    dag.get("test.per_league", "a")
+    dag.get("test.per_league", "b")
+    dag.get("test.per_league", "c")
+    assert calls == ["a", "a", "b", "c"]
+    assert dag.is_dirty("test.per_league", "a")
+    assert not dag.is_dirty("test.per_league", "c")
+
+
+def test_maintained_dataset_cannot_be_built():
+    """Tracked-only datasets (no build) raise on get."""
+    with pytest.raises(ValueError):
+        dag.get("silver.injuries")
@@ -0,0 +1,155 @@
+"""Phase 3.10: Gold result cache — LRU by bytes, keyed by endpoint/league/params, invalidated by DAG versions;
+league freshness TTL."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import league as gold_league
+from analytics_foundry.gold import players as gold_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    gold_cache.set_max_bytes(None)
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "display_name": "A", "position": "WR", "trending": 1.5},
+        {"player_id": "p2", "display_name": "B", "position": "QB"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p1"]}])
+
+
+def test_repeat_read_is_a_hit_with_identical_bytes(client):
+    """Second read for the same league does no gold work and returns the same body."""
+    _seed()
+    first = client.get("/players/available", params={"league_id": "L1"})
+    with patch.object(gold_players, "get_available_players", side_effect=AssertionError("recomputed")):
+        second = client.get("/players/available", params={"league_id": "L1"})
+    assert first.content == second.content
+    assert [p["id"] for p in second.json()] == ["p2"]
+    stats = gold_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_ingest_invalidates_only_affected_league(client):
+    """A roster write for L1 makes L1 a miss; L2 stays a hit."""
+    _seed()
+    client.get("/players/available", params={"league_id": "L1"})
+    client.get("/players/available", params={"league_id": "L2"})
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 2, "players": ["p2"]}])
+    assert client.get("/players/available", params={"league_id": "L1"}).json() == []
+    client.get("/players/available", params={"league_id": "L2"})
+    stats = gold_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 2)
+
+
+def test_params_are_part_of_the_key(client):
+    """Different recommendation parameters are cached separately."""
+    _seed()
+    all_recs = client.get("/recommendations/waiver", params={"league_id": "L2"}).json()
+    qb = client.get("/recommendations/waiver", params={"league_id": "L2", "position": "QB"}).json()
+    assert [r["player_id"] for r in all_recs["recommendations"]] == ["p1", "p2"]
+    assert [r["player_id"] for r in qb["recommendations"]] == ["p2"]
+    assert gold_cache.stats()["misses"] == 2
+
+
+def test_memory_bound_evicts_least_recently_used():
+    """Entries beyond max_bytes are evicted LRU-first and counted."""
+    gold_cache.set_max_bytes(20)
+    for lid in ("A", "B", "C"):
+        gold_cache.get_json("e", lid, (), [], lambda: "x" * 6)
+    gold_cache.get_json("e", "A", (), [], lambda: "x" * 6)
+    stats = gold_cache.stats()
+    assert stats["evictions"] == 2
+    assert stats["bytes"] <= 20
+    assert gold_cache.get_json("e", "C", (), [], lambda: None) == b'"xxxxxx"'
+    assert gold_cache.stats()["hits"] == 1
+
+
+def test_admin_cache_stats(client):
+    """GET /admin/cache returns cache metrics."""
+    _seed()
+    client.get("/injury")
+    data = client.get("/admin/cache").json()
+    assert {"hits", "misses", "evictions", "entries", "bytes", "max_bytes"} <= set(data)
+    assert data["misses"] == 1
+
+
+def _counting_adapter(calls, players=()):
+    def fetch_rosters(lid):
+        calls.append(lid)
+        return [{"roster_id": 1, "players": list(players)}]
+
+    return NFLSleeperAdapter(
+        fetch_league=lambda lid: {"name": lid},
+        fetch_rosters=fetch_rosters,
+        fetch_matchups=lambda lid, week: [],
+    )
+
+
+def test_fresh_league_is_not_refetched(monkeypatch):
+    """Within the TTL a league is ingested once; TTL 0 (the default) fetches on every call; mark_stale forces a
+    fetch."""
+    calls = []
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_counting_adapter(calls)):
+        gold_league.ensure_league_ingested("F1")
+        gold_league.ensure_league_ingested("F1")
+        assert calls == ["F1"]
+        gold_league.mark_stale("F1")
+        gold_league.ensure_league_ingested("F1")
+        assert calls == ["F1", "F1"]
+        monkeypatch.delenv("FOUNDRY_LEAGUE_TTL_SECONDS")
+        gold_league.ensure_league_ingested("F1")
+        assert calls == ["F1", "F1", "F1"]
+
+
+def test_bronze_clear_resets_freshness(monkeypatch):
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    calls = []
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_counting_adapter(calls)):
+        gold_league.ensure_league_ingested("F2")
+        bronze_store.clear()
+        gold_league.ensure_league_ingested("F2")
+    assert calls == ["F2", "F2"]
+
+
+def test_league_responses_are_stale_until_the_ttl_expires(monkeypatch):
+    """Within an opted-in TTL a roster change on Sleeper is not seen; an admin ingest (or TTL 0) fetches it."""
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    _seed()
+    rostered = []
+    adapter = _counting_adapter([], rostered)
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=adapter):
+        client = TestClient(app)
+
+        def available():
+            return [p["id"] for p in client.get("/players/available", params={"league_id": "S1"}).json()]
+
+        assert available() == ["p1", "p2"]
+        rostered.append("p1")
+        assert available() == ["p1", "p2"]
+        assert client.post("/admin/ingest/league", json={"league_id": "S1"}).status_code == 200
+        assert available() == ["p2"]
+        rostered.append("p2")
+        monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "0")
+        assert available() == []
@@ -0,0 +1,131 @@
+"""Phase 3.11: Gold query pushdown — filters, sorting, field projection and cursor pagination."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.gold import recommendations as gold_recommendations
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _seed(n=60):
+    rng = random.Random(3)
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": f"p{i}", "display_name": f"N{rng.randint(0, 20)}", "position": rng.choice(["QB", "RB", "WR"]),
+         "team": rng.choice(["KC", "BUF"]), "status": rng.choice(["Active", "Inactive"]),
+         "age": rng.choice([None, rng.randint(21, 34)]), "trending": rng.choice([None, float(rng.randint(0, 9))])}
+        for i in range(n)
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": [f"p{i}" for i in range(0, n, 4)]},
+    ])
+
+
+def _pages(fetch, limit):
+    out, cursor = [], None
+    while True:
+        page, cursor = fetch(limit, cursor)
+        assert len(page) <= limit
+        out.extend(page)
+        if cursor is None:
+            return out
+
+
+def test_filters_match_full_list():
+    """position/team/status filters equal filtering the full available list."""
+    _seed()
+    full = gold_players.get_available_players("L1")
+    page, cursor = gold_players.query_available_players("L1", position=["WR", "RB"], team=["KC"], status=["Active"])
+    assert cursor is None
+    assert page == [
+        p for p in full if p["position"] in ("WR", "RB") and p["team"] == "KC" and p["status"] == "Active"
+    ]
+
+
+@pytest.mark.parametrize("sort", [None, "name", "-name", "age", "-trending", "position"])
+def test_pagination_covers_sorted_result(sort):
+    """Walking cursors page by page yields the full sorted result exactly once (nulls last, ties in table order)."""
+    _seed()
+    full = gold_players.get_available_players("L1")
+    if sort is not None:
+        field = sort.lstrip("-")
+        present = sorted((p for p in full if p[field] is not None), key=lambda p: p[field],
+                         reverse=sort.startswith("-"))
+        full = present + [p for p in full if p[field] is None]
+    got = _pages(lambda limit, cursor: gold_players.query_available_players(
+        "L1", sort=sort, limit=limit, cursor=cursor), 7)
+    assert got == full
+
+
+def test_projection_only_returns_requested_fields():
+    """fields limits each object to those keys."""
+    _seed()
+    page, _ = gold_players.query_available_players("L1", fields=["id", "trending"], limit=3)
+    assert [list(p) for p in page] == [["id", "trending"]] * 3
+
+
+def test_invalid_options_raise():
+    """Unknown sort field, unknown fields and malformed cursors raise ValueError."""
+    _seed()
+    with pytest.raises(ValueError):
+        gold_players.query_available_players(sort="height")
+    with pytest.raises(ValueError):
+        gold_players.query_available_players(fields=["height"])
+    with pytest.raises(ValueError):
+        gold_players.query_available_players(cursor="not-a-cursor")
+
+
+def test_recommendation_pages_equal_one_big_page():
+    """Recommendation cursors continue the ranking exactly where the previous page stopped."""
+    _seed()
+    full, cursor = gold_recommendations.query_waiver_recommendations("L1", limit=100)
+    assert cursor is None
+    got = _pages(lambda limit, cursor: gold_recommendations.query_waiver_recommendations(
+        "L1", limit=limit, cursor=cursor), 4)
+    assert got == full
+    kc, _ = gold_recommendations.query_waiver_recommendations("L1", limit=100, team=["KC"], fields=["player_id"])
+    assert kc == [{"player_id": r["player_id"]} for r in full if r["team"] == "KC"]
+
+
+def test_players_endpoint_query_params(client):
+    """/players/available keeps an array body; next page cursor comes in X-Next-Cursor."""
+    _seed()
+    resp = client.get("/players/available", params={"league_id": "L1", "position": "WR", "limit": 2, "fields": "id"})
+    assert resp.status_code == 200
+    assert len(resp.json()) == 2 and set(resp.json()[0]) == {"id"}
+    nxt = client.get("/players/available", params={
+        "league_id": "L1", "position": "WR", "limit": 2, "fields": "id", "cursor": resp.headers["X-Next-Cursor"],
+    })
+    assert not {p["id"] for p in nxt.json()} & {p["id"] for p in resp.json()}
+    assert client.get("/players/available", params={"league_id": "L1"}).json() == gold_players.get_available_players("L1")
+    assert client.get("/players/available", params={"sort": "height"}).status_code == 400
+    assert client.get("/players/available", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_recommendations_endpoint_cursor(client):
+    """/recommendations/waiver returns next_cursor in the body."""
+    _seed()
+    first = client.get("/recommendations/waiver", params={"league_id": "L1", "limit": 3}).json()
+    assert len(first["recommendations"]) == 3 and first["next_cursor"]
+    second = client.get("/recommendations/waiver", params={
+        "league_id": "L1", "limit": 3, "cursor": first["next_cursor"],
+    }).json()
+    both = client.get("/recommendations/waiver", params={"league_id": "L1", "limit": 6}).json()
+    assert first["recommendations"] + second["recommendations"] == both["recommendations"]
@@ -0,0 +1,120 @@
+"""Phase 3.19: HTTP ETag / 304 from dataset versions and negotiated compression cached per version."""
+
+import gzip
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import http_cache
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import players as gold_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def _seed(n=50):
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": f"p{i}", "display_name": f"Player {i}", "position": "WR", "team": "KC"} for i in range(n)
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p0"]}])
+
+
+def test_if_none_match_returns_304_without_gold_work(client):
+    _seed()
+    first = client.get("/players/available", params={"league_id": "L1"}, headers=IDENTITY)
+    tag = first.headers["etag"]
+    assert "Accept-Encoding" in first.headers["vary"]
+    with patch.object(gold_players, "query_available_players", side_effect=AssertionError("computed")):
+        again = client.get("/players/available", params={"league_id": "L1"}, headers={"If-None-Match": tag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == tag
+    # Another parameter set or a data change gets a new tag.
+    other = client.get("/players/available", params={"league_id": "L1", "limit": 5}, headers={"If-None-Match": tag})
+    assert other.status_code == 200 and other.headers["etag"] != tag
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 2, "players": ["p1"]}])
+    changed = client.get("/players/available", params={"league_id": "L1"}, headers={"If-None-Match": tag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != tag
+    assert "p1" not in {p["id"] for p in changed.json()}
+
+
+def test_etag_is_stable_across_processes(client):
+    """The tag depends on the data, not on per-process DAG versions: another worker (here: an emptied cache and
+    bronze reloaded with the same records, so every version differs) gives the same response the same tag."""
+    _seed()
+    tag = client.get("/players/available", params={"league_id": "L1"}, headers=IDENTITY).headers["etag"]
+    gold_cache.clear()
+    bronze_store.clear()
+    _seed()
+    again = client.get("/players/available", params={"league_id": "L1"}, headers={"If-None-Match": tag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == tag
+
+
+def test_injury_and_recommendations_revalidate(client):
+    _seed()
+    for path in ("/injury", "/recommendations/waiver"):
+        tag = client.get(path, params={"league_id": "L1"}).headers["etag"]
+        resp = client.get(path, params={"league_id": "L1"}, headers={"If-None-Match": f'W/"x", {tag}'})
+        assert resp.status_code == 304
+
+
+def test_gzip_bytes_compressed_once_per_version(client):
+    _seed()
+    plain = client.get("/players/available", params={"league_id": "L1"}, headers=IDENTITY)
+    assert "content-encoding" not in plain.headers
+    assert len(plain.content) >= gold_cache.MIN_COMPRESS_BYTES
+    with patch.object(gold_cache, "compress", wraps=gold_cache.compress) as compress:
+        for _ in range(3):
+            resp = client.get(
+                "/players/available", params={"league_id": "L1"}, headers={"Accept-Encoding": "gzip"}
+            )
+            assert resp.headers["content-encoding"] == "gzip"
+            assert resp.content == plain.content  # decoded by the client
+    assert compress.call_count == 1
+    assert resp.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    # The stored variant is real gzip of the cached body and counts toward the cache bytes.
+    entry = next(iter(gold_cache._ENTRIES.values()))
+    assert gzip.decompress(entry.encoded["gzip"]) == plain.content
+    assert gold_cache.stats()["bytes"] == len(plain.content) + len(entry.encoded["gzip"])
+    # A tag for either coding revalidates.
+    headers = {"If-None-Match": plain.headers["etag"]}
+    assert client.get("/players/available", params={"league_id": "L1"}, headers=headers).status_code == 304
+
+
+def test_small_bodies_stay_identity(client):
+    resp = client.get("/injury", params={"league_id": "L9"}, headers={"Accept-Encoding": "gzip"})
+    assert resp.json() == []
+    assert "content-encoding" not in resp.headers
+
+
+def test_negotiate():
+    assert http_cache.negotiate(None) is None
+    assert http_cache.negotiate("gzip, deflate") == "gzip"
+    assert http_cache.negotiate("gzip;q=0, identity") is None
+    assert http_cache.negotiate("*") == gold_cache.ENCODINGS[0]
+    assert http_cache.negotiate("deflate") is None
+    if gold_cache.brotli is None:
+        assert http_cache.negotiate("br") is None
+    else:
+        assert http_cache.negotiate("gzip;q=0.5, br") == "br"
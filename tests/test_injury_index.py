@@ -0,0 +1,110 @@
+"""Phase 3.4: Incremental injury index — updated on bronze appends, enter/exit events, status and league queries."""
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.silver import injuries as silver_injuries
+from analytics_foundry.silver import players as silver_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+def _full_scan():
+    """Reference: scan every silver player."""
+    out = []
+    for p in silver_players.get_player_table():
+        status = p["injury_status"] or p["status"]
+        if status and status != "Active":
+            out.append({"player_id": p["player_id"], "status": status, "updated_at": p["updated_at"]})
+    return out
+
+
+def test_index_built_lazily_from_existing_bronze():
+    """First query builds the index from silver players already in bronze."""
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "injury_status": "Out"},
+        {"player_id": "p2", "status": "Active"},
+    ])
+    assert silver_injuries.get_injuries() == _full_scan()
+    assert silver_injuries.get_injury_events() == []
+
+
+def test_incremental_updates_emit_enter_change_exit_events():
+    """Appends after the build update the index and record enter/change/exit events."""
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1"}, {"player_id": "p2"}])
+    assert silver_injuries.get_injuries() == []
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p2", "injury_status": "Questionable"}])
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p2", "injury_status": "Out", "updated_at": "2024-01-02"},
+        {"player_id": "p3", "injury_status": "IR"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p3", "status": "Active"}])
+    events = silver_injuries.get_injury_events()
+    assert [(e["event"], e["player_id"], e["status"], e["previous_status"]) for e in events] == [
+        ("enter", "p2", "Questionable", None),
+        ("change", "p2", "Out", "Questionable"),
+        ("enter", "p3", "IR", None),
+        ("exit", "p3", "Active", "IR"),
+    ]
+    assert silver_injuries.get_injury_events(since=events[1]["seq"]) == events[2:]
+    assert silver_injuries.get_injuries() == [{"player_id": "p2", "status": "Out", "updated_at": "2024-01-02"}]
+    assert silver_injuries.get_injuries() == _full_scan()
+
+
+def test_incremental_index_matches_full_scan_order():
+    """After many appends the index equals a full scan, in silver player order."""
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}"} for i in range(10)])
+    silver_injuries.get_injuries()
+    for i in (7, 2, 5):
+        bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}", "injury_status": "Out"}])
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p2", "injury_status": ""}])
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p2", "status": "Inactive"}])
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "new", "injury_status": "IR"}])
+    assert silver_injuries.get_injuries() == _full_scan()
+    assert [r["player_id"] for r in silver_injuries.get_injuries()] == ["p2", "p5", "p7", "new"]
+
+
+def test_query_by_status_and_player():
+    """get_injuries(status=...) uses the by-status index; get_injury returns one record."""
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "injury_status": "Out"},
+        {"player_id": "p2", "injury_status": "IR"},
+        {"player_id": "p3", "injury_status": "Out"},
+    ])
+    assert [r["player_id"] for r in silver_injuries.get_injuries(status="Out")] == ["p1", "p3"]
+    assert [r["player_id"] for r in silver_injuries.get_injuries(status=["IR", "Out"])] == ["p1", "p2", "p3"]
+    assert silver_injuries.get_injuries(status="Doubtful") == []
+    assert silver_injuries.get_injury("p2")["status"] == "IR"
+    assert silver_injuries.get_injury("nope") is None
+
+
+def test_league_injuries_join_rosters():
+    """get_league_injuries returns only injured players rostered in that league."""
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "injury_status": "Out"},
+        {"player_id": "p2", "injury_status": "IR"},
+        {"player_id": "p3"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p2", "p3"]},
+        {"league_id": "L2", "roster_id": 1, "players": ["p1"]},
+    ])
+    assert [r["player_id"] for r in silver_injuries.get_league_injuries("L1")] == ["p2"]
+    assert [r["player_id"] for r in silver_injuries.get_league_injuries("L2")] == ["p1"]
+    assert silver_injuries.get_league_injuries("L3") == []
+
+
+def test_clear_resets_index():
+    """bronze clear() resets the index and its events."""
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1"}])
+    silver_injuries.get_injuries()
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1", "injury_status": "Out"}])
+    assert len(silver_injuries.get_injury_events()) == 1
+    bronze_store.clear()
+    assert silver_injuries.get_injuries() == []
+    assert silver_injuries.get_injury_events() == []
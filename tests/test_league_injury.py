@@ -0,0 +1,109 @@
+"""Phase 3.15: League-scoped injury report — player -> leagues join index, rostered/available split."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import injury as gold_injury
+from analytics_foundry.silver import injuries as silver_injuries
+from analytics_foundry.silver import rosters as silver_rosters
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "injury_status": "Out"},
+        {"player_id": "p2", "injury_status": "IR"},
+        {"player_id": "p3"},
+        {"player_id": "p4", "injury_status": "Questionable"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p2", "p3"]},
+        {"league_id": "L1", "roster_id": 2, "players": ["p4"]},
+        {"league_id": "L2", "roster_id": 7, "players": ["p1", "p2"]},
+    ])
+
+
+def _rebuilt_index():
+    """Reference: player -> {league: roster} from a full silver roster scan."""
+    out = {}
+    for r in silver_rosters.get_rosters():
+        for pid in r["players"]:
+            out.setdefault(pid, {})[r["league_id"]] = r["roster_id"]
+    return out
+
+
+def test_join_index_maintained_on_roster_appends():
+    """After the first lookup, appends (including roster replacements) keep each player's leagues equal to a rebuild."""
+    _seed()
+    assert silver_rosters.get_player_leagues("p2") == {"L1": 1, "L2": 7}
+    rng = random.Random(5)
+    for _ in range(30):
+        bronze_store.append_raw("nfl_sleeper", "rosters", [
+            {"league_id": rng.choice(["L1", "L2", "L3"]), "roster_id": rng.randint(1, 3),
+             "players": rng.sample([f"p{i}" for i in range(1, 9)], rng.randint(0, 4))}
+            for _ in range(rng.randint(1, 3))
+        ])
+        expected = _rebuilt_index()
+        for i in range(1, 9):
+            assert set(silver_rosters.get_player_leagues(f"p{i}")) == set(expected.get(f"p{i}", {}))
+
+
+def test_rostered_and_available_split_the_injured_set():
+    _seed()
+    rostered = silver_injuries.get_league_injuries("L1")
+    available = silver_injuries.get_league_injuries("L1", rostered=False)
+    assert [(r["player_id"], r["roster_id"]) for r in rostered] == [("p2", 1), ("p4", 2)]
+    assert [(r["player_id"], r["roster_id"]) for r in available] == [("p1", None)]
+    assert silver_injuries.get_league_injuries("L3") == []
+    assert [r["player_id"] for r in silver_injuries.get_league_injuries("L3", rostered=False)] == ["p1", "p2", "p4"]
+
+
+def test_league_report_does_not_scan_rosters():
+    """With the index built, a league report reads no silver rosters."""
+    _seed()
+    silver_injuries.get_league_injuries("L1")
+    with patch.object(silver_rosters, "get_rosters", side_effect=AssertionError("scanned rosters")):
+        assert [r["player_id"] for r in gold_injury.get_injury_report("L2", scope="rostered")] == ["p1", "p2"]
+
+
+def test_injury_endpoint_scopes(client):
+    """Default scope is all (the league-agnostic report); rostered (with roster_id) and available are opt-in;
+    unknown scope is 400."""
+    _seed()
+    default = client.get("/injury", params={"league_id": "L1"}).json()
+    assert default == [{"player_id": p, "status": s} for p, s in (("p1", "Out"), ("p2", "IR"), ("p4", "Questionable"))]
+    rostered = client.get("/injury", params={"league_id": "L1", "scope": "rostered"}).json()
+    assert rostered == [
+        {"player_id": "p2", "status": "IR", "roster_id": 1},
+        {"player_id": "p4", "status": "Questionable", "roster_id": 2},
+    ]
+    available = client.get("/injury", params={"league_id": "L1", "scope": "available"}).json()
+    assert [r["player_id"] for r in available] == ["p1"]
+    everyone = client.get("/injury", params={"league_id": "L1", "scope": "all"}).json()
+    assert [r["player_id"] for r in everyone] == ["p1", "p2", "p4"]
+    assert client.get("/injury", params={"league_id": "L1", "scope": "bench"}).status_code == 400
+
+
+def test_roster_change_refreshes_cached_league_report(client):
+    _seed()
+    params = {"league_id": "L1", "scope": "rostered"}
+    assert len(client.get("/injury", params=params).json()) == 2
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 2, "players": ["p1"]}])
+    assert [r["player_id"] for r in client.get("/injury", params=params).json()] == ["p1", "p2"]
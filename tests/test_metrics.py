@@ -0,0 +1,165 @@
+"""Phase 3.23: Metrics — stage timers, DAG build times, per-route request histograms at /admin/metrics."""
+
+import asyncio
+import re
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import metrics
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    metrics.reset()
+    yield
+    metrics.reset()
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _sample(text, name, **labels):
+    """Value of the sample name{labels...} (label subset match), or None."""
+    for line in text.splitlines():
+        m = re.match(r"([a-z_]+)(\{.*\})? (\S+)$", line)
+        if m and m.group(1) == name and all(f'{k}="{v}"' in (m.group(2) or "") for k, v in labels.items()):
+            return float(m.group(3))
+    return None
+
+
+def test_admin_metrics_reports_stages_builds_and_routes(client):
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1", "position": "WR"}])
+    for _ in range(2):
+        assert client.get("/players/available", params={"league_id": "L1"}).status_code == 200
+    assert client.get("/tables/nope").status_code == 404
+    resp = client.get("/admin/metrics")
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    route = {"method": "GET", "route": "/players/available", "status": "200"}
+    assert _sample(text, "foundry_http_request_duration_seconds_count", **route) == 2
+    assert _sample(text, "foundry_http_request_duration_seconds_bucket", le="+Inf", **route) == 2
+    assert _sample(text, "foundry_http_request_duration_seconds_count", route="unmatched", status="404") == 1
+    # Second request is a cache hit: gold query and silver build ran once.
+    assert _sample(text, "foundry_stage_duration_seconds_count", stage="gold.players.query_available_players") == 1
+    assert _sample(text, "foundry_dataset_build_seconds_count", dataset="silver.players") == 1
+    assert _sample(text, "foundry_stage_duration_seconds_count", layer="bronze", stage="bronze.store.append_raw") == 1
+    assert _sample(text, "foundry_bronze_records_appended_total", source="nfl_sleeper", table="players") == 1
+    assert _sample(text, "foundry_gold_cache_hits_total") == 1
+    assert "# TYPE foundry_stage_duration_seconds histogram" in text
+
+
+def test_timed_sync_and_async_count_errors():
+    @metrics.timed
+    def boom():
+        raise RuntimeError("x")
+
+    @metrics.timed
+    async def ok():
+        return 1
+
+    stage = metrics.stage_name(boom)
+    assert stage.endswith("test_timed_sync_and_async_count_errors.<locals>.boom")
+    with pytest.raises(RuntimeError):
+        boom()
+    assert asyncio.run(ok()) == 1
+    labels = (stage.split(".", 1)[0], stage)
+    assert metrics.STAGE_SECONDS.count(labels) == 1
+    assert metrics.STAGE_ERRORS.value(labels) == 1
+    assert metrics.STAGE_SECONDS.count((labels[0], metrics.stage_name(ok))) == 1
+
+
+def test_timed_generator_and_interrupts():
+    """Generators are timed over producing their items; cancellation and interrupts are not errors."""
+    @metrics.timed
+    def produce(n):
+        for i in range(n):
+            time.sleep(0.01)
+            yield i
+
+    @metrics.timed
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    @metrics.timed
+    def interrupted():
+        raise KeyboardInterrupt
+
+    labels = ("tests", metrics.stage_name(produce))
+    gen = produce(3)
+    assert metrics.STAGE_SECONDS.count(labels) == 0
+    time.sleep(0.2)  # held by the consumer: not counted
+    assert list(gen) == [0, 1, 2]
+    assert metrics.STAGE_SECONDS.count(labels) == 1
+    assert 0.03 <= metrics.STAGE_SECONDS._series[labels][1] < 0.2
+    early = produce(5)
+    next(early)
+    early.close()
+    assert metrics.STAGE_SECONDS.count(labels) == 2 and metrics.STAGE_ERRORS.value(labels) == 0
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
+    with pytest.raises(KeyboardInterrupt):
+        interrupted()
+    for fn in (cancelled, interrupted):
+        stage = ("tests", metrics.stage_name(fn))
+        assert metrics.STAGE_SECONDS.count(stage) == 1 and metrics.STAGE_ERRORS.value(stage) == 0
+
+
+def test_timed_generator_forwards_send_and_throw():
+    """send() and throw() reach the wrapped generator (as with yield from), and its return value is kept."""
+    @metrics.timed
+    def echo():
+        total = 0
+        while True:
+            try:
+                got = yield total
+            except KeyError:
+                got = -total
+            if got is None:
+                return total
+            total += got
+
+    labels = ("tests", metrics.stage_name(echo))
+    gen = echo()
+    assert next(gen) == 0
+    assert gen.send(2) == 2
+    assert gen.send(3) == 5
+    assert gen.throw(KeyError("reset")) == 0
+    with pytest.raises(StopIteration) as stop:
+        gen.send(None)
+    assert stop.value.value == 0
+    assert metrics.STAGE_SECONDS.count(labels) == 1 and metrics.STAGE_ERRORS.value(labels) == 0
+    failing = echo()
+    next(failing)
+    with pytest.raises(ValueError):
+        failing.throw(ValueError("unhandled"))
+    assert metrics.STAGE_SECONDS.count(labels) == 2 and metrics.STAGE_ERRORS.value(labels) == 1
+
+
+def test_histogram_exposition():
+    hist = metrics.Histogram("t_seconds", "test", ("k",), buckets=(0.1, 1.0))
+    try:
+        for v in (0.05, 0.5, 0.5, 3.0):
+            hist.observe(('a"b',), v)
+        lines = hist.samples()
+        assert lines[:3] == [
+            't_seconds_bucket{k="a\\"b",le="0.1"} 1',
+            't_seconds_bucket{k="a\\"b",le="1.0"} 3',
+            't_seconds_bucket{k="a\\"b",le="+Inf"} 4',
+        ]
+        assert lines[3] == 't_seconds_sum{k="a\\"b"} 4.05'
+        assert lines[4] == 't_seconds_count{k="a\\"b"} 4'
+    finally:
+        metrics._METRICS.remove(hist)
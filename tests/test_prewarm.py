@@ -0,0 +1,137 @@
+"""Phase 3.22: Startup prewarm of hot leagues, liveness (/healthz) and readiness (/readyz) gating."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import config, prewarm
+from analytics_foundry.adapters.nfl_sleeper import NFLSleeperAdapter
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze(monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_LEAGUE_ID", "L1")
+    bronze_store.clear()
+    gold_cache.clear()
+    prewarm.reset()
+    yield
+    prewarm.reset()
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+def _adapter(calls, gate=None):
+    """Sleeper adapter over in-memory fetches; league "BAD" fails, "SLOW" blocks until gate is set."""
+
+    def fetch_league(lid):
+        calls.append(lid)
+        if lid == "BAD":
+            raise RuntimeError("upstream down")
+        if lid == "SLOW":
+            assert gate.wait(5)
+        return {"name": f"League {lid}"}
+
+    return NFLSleeperAdapter(
+        fetch_players=lambda: {},
+        fetch_league=fetch_league,
+        fetch_rosters=lambda lid: [{"roster_id": 1, "players": ["p1"]}],
+        fetch_matchups=lambda lid, week: [],
+    )
+
+
+def _wait_ready(client):
+    deadline = time.monotonic() + 5
+    while client.get("/readyz").status_code != 200:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_startup_prewarms_hot_leagues_and_caches(monkeypatch):
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": f"p{i}", "position": "WR"} for i in range(5)])
+    monkeypatch.setenv("FOUNDRY_PREWARM", "1")
+    monkeypatch.setenv("FOUNDRY_PREWARM_LEAGUES", "L2, L1,")
+    # Warmed entries are hit only while the leagues stay fresh (TTL 0 re-fetches on every request).
+    monkeypatch.setenv("FOUNDRY_LEAGUE_TTL_SECONDS", "300")
+    calls = []
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter(calls)):
+        with TestClient(app) as client:
+            _wait_ready(client)
+            body = client.get("/readyz").json()
+            assert body["ready"] is True
+            assert body["prewarm"]["leagues"] == {"L1": "ok", "L2": "ok"}
+            assert body["prewarm"]["duration_seconds"] >= 0
+            stats = gold_cache.stats()
+            assert stats["entries"] == 2 * len(prewarm.PATHS)
+            for path in prewarm.PATHS:
+                assert client.get(path, params={"league_id": "L2"}).status_code == 200
+            assert gold_cache.stats()["hits"] == stats["hits"] + len(prewarm.PATHS)
+            assert gold_cache.stats()["misses"] == stats["misses"]
+    assert sorted(calls) == ["L1", "L2"]
+
+
+def test_prewarm_is_off_by_default():
+    """Without FOUNDRY_PREWARM=1 startup fetches nothing and is ready at once."""
+    calls = []
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter(calls)):
+        with TestClient(app) as client:
+            _wait_ready(client)
+            assert client.get("/readyz").json()["prewarm"]["leagues"] == {}
+    assert calls == []
+
+
+def test_not_ready_until_prewarm_finishes(monkeypatch):
+    monkeypatch.setenv("FOUNDRY_PREWARM", "1")
+    monkeypatch.setattr(config, "DEFAULT_LEAGUE_ID", "SLOW")
+    gate = threading.Event()
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter([], gate)):
+        try:
+            with TestClient(app) as client:
+                assert client.get("/healthz").json() == {"status": "ok"}
+                resp = client.get("/readyz")
+                assert resp.status_code == 503
+                assert resp.json()["prewarm"]["state"] == "running"
+                gate.set()
+                _wait_ready(client)
+        finally:
+            gate.set()
+
+
+def test_failed_league_is_reported_and_others_warm():
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter([])):
+        result = asyncio.run(prewarm.run(app, ["BAD", "L1"]))
+    assert result["state"] == "done" and prewarm.is_ready()
+    assert result["leagues"]["L1"] == "ok"
+    assert result["leagues"]["BAD"].startswith("RuntimeError")
+
+
+def test_cancelled_prewarm_ends_in_terminal_state(monkeypatch):
+    """Shutting down mid-prewarm leaves state "cancelled" (not "running") and readiness off."""
+    monkeypatch.setenv("FOUNDRY_PREWARM", "1")
+    monkeypatch.setattr(config, "DEFAULT_LEAGUE_ID", "SLOW")
+    gate = threading.Event()
+    with patch("analytics_foundry.gold.league.get_adapter", return_value=_adapter([], gate)):
+        try:
+            with TestClient(app) as client:
+                assert client.get("/readyz").json()["prewarm"]["state"] == "running"
+        finally:
+            gate.set()
+    result = prewarm.status()
+    assert result["state"] == "cancelled" and not prewarm.is_ready()
+    assert result["leagues"] == {"SLOW": "cancelled"}
+    assert result["duration_seconds"] is not None
+
+
+def test_prewarm_league_config(monkeypatch):
+    monkeypatch.setenv("FOUNDRY_PREWARM_LEAGUES", "A,,L1, B")
+    assert config.get_prewarm_league_ids() == []
+    monkeypatch.setenv("FOUNDRY_PREWARM", "1")
+    assert config.get_prewarm_league_ids() == ["L1", "A", "B"]
+    monkeypatch.setenv("FOUNDRY_PREWARM", "0")
+    assert config.get_prewarm_league_ids() == []
@@ -0,0 +1,105 @@
+"""Phase 3.24: Profiling — cProfile/tracemalloc sessions for admin ingests and sampled requests."""
+
+import pstats
+import tracemalloc
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import profiling
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.executors import run_compute
+from analytics_foundry.gold import cache as gold_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    profiling.reset()
+    yield
+    profiling.reset()
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+def _expensive_league_build(league_id):
+    rows = [{"player_id": f"p{i}", "league_id": league_id, "pad": "x" * 50} for i in range(2000)]
+    return sorted(rows, key=lambda r: r["player_id"])
+
+
+async def _fake_ingest(league_id):
+    rows = await run_compute(_expensive_league_build, league_id)
+    bronze_store.append_raw("nfl_sleeper", "rosters", rows[:5])
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock(side_effect=_fake_ingest)):
+        yield TestClient(app)
+
+
+def test_profiled_league_ingest_returns_functions_allocations_and_files(client, tmp_path):
+    resp = client.post("/admin/ingest/league", params={"profile": "true"}, json={"league_id": "L1"})
+    assert resp.status_code == 200
+    prof = resp.json()["profile"]
+    assert prof["kind"] == "ingest.league" and prof["target"] == "L1"
+    # The executor-side build is recorded by the session's worker-thread profiler.
+    assert any("_expensive_league_build" in f["function"] for f in prof["functions"])
+    assert prof["allocated_bytes"] > 0 and prof["allocation_sites"]
+    assert sorted(prof["files"]) == ["prof", "tracemalloc"]
+    assert not tracemalloc.is_tracing()
+
+    listed = client.get("/admin/profiles").json()
+    assert [s["id"] for s in listed["sessions"]] == [prof["id"]]
+    by_tottime = client.get(f"/admin/profiles/{prof['id']}", params={"sort": "tottime", "limit": 5}).json()
+    assert len(by_tottime["functions"]) == 5
+    times = [f["tottime"] for f in by_tottime["functions"]]
+    assert times == sorted(times, reverse=True)
+
+    download = client.get(f"/admin/profiles/{prof['id']}/download")
+    assert download.status_code == 200
+    (tmp_path / "run.prof").write_bytes(download.content)
+    stats = pstats.Stats(str(tmp_path / "run.prof"))
+    assert any(func[2] == "_expensive_league_build" for func in stats.stats)
+    download = client.get(f"/admin/profiles/{prof['id']}/download", params={"format": "tracemalloc"})
+    (tmp_path / "run.tracemalloc").write_bytes(download.content)
+    assert tracemalloc.Snapshot.load(str(tmp_path / "run.tracemalloc")).traces
+
+    assert client.get("/admin/profiles/nope").status_code == 404
+    assert client.get(f"/admin/profiles/{prof['id']}", params={"sort": "name"}).status_code == 400
+
+
+def test_unprofiled_ingest_records_nothing(client):
+    resp = client.post("/admin/ingest/league", json={"league_id": "L1"})
+    assert resp.status_code == 200
+    assert "profile" not in resp.json()
+    assert profiling.sessions() == []
+    assert profiling.current() is None
+
+
+def test_request_sampling_profiles_share_of_requests_until_limit(client):
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1", "position": "WR"}])
+    assert client.post("/admin/profiles/requests", json={"rate": 1.5}).status_code == 400
+    started = client.post("/admin/profiles/requests", json={"rate": 0.5, "limit": 2, "allocations": False}).json()
+    assert started["active"] is True
+    for i in range(6):
+        assert client.get("/players/available", params={"league_id": f"L{i}"}).status_code == 200
+    listed = client.get("/admin/profiles").json()
+    assert listed["sampling"]["active"] is False
+    assert listed["sampling"]["seen"] == 4 and listed["sampling"]["taken"] == 2
+    sessions = listed["sessions"]
+    assert [s["target"] for s in sessions] == [
+        "GET /players/available?league_id=L3",
+        "GET /players/available?league_id=L1",
+    ]
+    assert all(s["kind"] == "request" and s["files"] == ["prof"] for s in sessions)
+    detail = client.get(f"/admin/profiles/{sessions[0]['id']}").json()
+    assert detail["functions"] and detail["allocation_sites"] == []
+    # The summary keeps only the top functions, so look for the (fast) gold query in the full profile.
+    stats = profiling.get_session(sessions[0]["id"]).stats()
+    assert any(func[2] == "query_available_players" for func in stats.stats)
+    assert client.delete("/admin/profiles/requests").json()["taken"] == 2
+    assert profiling.sampling() == {"active": False}
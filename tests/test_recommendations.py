@@ -1,6 +1,6 @@
 """Phase 2.4: Recommendation logic (waiver/add) and endpoint tests."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -54,7 +54,7 @@ def test_get_waiver_recommendations_respects_limit():
 
 def test_recommendations_waiver_endpoint_returns_shape():
     """GET /recommendations/waiver returns {recommendations, league_id}."""
-    with patch("analytics_foundry.gold.league.ensure_league_ingested", lambda _: None):
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
         client = TestClient(app)
         resp = client.get("/recommendations/waiver")
     assert resp.status_code == 200
@@ -66,9 +66,58 @@ def test_recommendations_waiver_endpoint_returns_shape():
 
 def test_recommendations_waiver_with_league_id():
     """GET /recommendations/waiver?league_id=... returns league_id in response."""
-    with patch("analytics_foundry.gold.league.ensure_league_ingested", lambda _: None):
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
         client = TestClient(app)
         resp = client.get("/recommendations/waiver", params={"league_id": "league_123"})
     assert resp.status_code == 200
     data = resp.json()
     assert data["league_id"] == "league_123"
+
+
+def _seed_ranked():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "position": "WR", "trending": 1.0},
+        {"player_id": "p2", "position": "QB", "trending": 5.0},
+        {"player_id": "p3", "position": "WR"},
+        {"player_id": "p4", "position": "WR", "trending": 3.0},
+        {"player_id": "p5", "position": "RB", "trending": 3.0},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p2"]}])
+
+
+def test_get_waiver_recommendations_ranked_by_score():
+    """Recommendations are the top-k available players by score; ties keep silver order."""
+    _seed_ranked()
+    result = get_waiver_recommendations(league_id=None, limit=3)
+    assert [r["player_id"] for r in result] == ["p2", "p4", "p5"]
+    assert [r["score"] for r in result] == [5.0, 3.0, 3.0]
+
+
+def test_get_waiver_recommendations_skips_rostered_and_filters_position():
+    """Players rostered in the league are skipped; position restricts the ranking."""
+    _seed_ranked()
+    assert [r["player_id"] for r in get_waiver_recommendations(league_id="L1", limit=2)] == ["p4", "p5"]
+    wr = get_waiver_recommendations(league_id="L1", limit=10, position="WR")
+    assert [r["player_id"] for r in wr] == ["p4", "p1", "p3"]
+    assert get_waiver_recommendations(league_id="L1", position="K") == []
+
+
+def test_recommendations_waiver_endpoint_position_filter():
+    """GET /recommendations/waiver?position=... returns only that position."""
+    _seed_ranked()
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        client = TestClient(app)
+        resp = client.get("/recommendations/waiver", params={"league_id": "L1", "position": "QB"})
+    assert resp.status_code == 200
+    assert resp.json()["recommendations"] == []
+
+
+def test_recommendations_waiver_rejects_negative_limit():
+    """A negative limit is a 400, not an error while paging."""
+    _seed_ranked()
+    with pytest.raises(ValueError, match="limit"):
+        get_waiver_recommendations(league_id="L1", limit=-1)
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        resp = TestClient(app).get("/recommendations/waiver", params={"league_id": "L1", "limit": -1})
+    assert resp.status_code == 400
+    assert get_waiver_recommendations(league_id="L1", limit=0) == []
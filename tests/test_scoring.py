@@ -0,0 +1,115 @@
+"""Phase 3.9: Multi-factor scoring — cached player features, configurable weights, per-league position need."""
+
+import random
+
+import pytest
+
+from analytics_foundry import config, dag
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import scoring
+from analytics_foundry.gold.recommendations import get_waiver_recommendations
+from analytics_foundry.silver import matchups as silver_matchups
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    scoring.set_weights(None)
+    yield
+    scoring.set_weights(None)
+    bronze_store.clear()
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "position": "WR", "age": 22, "trending": 1.0},
+        {"player_id": "p2", "position": "WR", "age": 40, "trending": 1.0, "injury_status": "Out"},
+        {"player_id": "p3", "position": "QB", "age": "26", "status": "Questionable"},
+        {"player_id": "p4", "position": "RB"},
+        {"player_id": "p5", "position": "RB"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "matchups", [
+        {"league_id": "L1", "week": 1, "roster_id": 1, "players_points": {"p3": 20.0, "p4": 10}},
+        {"league_id": "L1", "week": 2, "roster_id": 1, "players_points": {"p3": "10", "p4": None}},
+        {"league_id": "L1", "week": 2, "roster_id": 1, "players_points": {"p3": 30.0}},
+    ])
+
+
+def test_silver_matchups_dedup_and_player_points():
+    """Matchups dedup by (league, week, roster) latest wins; player points are means over matchups."""
+    _seed()
+    assert len(silver_matchups.get_matchups("L1")) == 2
+    assert silver_matchups.get_player_points() == {"p3": 25.0, "p4": 10.0}
+
+
+def test_player_features():
+    """Features: trending, clamped age, injury severity (injury_status, else status), mean matchup points."""
+    _seed()
+    cols = scoring.get_player_features().columns
+    assert list(cols["trending"]) == [1.0, 1.0, 0.0, 0.0, 0.0]
+    assert list(cols["age"]) == [0.4, -1.0, 0.0, 0.0, 0.0]
+    assert list(cols["injury"]) == [-0.0, -1.0, -0.25, -0.0, -0.0]
+    assert list(cols["matchup_points"]) == [0.0, 0.0, 25.0, 10.0, 0.0]
+
+
+def test_weights_change_ranking():
+    """Weights blend features; set_weights rescored without rebuilding features."""
+    _seed()
+    features = scoring.get_player_features()
+    scoring.set_weights({"trending": 1.0, "age": 0.0, "injury": 0.0, "matchup_points": 0.0})
+    assert [r["player_id"] for r in get_waiver_recommendations(limit=2)] == ["p1", "p2"]
+    scoring.set_weights({"matchup_points": 1.0})
+    assert [r["player_id"] for r in get_waiver_recommendations(limit=2)] == ["p3", "p4"]
+    assert scoring.get_player_features() is features
+    with pytest.raises(ValueError):
+        scoring.set_weights({"height": 1.0})
+
+
+def test_config_score_weights_from_env(monkeypatch):
+    """FOUNDRY_SCORE_WEIGHTS overrides named weights; unknown names and bad values are ignored."""
+    monkeypatch.setenv("FOUNDRY_SCORE_WEIGHTS", "trending=3, age=x,height=2,injury=0")
+    weights = config.get_score_weights()
+    assert weights["trending"] == 3.0
+    assert weights["age"] == config.DEFAULT_SCORE_WEIGHTS["age"]
+    assert weights["injury"] == 0.0
+    assert "height" not in weights
+
+
+def test_position_need_is_per_league():
+    """position_need boosts positions the league has already rostered heavily; only that league is recomputed."""
+    _seed()
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p4"]},
+        {"league_id": "L2", "roster_id": 1, "players": []},
+    ])
+    scoring.set_weights({"trending": 0.0, "age": 0.0, "injury": 0.0, "matchup_points": 0.0, "position_need": 1.0})
+    assert scoring.get_league_boosts("L1") == {"RB": 0.5}
+    top = get_waiver_recommendations(league_id="L1", limit=1)
+    assert top[0]["player_id"] == "p5" and top[0]["score"] == 0.5
+    assert get_waiver_recommendations(league_id="L2", limit=1)[0]["player_id"] == "p1"
+    v_l2 = dag.version("gold.position_need", "L2")
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 2, "players": ["p3"]}])
+    assert dag.version("gold.position_need", "L2") == v_l2
+    assert scoring.get_league_boosts("L1") == {"RB": 0.5, "QB": 1.0}
+
+
+def test_heap_merge_matches_full_sort():
+    """Top-k from the per-position merge equals sorting every available player by base + league term."""
+    rng = random.Random(7)
+    players = [
+        {"player_id": f"p{i}", "position": rng.choice(["QB", "RB", "WR", "TE", ""]),
+         "trending": rng.choice([None, rng.randint(0, 5)]), "age": rng.randint(21, 35)}
+        for i in range(300)
+    ]
+    bronze_store.append_raw("nfl_sleeper", "players", players)
+    rostered = [f"p{i}" for i in rng.sample(range(300), 60)]
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": rostered}])
+    index = scoring.get_score_index()
+    boosts = scoring.get_league_boosts("L1")
+    expected = sorted(
+        (-(index.scores[i] + boosts.get(index.table.position[i], 0.0)), i)
+        for i in range(len(index.table)) if index.table.player_id[i] not in set(rostered)
+    )[:25]
+    got = get_waiver_recommendations(league_id="L1", limit=25)
+    assert [r["player_id"] for r in got] == [index.table.player_id[i] for _, i in expected]
+    assert [r["score"] for r in got] == [-s for s, _ in expected]
@@ -0,0 +1,81 @@
+"""Phase 3.3: Dictionary-encoded categorical columns — codes + shared dictionary; filters compare codes."""
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.silver import injuries as silver_injuries
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver.columnar import CategoricalColumn
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+def test_categorical_column_round_trip():
+    """Values decode back exactly; dictionary holds each distinct value once, in first-seen order."""
+    values = ["WR", "QB", "WR", "", "QB", "WR"]
+    col = CategoricalColumn(values)
+    assert col.dictionary == ["WR", "QB", ""]
+    assert list(col.codes) == [0, 1, 0, 2, 1, 0]
+    assert col.codes.typecode == "B"
+    assert col.to_list() == values
+    assert col[3] == ""
+    assert col.code_of("QB") == 1
+    assert col.code_of("K") is None
+
+
+def test_categorical_column_widens_codes():
+    """More than 256 distinct values use wider codes."""
+    col = CategoricalColumn([f"v{i}" for i in range(300)])
+    assert col.codes.typecode == "H"
+    assert col[299] == "v299"
+
+
+def test_categorical_positions_compare_codes():
+    """positions() returns matching rows for one or several values; unknown values match nothing."""
+    col = CategoricalColumn(["WR", "QB", "WR", "RB"])
+    assert col.positions(["WR"]) == [0, 2]
+    assert col.positions(["QB", "RB", "K"]) == [1, 3]
+    assert col.positions(["K"]) == []
+
+
+def test_player_table_encodes_low_cardinality_fields():
+    """PlayerTable stores position/team/status/injury_status as categorical columns; rows_where filters them."""
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "position": "WR", "team": "KC"},
+        {"player_id": "p2", "position": "QB", "team": "KC"},
+        {"player_id": "p3", "position": "WR", "team": "BUF"},
+    ])
+    table = silver_players.get_player_table()
+    for key in silver_players.CATEGORICAL_KEYS:
+        assert isinstance(table.column(key), CategoricalColumn)
+    assert table.team.dictionary == ["KC", "BUF"]
+    assert table.rows_where("position", ["WR"]) == [0, 2]
+    assert [table.player_id[i] for i in table.rows_where("team", ["KC"])] == ["p1", "p2"]
+    with pytest.raises(KeyError):
+        table.rows_where("name", ["x"])
+    assert silver_players.get_players()[2]["team"] == "BUF"
+
+
+def test_injuries_from_codes_match_string_rule():
+    """get_injuries (code comparisons) matches the string rule: injury_status or status, excluding empty/Active."""
+    raw = [
+        {"player_id": "p1", "injury_status": "Out", "status": "Active"},
+        {"player_id": "p2", "injury_status": "Active", "status": "Inactive"},
+        {"player_id": "p3", "status": "Inactive", "updated_at": "2024-01-02"},
+        {"player_id": "p4", "status": "Active"},
+        {"player_id": "p5"},
+        {"player_id": "p6", "injury_status": "IR"},
+    ]
+    bronze_store.append_raw("nfl_sleeper", "players", raw)
+    expected = []
+    for p in silver_players.get_player_table():
+        status = p["injury_status"] or p["status"]
+        if status and status != "Active":
+            expected.append({"player_id": p["player_id"], "status": status, "updated_at": p["updated_at"]})
+    assert silver_injuries.get_injuries() == expected
+    assert [r["player_id"] for r in expected] == ["p1", "p3", "p6"]
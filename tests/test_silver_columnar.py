@@ -0,0 +1,101 @@
+"""Phase 3.1: Columnar silver transforms — batch path matches the per-record transforms exactly."""
+
+import pytest
+
+from analytics_foundry.silver import columnar
+from analytics_foundry.silver.league import SILVER_LEAGUE_KEYS, _leagues_columns, _to_silver_league
+from analytics_foundry.silver.players import SILVER_PLAYER_KEYS, _players_columns, _to_silver_player
+from analytics_foundry.silver.rosters import SILVER_ROSTER_KEYS, _rosters_columns, _to_silver_roster
+
+
+def _per_record(raw, transform, key_fn):
+    """Reference path: per-record transform + dict dedup (latest wins)."""
+    by_key = {}
+    for rec in raw:
+        silver = transform(rec)
+        if not silver:
+            continue
+        by_key[key_fn(silver)] = silver
+    return list(by_key.values())
+
+
+PLAYERS_RAW = [
+    {"player_id": "p1", "display_name": "Old", "position": "WR", "age": "25", "trending": "1.5"},
+    {"id": 7, "name": "By Id", "age": 31.9, "trending": 2},
+    {"player_id": None, "display_name": "No Id"},
+    {"player_id": "p2", "age": "x", "trending": "nan?", "injury_status": "Out", "injury_updated": 123},
+    {"player_id": "p1", "display_name": "New", "position": "QB", "team": "KC", "age": True, "trending": None},
+    {"player_id": "", "id": "p3", "status": "Active", "updated_at": "2024-01-01"},
+    {"player_id": 7, "display_name": "Int Id Again", "trending": 0.25},
+]
+
+
+def test_players_batch_matches_per_record():
+    """Batch player transform yields the same rows, order and types as the per-record path."""
+    expected = _per_record(PLAYERS_RAW, _to_silver_player, lambda s: s["player_id"])
+    got = columnar.rows_from_columns(_players_columns(PLAYERS_RAW), SILVER_PLAYER_KEYS)
+    assert got == expected
+    assert [type(r["age"]) for r in got] == [type(r["age"]) for r in expected]
+    assert [list(r) for r in got] == [list(r) for r in expected]
+
+
+def test_players_batch_unique_ids_match_per_record_for_falsy_values():
+    """No missing or duplicate ids (the no-regather path): falsy non-string values conform like str(v or "")."""
+    raw = [
+        {"player_id": "a", "display_name": "", "name": 0, "position": 0, "team": False, "status": 1.5,
+         "updated_at": 0, "injury_updated": 9},
+        {"player_id": 5, "display_name": None, "name": "N", "position": "RB", "injury_status": [], "updated_at": ""},
+        {"player_id": "c", "team": "KC", "age": "22", "trending": 0},
+        {"player_id": "", "id": 0, "name": "Zero id"},
+    ]
+    expected = _per_record(raw, _to_silver_player, lambda s: s["player_id"])
+    assert expected[-1]["player_id"] == "0"
+    assert columnar.rows_from_columns(_players_columns(raw), SILVER_PLAYER_KEYS) == expected
+
+
+def test_rosters_batch_matches_per_record():
+    """Batch roster transform matches per-record path, with and without league filter."""
+    raw = [
+        {"league_id": "L1", "roster_id": 1, "players": ["p1", None, 2]},
+        {"league_id": "L2", "roster_id": "1", "players": None},
+        {"league_id": None, "roster_id": 3},
+        {"league_id": "L1", "roster_id": "1", "players": ["p9"]},
+        {"league_id": "L1", "roster_id": 2},
+    ]
+    key_fn = lambda s: (s["league_id"], str(s["roster_id"]))  # noqa: E731
+    expected = _per_record(raw, _to_silver_roster, key_fn)
+    assert columnar.rows_from_columns(_rosters_columns(raw), SILVER_ROSTER_KEYS) == expected
+    expected_l1 = [r for r in expected if r["league_id"] == "L1"]
+    assert columnar.rows_from_columns(_rosters_columns(raw, "L1"), SILVER_ROSTER_KEYS) == expected_l1
+
+
+def test_leagues_batch_matches_per_record():
+    """Batch league transform matches per-record path."""
+    raw = [
+        {"league_id": "L1", "name": "Old"},
+        {"league_id": "", "name": "Skipped"},
+        {"league_id": 5, "league_name": "Numeric"},
+        {"league_id": "L1", "name": "New"},
+    ]
+    expected = _per_record(raw, _to_silver_league, lambda s: s["league_id"])
+    assert columnar.rows_from_columns(_leagues_columns(raw), SILVER_LEAGUE_KEYS) == expected
+
+
+def test_coerce_columns_return_null_masks():
+    """Column coercion returns coerced values plus a null mask."""
+    ints, int_nulls = columnar.coerce_int_column([1, "2", None, "x", 3.7])
+    assert ints == [1, 2, None, None, 3]
+    assert int_nulls == [False, False, True, True, False]
+    floats, float_nulls = columnar.coerce_float_column([1, "2.5", None, "x", 0.5])
+    assert floats == [1.0, 2.5, None, None, 0.5]
+    assert float_nulls == [False, False, True, True, False]
+
+
+@pytest.mark.parametrize("keys, expected", [
+    ([], []),
+    (["a", "b", "a", "c", "b"], [2, 4, 3]),
+    ([("L1", "1"), ("L1", "1")], [1]),
+])
+def test_last_wins_first_seen_order(keys, expected):
+    """last_wins keeps the latest position per key, in first-seen key order."""
+    assert columnar.last_wins(keys) == expected
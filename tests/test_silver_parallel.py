@@ -0,0 +1,95 @@
+"""Phase 3.5: Parallel silver rebuilds — process-pool chunks merged latest-wins match the serial path."""
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.config import get_silver_workers
+from analytics_foundry.silver import parallel as silver_parallel
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver.players import _players_columns
+from analytics_foundry.silver.rosters import _rosters_columns
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def rebuild_pool():
+    yield
+    silver_parallel.shutdown()
+
+
+def _players_raw(n=200):
+    # Repeated ids across chunk boundaries, a few without ids.
+    return [
+        {"player_id": f"p{i % 37}", "display_name": f"N{i}", "age": str(20 + i % 15), "trending": i / 10}
+        if i % 23 else {"display_name": "no id"}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_players_matches_serial(workers):
+    """Chunked process-pool transform + merge equals the serial batch (rows and order)."""
+    raw = _players_raw()
+    expected = _players_columns(raw)
+    got = silver_parallel.transform_parallel(raw, _players_columns, ("player_id",), workers, min_rows=0)
+    assert got == expected
+
+
+def test_parallel_rosters_matches_serial_with_composite_key():
+    """Composite keys (league_id, roster_id) merge with roster_id compared as string."""
+    raw = [{"league_id": f"L{i % 3}", "roster_id": (i % 4) if i % 2 else str(i % 4), "players": [str(i)]}
+           for i in range(40)]
+    expected = _rosters_columns(raw)
+    got = silver_parallel.transform_parallel(raw, _rosters_columns, ("league_id", "roster_id"), 3, min_rows=0)
+    assert got == expected
+
+
+def test_pool_is_persistent_and_not_forked():
+    """Rebuilds reuse one forkserver/spawn pool; a new worker count replaces it."""
+    raw = _players_raw()
+    silver_parallel.transform_parallel(raw, _players_columns, ("player_id",), 2, min_rows=0)
+    pool = silver_parallel.get_pool(2)
+    silver_parallel.transform_parallel(raw, _players_columns, ("player_id",), 2, min_rows=0)
+    assert silver_parallel.get_pool(2) is pool
+    assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+    silver_parallel.transform_parallel(raw, _players_columns, ("player_id",), 3, min_rows=0)
+    assert silver_parallel.get_pool(3) is not pool
+
+
+def test_small_input_stays_serial(monkeypatch):
+    """Below min_rows (or with one worker) the transform runs in-process."""
+    calls = []
+
+    def spy(raw):
+        calls.append(len(raw))
+        return _players_columns(raw)
+
+    raw = _players_raw(10)
+    silver_parallel.transform_parallel(raw, spy, ("player_id",), 4)
+    silver_parallel.transform_parallel(raw, spy, ("player_id",), 1, min_rows=0)
+    assert calls == [10, 10]
+
+
+def test_get_player_table_uses_configured_workers(monkeypatch):
+    """FOUNDRY_SILVER_WORKERS > 1 rebuilds the player table in parallel with identical output."""
+    bronze_store.append_raw("nfl_sleeper", "players", _players_raw())
+    serial = silver_players.get_players()
+    monkeypatch.setenv("FOUNDRY_SILVER_WORKERS", "2")
+    monkeypatch.setattr(silver_parallel, "PARALLEL_MIN_ROWS", 0)
+    bronze_store.append_raw("nfl_sleeper", "players", [])
+    assert silver_players.get_players() == serial
+
+
+@pytest.mark.parametrize("value, expected", [("3", 3), ("1", 1), ("junk", 1)])
+def test_get_silver_workers_parses_env(monkeypatch, value, expected):
+    """get_silver_workers reads FOUNDRY_SILVER_WORKERS; 0 means all CPUs."""
+    monkeypatch.setenv("FOUNDRY_SILVER_WORKERS", value)
+    assert get_silver_workers() == expected
+    monkeypatch.setenv("FOUNDRY_SILVER_WORKERS", "0")
+    assert get_silver_workers() >= 1
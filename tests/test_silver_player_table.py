@@ -0,0 +1,92 @@
+"""Phase 3.2: Compact silver player table — column storage, row views, cache keyed by bronze version."""
+
+from array import array
+
+import pytest
+
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver.columnar import NullableColumn
+from analytics_foundry.silver.players import SILVER_PLAYER_KEYS, _to_silver_player
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+RAW = [
+    {"player_id": "p1", "display_name": "Alice", "position": "WR", "team": "KC", "age": "25", "trending": "1.5"},
+    {"player_id": "p2", "display_name": "Bob", "position": "QB", "injury_status": "Out", "updated_at": "2024-01-01"},
+    {"player_id": "p1", "display_name": "Alice B", "position": "WR", "team": "BUF", "age": 26},
+]
+
+
+def test_table_rows_match_per_record_transform():
+    """to_dicts() equals per-record transform + dedup; numeric columns are typed arrays."""
+    bronze_store.append_raw("nfl_sleeper", "players", RAW)
+    table = silver_players.get_player_table()
+    expected = {}
+    for rec in RAW:
+        s = _to_silver_player(rec)
+        expected[s["player_id"]] = s
+    assert table.to_dicts() == list(expected.values())
+    assert isinstance(table.age.values, array) and table.age.values.typecode == "q"
+    assert isinstance(table.trending.values, array) and table.trending.values.typecode == "d"
+    assert table.to_dicts([1]) == [expected["p2"]]
+
+
+def test_row_view_behaves_like_silver_dict():
+    """PlayerRow is a read-only mapping over one row with SILVER_PLAYER_KEYS."""
+    bronze_store.append_raw("nfl_sleeper", "players", RAW)
+    table = silver_players.get_player_table()
+    row = table.row(table.index_of("p1"))
+    assert list(row) == list(SILVER_PLAYER_KEYS)
+    assert row["name"] == "Alice B"
+    assert row.get("age") == 26
+    assert row.get("trending") is None
+    assert row.get("missing", "x") == "x"
+    assert dict(row) == silver_players.get_players()[0]
+    assert table.index_of("nope") is None
+    with pytest.raises(KeyError):
+        row["missing"]
+
+
+def test_nullable_column_falls_back_for_inexact_values():
+    """NullableColumn keeps exact values: bools and oversized ints fall back to a list."""
+    col = NullableColumn("q", [1, None, 3], [False, True, False])
+    assert isinstance(col.values, array)
+    assert col.to_list() == [1, None, 3]
+    assert NullableColumn("q", [True, None], [False, True]).to_list() == [True, None]
+    big = 2 ** 70
+    assert NullableColumn("q", [big], [False]).to_list() == [big]
+
+
+def test_player_table_cached_until_bronze_changes():
+    """get_player_table() reuses the table until bronze players change."""
+    bronze_store.append_raw("nfl_sleeper", "players", RAW)
+    first = silver_players.get_player_table()
+    assert silver_players.get_player_table() is first
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1}])
+    assert silver_players.get_player_table() is first
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p3"}])
+    second = silver_players.get_player_table()
+    assert second is not first
+    assert len(second) == 3
+    bronze_store.clear()
+    assert len(silver_players.get_player_table()) == 0
+
+
+def test_gold_available_players_from_columns():
+    """Gold available players read silver columns and keep the API player object shape."""
+    bronze_store.append_raw("nfl_sleeper", "players", RAW)
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p2"]}])
+    result = gold_players.get_available_players(league_id="L1")
+    assert result == [{
+        "id": "p1", "player_id": "p1", "name": "Alice B", "position": "WR",
+        "team": "BUF", "status": "", "age": 26, "trending": None,
+    }]
+    assert len(gold_players.get_available_players()) == 2
@@ -0,0 +1,125 @@
+"""Phase 3.21: Shared read-only data plane — silver snapshots published once, mapped read-only by workers."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import snapshot
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import cache as gold_cache
+from analytics_foundry.gold import league as gold_league
+from analytics_foundry.silver import injuries as silver_injuries
+from analytics_foundry.silver import matchups as silver_matchups
+from analytics_foundry.silver import players as silver_players
+from analytics_foundry.silver import rosters as silver_rosters
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    gold_cache.clear()
+    yield
+    snapshot.detach()
+    gold_cache.clear()
+    bronze_store.clear()
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p2", "display_name": "Zoë", "position": "WR", "team": "KC", "age": 24, "trending": 1.5},
+        {"player_id": "p1", "display_name": "Al", "position": "RB", "injury_status": "Out", "updated_at": 7},
+        {"player_id": "p3", "display_name": "Cy", "position": "WR", "age": True},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "league", [{"league_id": "L1", "name": "One"}])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p1"]},
+        {"league_id": "L2", "roster_id": 1, "players": ["p2", "p3"]},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "matchups", [
+        {"league_id": "L1", "week": 1, "roster_id": 1, "points": 10, "players_points": {"p1": 10}},
+    ])
+
+
+def test_snapshot_round_trips_silver_data(tmp_path):
+    _seed()
+    local = silver_players.get_player_table()
+    snap = snapshot.Snapshot(snapshot.publish(tmp_path))
+    table = snap.player_table()
+    assert table.to_dicts() == local.to_dicts()
+    assert isinstance(table.position.codes, memoryview) and isinstance(table.trending.values, memoryview)
+    assert [table.index_of(pid) for pid in ("p1", "p2", "p3", "p0")] == [1, 0, 2, None]
+    assert table.rows_where("position", ["WR"]) == [0, 2]
+    assert snap.leagues() == [{"league_id": "L1", "name": "One"}]
+    assert snap.rows("rosters", "L2") == silver_rosters.get_rosters("L2")
+    assert snap.rows("matchups") == silver_matchups.get_matchups()
+    assert snap.rows("rosters", "L9") == []
+    assert snap.info()["players"] == 3 and snap.generation == 1
+
+
+def test_worker_serves_snapshot_without_bronze_and_swaps(tmp_path):
+    _seed()
+    snapshot.publish(tmp_path)
+    bronze_store.clear()  # a worker has no bronze of its own
+    assert snapshot.attach(tmp_path)
+    assert not snapshot.attach(tmp_path)
+    assert gold_league.is_fresh("L1")
+    assert [r["player_id"] for r in silver_injuries.get_injuries()] == ["p1"]
+    client = TestClient(app)
+    ids = [p["id"] for p in client.get("/players/available", params={"league_id": "L1"}).json()]
+    assert ids == ["p2", "p3"]
+    before = silver_players.get_player_table()
+
+    # The writer publishes a new generation; the worker swaps to it and old views stay readable.
+    snapshot.detach()
+    _seed()
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p2"]}])
+    snapshot.publish(tmp_path)
+    bronze_store.clear()
+    assert snapshot.attach(tmp_path)
+    assert snapshot.current().generation == 2
+    ids = [p["id"] for p in client.get("/players/available", params={"league_id": "L1"}).json()]
+    assert ids == ["p1", "p3"]
+    assert before.name[0] == "Zoë"
+    assert client.get("/admin/snapshot").json()["generation"] == 2
+
+
+def test_worker_rejects_ingest(tmp_path):
+    snapshot.attach(tmp_path)
+    assert silver_players.get_player_table().to_dicts() == []
+    client = TestClient(app)
+    with patch("analytics_foundry.gold.league.get_adapter", side_effect=AssertionError("ingest")):
+        assert client.get("/players/available", params={"league_id": "L1"}).json() == []
+    assert client.post("/admin/ingest/league", json={"league_id": "L1"}).status_code == 409
+    assert client.post("/admin/ingest/broad").status_code == 409
+
+
+def test_publish_if_changed_and_prune(tmp_path):
+    _seed()
+    first = snapshot.publish_if_changed(tmp_path)
+    assert first is not None
+    assert snapshot.publish_if_changed(tmp_path) is None
+    for i in range(4):
+        bronze_store.append_raw("nfl_sleeper", "league", [{"league_id": f"X{i}", "name": "x"}])
+        latest = snapshot.publish_if_changed(tmp_path)
+    assert latest.name == "snapshot-000000000005.bin"
+    assert (tmp_path / snapshot.POINTER).read_text() == latest.name
+    assert len(list(tmp_path.glob("snapshot-*.bin"))) == snapshot.KEEP + 1
+    assert not first.exists()
+
+
+def test_bronze_clear_unpublishes_snapshots():
+    """Clearing bronze on the writer removes every snapshot published under the data dir, and CURRENT."""
+    _seed()
+    directory = snapshot.snapshot_dir()
+    first = snapshot.publish()
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p9"}])
+    second = snapshot.publish()
+    assert first.is_file() and second.is_file()
+    bronze_store.clear()
+    assert not first.exists() and not second.exists()
+    assert not (directory / snapshot.POINTER).exists()
+    # Nothing counts as published any more: the next publish starts over.
+    assert snapshot.publish_if_changed() is not None
+    snapshot.unpublish()
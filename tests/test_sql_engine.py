@@ -0,0 +1,137 @@
+"""Phase 3.16: SQL execution engine — sql/ artifacts run in SQLite as the silver/gold build."""
+
+from unittest.mock import patch
+
+import pytest
+
+from analytics_foundry import dag, sql_engine, sql_loader
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.gold import recommendations
+from analytics_foundry.silver import players as silver_players
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def engine():
+    """A fresh SQLite engine used as the process engine."""
+    eng = sql_engine.SqliteEngine()
+    with patch.object(sql_engine, "_ENGINE", eng):
+        yield eng
+    eng.close()
+
+
+def _use(monkeypatch, backend):
+    monkeypatch.setenv("FOUNDRY_SQL_ENGINE", backend)
+    dag.invalidate("silver.players")
+
+
+def _seed():
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": "p1", "display_name": "A", "position": "WR", "team": "KC", "age": 25, "trending": 1.5},
+        {"player_id": "p2", "name": "B", "position": "QB", "age": "31", "trending": "x"},
+        {"id": "p3", "display_name": "", "name": "C", "age": 27.9, "injury_status": "Out", "injury_updated": 100},
+        {"player_id": None, "display_name": "no id"},
+        {"player_id": "p1", "display_name": "A2", "position": "WR", "team": "BUF", "status": "Active"},
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [
+        {"league_id": "L1", "roster_id": 1, "players": ["p1", None]},
+        {"league_id": "L2", "roster_id": 1, "players": ["p2", "p3"]},
+    ])
+
+
+def test_sqlite_silver_players_match_python(monkeypatch, engine):
+    """silver/players.sql produces the same table as the columnar transform (dedup, fallbacks, coercion)."""
+    _seed()
+    _use(monkeypatch, "python")
+    expected = silver_players.get_players()
+    _use(monkeypatch, "sqlite")
+    assert silver_players.get_players() == expected
+    assert [p["player_id"] for p in expected] == ["p1", "p2", "p3"]
+
+
+def test_sqlite_silver_players_match_python_for_falsy_values(monkeypatch, engine):
+    """Falsy non-string values (0, False, "") fall through `or` fallbacks in SQL exactly as in Python."""
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": 0, "id": "q1", "display_name": 0, "name": "Zero", "position": 0, "team": False,
+         "status": "", "injury_status": 0, "updated_at": 0, "injury_updated": 5},
+        {"player_id": "", "id": 0, "display_name": False, "name": 0, "position": "0", "updated_at": ""},
+        {"player_id": False, "id": "q3", "updated_at": 0},
+        {"player_id": "q4", "updated_at": 7, "injury_updated": 9},
+    ])
+    _use(monkeypatch, "python")
+    expected = silver_players.get_players()
+    _use(monkeypatch, "sqlite")
+    assert silver_players.get_players() == expected
+    assert [(p["player_id"], p["name"], p["position"], p["updated_at"]) for p in expected] == [
+        ("q1", "Zero", "", 5), ("0", "", "0", None), ("q3", "", "", None), ("q4", "", "", 7),
+    ]
+
+
+def test_sqlite_available_players_anti_join(monkeypatch, engine):
+    """gold/available_players.sql binds :league_id; roster replacements use the latest record."""
+    _seed()
+    _use(monkeypatch, "sqlite")
+    assert [p["id"] for p in gold_players.get_available_players("L1")] == ["p2", "p3"]
+    assert [p["id"] for p in gold_players.get_available_players("L2")] == ["p1"]
+    assert [p["id"] for p in gold_players.get_available_players()] == ["p1", "p2", "p3"]
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L2", "roster_id": 1, "players": ["p3"]}])
+    sqlite_rows = gold_players.get_available_players("L2")
+    _use(monkeypatch, "python")
+    assert sqlite_rows == gold_players.get_available_players("L2")
+
+
+def test_sqlite_availability_serves_queries_and_recommendations(monkeypatch, engine):
+    """With sqlite, the rostered bitmaps behind paged queries and recommendations come from the anti-join."""
+    _seed()
+    _use(monkeypatch, "python")
+    expected = gold_players.query_available_players_many(["L1", "L2"], sort="-age")
+    expected_recs = recommendations.get_waiver_recommendations("L1")
+    _use(monkeypatch, "sqlite")
+    with patch.object(engine, "query_columns", wraps=engine.query_columns) as sql:
+        assert gold_players.query_available_players_many(["L1", "L2"], sort="-age") == expected
+        assert recommendations.get_waiver_recommendations("L1") == expected_recs
+    leagues = [call.args[2]["league_id"] for call in sql.call_args_list if call.args[:2] == ("gold", "available_players")]
+    assert sorted(leagues) == ["L1", "L2"]
+
+
+def test_bronze_synced_incrementally(engine):
+    """Appends read and insert only new records; a bronze clear reloads the table."""
+    _seed()
+    assert len(engine.query("silver", "players")) == 3
+    changes = engine._conn.total_changes
+    engine.query("silver", "players")
+    assert engine._conn.total_changes == changes
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p9"}])
+    with patch.object(bronze_store, "get_raw", side_effect=AssertionError("copied the table")), \
+            patch.object(bronze_store, "get_range", wraps=bronze_store.get_range) as read:
+        cols, rows = engine.execute("bronze", "nfl_sleeper_players")
+        engine.execute("bronze", "nfl_sleeper_players")
+    assert [call.args for call in read.call_args_list] == [("nfl_sleeper", "players", 5, 6)]
+    assert [r[cols.index("seq")] for r in rows] == [0, 1, 2, 3, 4, 5]
+    bronze_store.clear()
+    bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "q1"}])
+    assert [p["player_id"] for p in engine.query("silver", "players")] == ["q1"]
+
+
+def test_artifacts_read_once(engine):
+    """Artifact text is read once (until the file changes); statements are reused across calls and parameters."""
+    _seed()
+    sql_loader._COMPILED.clear()
+    with patch.object(sql_loader, "read_sql", wraps=sql_loader.read_sql) as read:
+        for lid in ("L1", "L2", "L1"):
+            engine.query("gold", "available_players", {"league_id": lid})
+    assert sorted(call.args for call in read.call_args_list) == [
+        ("gold", "available_players"), ("silver", "players"), ("silver", "roster_players"),
+    ]
+
+
+def test_referenced_tables():
+    sql = "SELECT * FROM silver_players p JOIN silver_roster_players r ON r.player_id = p.player_id"
+    assert sql_engine.referenced_tables(sql) == ["silver_players", "silver_roster_players"]
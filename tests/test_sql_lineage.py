@@ -0,0 +1,115 @@
+"""Phase 3.18: SQL lineage — artifact inputs/outputs, targeted refresh in topological order, mtime cache."""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry import sql_engine, sql_loader
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def sql_root(tmp_path, monkeypatch):
+    """An empty sql/ tree used as the artifact root."""
+    for layer in sql_loader.medallion_layers():
+        (tmp_path / layer).mkdir()
+    monkeypatch.setattr(sql_loader, "_SQL_ROOT", tmp_path)
+    return tmp_path
+
+
+def _write(root, layer, name, sql, mtime=None):
+    path = root / layer / f"{name}.sql"
+    path.write_text(sql, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_repo_lineage():
+    """Inputs come from FROM/JOIN (CTE names excluded); outputs are <layer>_<name>."""
+    arts = {(a.layer, a.name): a for a in sql_loader.list_artifacts()}
+    assert arts[("silver", "players")].inputs == ["bronze_nfl_sleeper_players"]
+    gold = arts[("gold", "available_players")]
+    assert gold.inputs == ["silver_players", "silver_roster_players"]
+    assert gold.output == "gold_available_players"
+    assert gold.params == ["league_id"]
+    graph = sql_loader.lineage()
+    assert {"from": "silver_roster_players", "to": "gold_available_players"} in graph["edges"]
+    assert graph["levels"][-1] == ["gold/available_players"]
+    assert sql_loader.downstream(["bronze_nfl_sleeper_rosters"]) == [
+        ("silver", "roster_players"), ("gold", "available_players"),
+    ]
+
+
+def test_levels_group_independent_artifacts(sql_root):
+    _write(sql_root, "silver", "a", "SELECT * FROM bronze_x")
+    _write(sql_root, "silver", "b", "WITH t AS (SELECT * FROM silver_a) SELECT * FROM t JOIN silver_c c ON 1")
+    _write(sql_root, "silver", "c", "SELECT * FROM bronze_x -- FROM silver_b")
+    _write(sql_root, "gold", "g", "SELECT * FROM silver_b WHERE id = :id")
+    assert sql_loader.topological_levels([a.key for a in sql_loader.list_artifacts()]) == [
+        [("silver", "a"), ("silver", "c")], [("silver", "b")], [("gold", "g")],
+    ]
+    assert sql_loader.downstream(["silver_c"]) == [("silver", "b"), ("gold", "g")]
+    _write(sql_root, "silver", "a", "SELECT * FROM silver_b")
+    with pytest.raises(ValueError):
+        sql_loader.lineage()
+
+
+def test_compiled_artifacts_invalidated_by_mtime(sql_root):
+    _write(sql_root, "silver", "a", "SELECT * FROM bronze_x", mtime=10**18)
+    first = sql_loader.load_artifact("silver", "a")
+    assert sql_loader.load_artifact("silver", "a") is first
+    _write(sql_root, "silver", "a", "SELECT * FROM bronze_y", mtime=10**18 + 10**9)
+    assert sql_loader.load_artifact("silver", "a").inputs == ["bronze_y"]
+
+
+def test_refresh_reruns_only_downstream_artifacts():
+    engine = sql_engine.SqliteEngine()
+    try:
+        bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1"}, {"player_id": "p2"}])
+        bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p1"]}])
+        assert engine.refresh() == [["silver_players", "silver_roster_players"]]
+        assert engine.refresh() == []
+        bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p2"]}])
+        assert engine.refresh() == [["silver_roster_players"]]
+        assert [p["id"] for p in engine.query("gold", "available_players", {"league_id": "L1"})] == ["p1"]
+        # Queries re-run stale upstream artifacts themselves; an explicit refresh then has nothing to do.
+        bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p3"}])
+        assert len(engine.query("gold", "available_players", {"league_id": "L1"})) == 2
+        assert engine.refresh(["bronze_nfl_sleeper_players"]) == []
+    finally:
+        engine.close()
+
+
+def test_serving_engine_refreshes_on_bronze_write(monkeypatch):
+    """While sqlite is selected, the process engine re-runs only the downstream artifacts as bronze changes."""
+    engine = sql_engine.SqliteEngine()
+    monkeypatch.setenv("FOUNDRY_SQL_ENGINE", "sqlite")
+    try:
+        with patch.object(sql_engine, "_ENGINE", engine):
+            bronze_store.append_raw("nfl_sleeper", "players", [{"player_id": "p1"}])
+            assert engine._generation == {"silver_players": 1}
+            bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p1"]}])
+            assert engine._generation == {"silver_players": 1, "silver_roster_players": 1}
+            assert engine._changed == set()
+            assert engine.query("gold", "available_players", {"league_id": "L1"}) == []
+    finally:
+        engine.close()
+
+
+def test_admin_transformations_include_lineage():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        data = TestClient(app).get("/admin/transformations").json()
+    assert "players" in data["silver"]
+    names = {(a["layer"], a["name"]) for a in data["lineage"]["artifacts"]}
+    assert ("gold", "available_players") in names
+    assert {"from": "bronze_nfl_sleeper_players", "to": "silver_players"} in data["lineage"]["edges"]
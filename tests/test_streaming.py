@@ -0,0 +1,83 @@
+"""Phase 3.12: Streaming NDJSON responses for gold players and admin table samples."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics_foundry.api import app
+from analytics_foundry.bronze import store as bronze_store
+from analytics_foundry.gold import players as gold_players
+from analytics_foundry.streaming import ndjson_chunks
+
+
+@pytest.fixture(autouse=True)
+def clear_bronze():
+    bronze_store.clear()
+    yield
+    bronze_store.clear()
+
+
+@pytest.fixture
+def client():
+    with patch("analytics_foundry.gold.league.aensure_league_ingested", AsyncMock()):
+        yield TestClient(app)
+
+
+def _seed(n=300):
+    bronze_store.append_raw("nfl_sleeper", "players", [
+        {"player_id": f"p{i}", "display_name": f"Ñame {i}", "position": "WR" if i % 2 else "RB"} for i in range(n)
+    ])
+    bronze_store.append_raw("nfl_sleeper", "rosters", [{"league_id": "L1", "roster_id": 1, "players": ["p0", "p1"]}])
+
+
+def _lines(resp):
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_ndjson_chunks_batches_rows():
+    """Rows are encoded one per line, a batch of rows per chunk."""
+    chunks = list(ndjson_chunks(({"i": i} for i in range(5)), batch_rows=2))
+    assert len(chunks) == 3
+    assert b"".join(chunks) == b"".join(b'{"i":%d}\n' % i for i in range(5))
+
+
+def test_iter_available_players_is_lazy_and_matches_list():
+    """iter_available_players yields the same objects as the list path, validating options up front."""
+    _seed()
+    it = gold_players.iter_available_players("L1", position=["WR"], fields=["id", "name"])
+    first = next(it)
+    assert first == {"id": "p3", "name": "Ñame 3"}
+    page, _ = gold_players.query_available_players("L1", position=["WR"], fields=["id", "name"])
+    assert [first] + list(it) == page
+    with pytest.raises(ValueError):
+        gold_players.iter_available_players(sort="height")
+
+
+def test_players_available_ndjson(client):
+    """format=ndjson or Accept: application/x-ndjson streams one player per line."""
+    _seed()
+    expected = client.get("/players/available", params={"league_id": "L1"}).json()
+    resp = client.get("/players/available", params={"league_id": "L1", "format": "ndjson"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert _lines(resp) == expected
+    by_accept = client.get("/players/available", params={"league_id": "L1", "limit": 5},
+                           headers={"Accept": "application/x-ndjson"})
+    assert _lines(by_accept) == expected[:5]
+    assert client.get("/players/available", params={"format": "ndjson", "sort": "x"}).status_code == 400
+
+
+def test_admin_samples_ndjson(client):
+    """Admin samples stream all rows as NDJSON (limit optional); JSON samples keep their shape."""
+    _seed()
+    silver = client.get("/admin/tables/silver/players", params={"format": "ndjson"})
+    assert len(_lines(silver)) == 300
+    gold = client.get("/admin/tables/gold/available_players", params={"format": "ndjson", "limit": 10})
+    assert [r["id"] for r in _lines(gold)] == [f"p{i}" for i in range(10)]
+    bronze = client.get("/admin/tables/bronze/nfl_sleeper/rosters", params={"format": "ndjson"})
+    assert _lines(bronze) == [{"league_id": "L1", "roster_id": 1, "players": ["p0", "p1"]}]
+    sample = client.get("/admin/tables/silver/players").json()
+    assert sample["limit"] == 100 and len(sample["rows"]) == 100
+    assert client.get("/admin/tables/silver/nope", params={"format": "ndjson"}).status_code == 404